@@ -1,91 +1,489 @@
 # -*- coding: utf-8 -*-
-import os, sys, webview, json
-from ast import literal_eval
-from typing import Dict, List, Any, Type
+import os, sys, webview, json, time, weakref, threading
+from contextlib import contextmanager
+from typing import Dict, List, Any, Type, Iterator
 from .widgets._base import Layout, Widget, Body
+from .transport import Transport, WebviewTransport, HeadlessTransport
+from .stats import BridgeStats
+from .shell import build_shell
 from . import __path__, _shared
 
 
+class _BatchState(threading.local):
+    """
+    state of transaction, deferred mount and capture per thread
+    """
+    def __init__(self):
+        self.transaction_depth = 0
+        self.transaction_per_frame = False
+        self.transaction_flushed_at = 0.0
+        self.transaction_calls:List[str] = []
+
+        self.mount_depth = 0
+        self.mount_widgets:List[str] = []
+        self.mount_calls:List[str] = []
+        # ids of widgets created while capturing(None: not capturing)
+        self.capture_ids:List[str] = None
+
+
 class ApplicationAPI:
     app_window:webview.Window = None
+    transport:Transport = None
+    frame_interval:float = 1 / 60
+    # seconds to wait for previous event batch, missing batch is skipped after it
+    event_order_timeout:float = 1
+    fire_and_forget:bool = False
+    collect_stats:bool = False
 
     def __init__(self):
-        self.widgets:Dict[str, Widget] = {}
-
-    def __convert_object_to_js(self, object:Any) -> str:
-        if isinstance(object, dict):
-            return json.dumps(object)
-        elif isinstance(object, bool):
-            return "true" if object else "false"
+        # widgets are kept by their parents(and user), registry does not keep deleted or dropped widgets alive
+        self.widgets:Dict[str, Widget] = weakref.WeakValueDictionary()
+        # widgets without parent(attached to app container) are kept until deleted
+        self.__root_widgets:Dict[str, Widget] = {}
+        self.bridge_stats = BridgeStats()
+
+        # transaction, deferred mount and capture belong to thread which opened them,
+        # writes of other threads(workers, streams) are sent as usual
+        self.__batch = _BatchState()
+        self.__templates = set()
+
+        self.__outbound_condition = threading.Condition()
+        self.__outbound_calls:List[str] = []
+        self.__outbound_sending = False
+        self.__outbound_error:str = None
+        self.__outbound_thread:threading.Thread = None
+
+        # pywebview calls api on new thread per call, event batches are applied one by one in order of sequence
+        self.__event_condition = threading.Condition(threading.RLock())
+        self.__event_sequence = 0
+        # increased on every event batch, shadow of user_attributes(value, checked, ...) cached before it is not used
+        self.user_change_version = 0
+
+    def __encode_message(self, method:str, args:List[Any]) -> str:
+        # message is [ handler name, arguments ], values not serializable as json are sent as str
+        message = json.dumps([ method, args ], default = str, separators = ( ",", ":" ))
+        if self.collect_stats:
+            self.bridge_stats.record_message(method, args, len(message))
+
+        return message
+
+    def __decode_event_arg(self, arg:Any) -> Any:
+        if isinstance(arg, dict) and "$widget" in arg.keys():
+            return self.widgets.get(arg["$widget"])
         else:
-            return "`" + str(object) + "`"
-        
-    def __revert_js_to_object(self, js_value:Any) -> Any:
-        if isinstance(js_value, str):
-            if js_value.startswith("{") and js_value.endswith("}"):
-                return json.loads(js_value)
-            elif js_value.startswith("[") and js_value.endswith("]"):
-                return literal_eval(js_value)
-            elif js_value in ( "true", "false" ):
-                return js_value == "true"
-            else:
-                try:
-                    return eval(js_value)
-                except ( NameError, ValueError, SyntaxError ):
-                    return js_value
+            return arg
+
+    def __dispatch(self, messages:List[str]) -> Any:
+        if self.collect_stats:
+            started_at = time.perf_counter()
+            res = self.transport.dispatch(messages)
+            self.bridge_stats.record_dispatch(
+                [ message[2:message.index('"', 2)] for message in messages ],
+                sum([ len(message) for message in messages ]) + len(messages) + 1,
+                started_at, time.perf_counter() - started_at
+            )
         else:
-            return js_value
-
-    def create_widget(self, tag_name:str, widget_class_list:List[str], widget:Widget, attributes:dict, parent:Layout = None, auto_attach:bool = False):
-        parent_id = "hufpy-app-container" if parent is None else parent.id
+            res = self.transport.dispatch(messages)
 
-        res = self.app_window.evaluate_js(f"""
-window.hufpy.createWidget("{tag_name}", "{" ".join(widget_class_list)}", "{widget.widget_type.lower()}", "{widget.id}", {self.__convert_object_to_js(attributes)}, "{parent_id}", {self.__convert_object_to_js(auto_attach)});
-""")
         if res["state"] == "fail":
             raise RuntimeError(res["message"])
 
+        return res["value"]
+
+    @property
+    def in_transaction(self) -> bool:
+        """
+        flag of transaction is opened or not
+        """
+        return self.__batch.transaction_depth > 0
+
+    @contextmanager
+    def transaction(self, per_frame:bool = False) -> Iterator["ApplicationAPI"]:
+        """
+        queue bridge calls and send them to webview as one payload
+
+        calls are flushed when outermost transaction is closed,
+        or before any call that needs result from webview
+        transaction belongs to current thread, calls of other threads are not queued
+
+        Parameters
+        ----------
+        per_frame: bool, default False
+            flag to flush queued calls while transaction is opened,
+            when call is queued after frame_interval from last flush(no timer, last calls of burst
+            are kept until next call, flush or end of transaction, call flush() if they should be shown)
+        """
+        if self.__batch.transaction_depth == 0:
+            self.__batch.transaction_per_frame = per_frame
+            self.__batch.transaction_flushed_at = time.perf_counter()
+        self.__batch.transaction_depth += 1
+
+        try:
+            yield self
+        finally:
+            self.__batch.transaction_depth -= 1
+            if self.__batch.transaction_depth == 0:
+                self.flush()
+
+    @contextmanager
+    def deferred_mount(self) -> Iterator["ApplicationAPI"]:
+        """
+        record widgets created in context and mount them to webview at once
+
+        widgets and their calls are built as one tree(DocumentFragment) in webview
+        and inserted to parent with single DOM operation when outermost context is closed
+        if any call needs result from webview, recorded widgets are mounted before it
+        """
+        self.__batch.mount_depth += 1
+
+        try:
+            yield self
+        finally:
+            self.__batch.mount_depth -= 1
+            if self.__batch.mount_depth == 0:
+                self.__flush_mount()
+
+    @contextmanager
+    def capture(self) -> Iterator[Dict[str, List[str]]]:
+        """
+        record widgets created and calls in context without sending them to webview
+
+        recorded content is { "widget_ids": ids of created widgets in order, "widgets": encoded createWidget arguments, "calls": encoded messages }
+        and can be sent with mount_captured, or as template with register_template/stamp_template
+        reads from webview are not allowed in context
+        """
+        record = { "widget_ids": [], "widgets": [], "calls": [] }
+        stash = ( self.__batch.mount_depth, self.__batch.mount_widgets, self.__batch.mount_calls, self.__batch.capture_ids )
+        self.__batch.mount_depth, self.__batch.mount_widgets, self.__batch.mount_calls, self.__batch.capture_ids = 1, record["widgets"], record["calls"], record["widget_ids"]
+
+        try:
+            yield record
+        finally:
+            self.__batch.mount_depth, self.__batch.mount_widgets, self.__batch.mount_calls, self.__batch.capture_ids = stash
+
+    def mount_captured(self, record:Dict[str, List[str]]):
+        """
+        mount widgets and calls recorded by capture
+
+        Parameters
+        ----------
+        record: Dict[str, List[str]], required
+            content recorded by capture
+        """
+        if self.__batch.mount_depth > 0:
+            self.__batch.mount_widgets.extend(record["widgets"])
+            self.__batch.mount_calls.extend(record["calls"])
+            return
+
+        if len(record["widgets"]) > 0 or len(record["calls"]) > 0:
+            self.__queue('["mountTree",[[' + ",".join(record["widgets"]) + '],[' + ",".join(record["calls"]) + ']]]')
+
+    def has_template(self, template_id:str) -> bool:
+        """
+        check template is registered to webview
+
+        Parameters
+        ----------
+        template_id: str, required
+            id of template
+        """
+        return template_id in self.__templates
+
+    def register_template(self, template_id:str, widgets:List[str], calls:List[str]):
+        """
+        register template to webview, template is built once and cloned by stamp_template
+
+        Parameters
+        ----------
+        template_id: str, required
+            id of template
+        widgets: List[str], required
+            encoded createWidget arguments, ids of widgets are placeholders($0$, $1$, ...) and parent is $parent$
+        calls: List[str], required
+            encoded messages with same placeholders
+        """
+        message = '["registerTemplate",[' + json.dumps(template_id) + ',[' + ",".join(widgets) + '],[' + ",".join(calls) + ']]]'
+        if self.collect_stats:
+            self.bridge_stats.record_message("registerTemplate", [ template_id ], len(message))
+
+        self.__templates.add(template_id)
+        self.__route(message)
+
+    def stamp_template(self, template_id:str, widget_ids:List[str], parent_id:str):
+        """
+        clone registered template to parent
+
+        Parameters
+        ----------
+        template_id: str, required
+            id of template
+        widget_ids: List[str], required
+            ids of widgets to replace placeholders in order
+        parent_id: str, required
+            id of parent to replace $parent$
+        """
+        self.__call("stampTemplate", template_id, widget_ids, parent_id)
+
+    def flush(self):
+        """
+        send recorded widgets of deferred mount and queued calls of transaction to webview
+        """
+        self.__flush_mount()
+        self.__flush_transaction()
+
+    def __flush_mount(self):
+        if self.__batch.capture_ids is not None:
+            # captured content is sent by owner of capture
+            return
+
+        widgets, self.__batch.mount_widgets = self.__batch.mount_widgets, []
+        calls, self.__batch.mount_calls = self.__batch.mount_calls, []
+
+        if len(widgets) > 0 or len(calls) > 0:
+            self.__queue('["mountTree",[[' + ",".join(widgets) + '],[' + ",".join(calls) + ']]]')
+
+    def __flush_transaction(self):
+        calls, self.__batch.transaction_calls = self.__batch.transaction_calls, []
+        self.__batch.transaction_flushed_at = time.perf_counter()
+
+        if len(calls) > 0:
+            self.__send(calls)
+
+    def drain(self):
+        """
+        wait until queued writes of fire and forget mode are sent to webview
+
+        if any queued write failed, raise RuntimeError with its message
+        """
+        with self.__outbound_condition:
+            while len(self.__outbound_calls) > 0 or self.__outbound_sending:
+                self.__outbound_condition.wait()
+
+            error, self.__outbound_error = self.__outbound_error, None
+
+        if error is not None:
+            raise RuntimeError(error)
+
+    def __send(self, calls:List[str]):
+        if self.fire_and_forget:
+            with self.__outbound_condition:
+                self.__outbound_calls.extend(calls)
+                if self.__outbound_thread is None:
+                    self.__outbound_thread = threading.Thread(target = self.__write_outbound, daemon = True)
+                    self.__outbound_thread.start()
+
+                self.__outbound_condition.notify_all()
+        else:
+            self.__dispatch(calls)
+
+    def __write_outbound(self):
+        while True:
+            with self.__outbound_condition:
+                while len(self.__outbound_calls) == 0:
+                    self.__outbound_condition.wait()
+
+                # everything queued while previous batch was sent goes in one payload
+                calls, self.__outbound_calls = self.__outbound_calls, []
+                self.__outbound_sending = True
+
+            try:
+                self.__dispatch(calls)
+                error = None
+            except Exception as e:
+                error = str(e)
+
+            with self.__outbound_condition:
+                self.__outbound_sending = False
+                if error is not None and self.__outbound_error is None:
+                    self.__outbound_error = error
+
+                self.__outbound_condition.notify_all()
+
+    def __queue(self, message:str) -> Any:
+        if self.__batch.transaction_depth > 0:
+            self.__batch.transaction_calls.append(message)
+            if self.__batch.transaction_per_frame and time.perf_counter() - self.__batch.transaction_flushed_at >= self.frame_interval:
+                self.__flush_transaction()
+
+            return None
+
+        if self.fire_and_forget:
+            self.__send([ message ])
+            return None
+
+        return self.__dispatch([ message ])
+
+    def __call(self, method:str, *args:Any) -> Any:
+        return self.__route(self.__encode_message(method, list(args)))
+
+    def __route(self, message:str) -> Any:
+        if self.__batch.mount_depth > 0:
+            self.__batch.mount_calls.append(message)
+            return None
+
+        return self.__queue(message)
+
+    def __read(self, method:str, *args:Any) -> Any:
+        if self.__batch.capture_ids is not None:
+            raise RuntimeError("cannot read from webview while capturing widgets")
+
+        self.flush()
+        self.drain()
+        return self.__dispatch([ self.__encode_message(method, list(args)) ])
+
+    def create_widget(self, tag_name:str, widget_class_list:List[str], widget:Widget, attributes:dict, parent:Layout = None, auto_attach:bool = False):
+        parent_id = "hufpy-app-container" if parent is None else parent.id
+
+        if self.__batch.mount_depth > 0:
+            spec_args = [ tag_name, " ".join(widget_class_list), widget.widget_type.lower(), widget.id, attributes, parent_id, auto_attach ]
+            spec = json.dumps(spec_args, default = str, separators = ( ",", ":" ))
+            if self.collect_stats:
+                self.bridge_stats.record_message("createWidget", spec_args, len(spec))
+            self.__batch.mount_widgets.append(spec)
+            if self.__batch.capture_ids is not None:
+                self.__batch.capture_ids.append(widget.id)
+        else:
+            self.__call("createWidget", tag_name, " ".join(widget_class_list), widget.widget_type.lower(), widget.id, attributes, parent_id, auto_attach)
         self.widgets[widget.id] = widget
-                                                                 
+        if parent is None:
+            self.__root_widgets[widget.id] = widget
+
     def remove_widget(self, widget:Widget):
-        self.app_window.evaluate_js(f'window.hufpy.removeWidget("{widget.id}");')
-        self.widgets.pop(widget.id, None)
+        # children of layouts are removed together(their elements go with element of widget)
+        descendant_ids = []
+        pending = [ widget ]
+        while len(pending) > 0:
+            current = pending.pop()
+            if isinstance(current, Layout):
+                descendant_ids.extend([ child.id for child in current.children ])
+                pending.extend(current.children)
+
+        self.__call("removeWidget", widget.id, descendant_ids)
+        for widget_id in [ widget.id ] + descendant_ids:
+            self.widgets.pop(widget_id, None)
+            self.__root_widgets.pop(widget_id, None)
+
+    def rename_widget(self, widget:Widget, old_id:str):
+        # element of webview is renamed by setWidgetAttribute("id")
+        self.widgets.pop(old_id, None)
+        self.widgets[widget.id] = widget
+        if self.__root_widgets.pop(old_id, None) is not None:
+            self.__root_widgets[widget.id] = widget
 
 
     # def get_widget_children(self, widget_id:str) -> List[str]:
     #     return self.app_window.evaluate_js(f'window.hufpy.getWidgetChildren("{widget_id}");')
 
     def get_widget_attribute(self, widget_id:str, attribute_name:str) -> Any:
-        return self.__revert_js_to_object(self.app_window.evaluate_js(f'window.hufpy.getWidgetAttribute("{widget_id}", "{attribute_name}");'))
+        return self.__read("getWidgetAttribute", widget_id, attribute_name)
     
     def set_widget_attribute(self, widget_id:str, attribute_name:str, attribute_value:Any):
-        self.app_window.evaluate_js(f'window.hufpy.setWidgetAttribute("{widget_id}", "{attribute_name}", {self.__convert_object_to_js(attribute_value)});')
+        self.__call("setWidgetAttribute", widget_id, attribute_name, attribute_value)
     
+    def update_widget_style(self, widget_id:str, properties:Dict[str, Any], remove_names:List[str] = []):
+        self.__call("updateWidgetStyle", widget_id, properties, remove_names)
+
     def remove_widget_attribute(self, widget_id:str, attribute_name:str):
-        self.app_window.evaluate_js(f'window.hufpy.removeWidgetAttribute("{widget_id}", "{attribute_name}");')
+        self.__call("removeWidgetAttribute", widget_id, attribute_name)
 
     def widget_attribute_exists(self, widget_id:str, attribute_name:str) -> bool:
-        return self.app_window.evaluate_js(f'window.hufpy.widgetAttributeExists("{widget_id}", "{attribute_name}");')
+        return self.__read("widgetAttributeExists", widget_id, attribute_name)
 
     def set_widget_visible(self, widget_id:str, parent_id:str, visible:bool, widget_idx:int = None):
-        widget_idx = '"null"' if widget_idx is None else widget_idx
-        self.app_window.evaluate_js(f'window.hufpy.setWidgetVisible("{widget_id}", "{parent_id}", {"true" if visible else "false"}, {widget_idx});')
+        self.__call("setWidgetVisible", widget_id, parent_id, visible, widget_idx)
+
+    def attach_widget(self, widget_id:str, parent_id:str, widget_idx:int = None):
+        self.__call("attachWidget", widget_id, parent_id, widget_idx)
+
+    def detach_widget(self, widget_id:str, parent_id:str):
+        self.__call("detachWidget", widget_id, parent_id)
+
+    def add_widget_class(self, widget_id:str, class_name:str):
+        self.__call("addWidgetClass", widget_id, class_name)
+
+    def remove_widget_class(self, widget_id:str, class_name:str):
+        self.__call("removeWidgetClass", widget_id, class_name)
+
+    def set_modal_background_visible(self, container_id:str, visible:bool):
+        self.__call("setModalBackgroundVisible", container_id, visible)
+
+
+    def set_table_columns(self, widget_id:str, columns:List[str]):
+        self.__call("setTableColumns", widget_id, columns)
+
+    def set_table_rows(self, widget_id:str, offset:int, total_height:int, row_height:int, rows:List[List[str]]):
+        self.__call("setTableRows", widget_id, offset, total_height, row_height, rows)
 
+    def set_table_data(self, header_id:str, body_id:str, columns:List[str], data:List[List[Any]]):
+        self.__call("setTableData", header_id, body_id, columns, data)
 
-    def bind_widget_event(self, widget_id:str, event_name:str, bind_name:str, call_args:List[str] = [], call_widget_id:str = None):
-        call_widget_id = "null" if call_widget_id is None else f'"{call_widget_id}"'
-        self.app_window.evaluate_js(f'window.hufpy.bindWidgetEvent("{widget_id}", "{event_name}", "{bind_name}", {call_args}, {call_widget_id});')
+    def patch_table_data(self, body_id:str, removed:List[int], inserted:List[list], changed:List[list]):
+        self.__call("patchTableData", body_id, removed, inserted, changed)
 
-    def call_python_widget_event(self, widget_id:str, event_name:str, args:List[Any]):
-        if widget_id in self.widgets.keys():
-            getattr(self.widgets[widget_id], event_name)(*[ self.__revert_js_to_object(arg) for arg in args ])
+    def append_table_rows(self, body_id:str, rows:List[list], max_rows:int = None):
+        self.__call("appendTableRows", body_id, rows, max_rows)
+
+    def get_table_cells(self, body_id:str) -> List[List[str]]:
+        return self.__read("getTableCells", body_id)
+
+
+    def bind_widget_event(self, widget_id:str, event_name:str, bind_name:str, call_args:List[str] = [], call_widget_id:str = None, options:Dict[str, Any] = None):
+        if options is None:
+            self.__call("bindWidgetEvent", widget_id, event_name, bind_name, call_args, call_widget_id)
+        else:
+            self.__call("bindWidgetEvent", widget_id, event_name, bind_name, call_args, call_widget_id, options)
+
+    def call_python_widget_events(self, events:List[list], sequence:int = None):
+        # events queued in webview during one animation frame, dispatched in order
+        # changes of handlers are sent as they are made(not held until last handler returns), error of handler does not drop next events
+        error = None
+        with self.__event_condition:
+            if sequence is not None:
+                if sequence == 1:
+                    # page is loaded(again), sequence of $queueEvent starts from 1
+                    self.__event_sequence = 0
+
+                deadline = time.perf_counter() + self.event_order_timeout
+                while sequence > self.__event_sequence + 1 and self.__event_condition.wait(max(0, deadline - time.perf_counter())):
+                    pass
+
+                self.__event_sequence = max(self.__event_sequence, sequence)
+
+            self.user_change_version += 1
+            try:
+                for event in events:
+                    try:
+                        self.call_python_widget_event(*event)
+                    except Exception as e:
+                        error = e if error is None else error
+            finally:
+                self.__event_condition.notify_all()
+
+        if error is not None:
+            raise error
+
+    def call_python_widget_event(self, widget_id:str, event_name:str, args:List[Any], source_widget_id:str = None):
+        # get(not keys()) of weak registry, widget can be collected between check and use
+        source_widget = None if source_widget_id is None else self.widgets.get(source_widget_id)
+        if source_widget is not None:
+            # user interaction may have changed value/checked of source widget
+            source_widget._invalidate_user_attributes()
+
+        widget = self.widgets.get(widget_id)
+        if widget is not None:
+            if self.collect_stats:
+                started_at = time.perf_counter()
+                getattr(widget, event_name)(*[ self.__decode_event_arg(arg) for arg in args ])
+                self.bridge_stats.record_handler(f"{widget.__class__.__name__}.{event_name}", widget_id, started_at, time.perf_counter() - started_at)
+            else:
+                getattr(widget, event_name)(*[ self.__decode_event_arg(arg) for arg in args ])
 
     
     def add_global_css(self, style_id:str, style_content:str):
-        self.app_window.evaluate_js(f'window.hufpy.addGlobalCss("{style_id}", `{style_content}`);')
+        self.__call("addGlobalCss", style_id, style_content)
 
     def delete_global_css(self, style_id:str):
-        self.app_window.evaluate_js(f'window.hufpy.deleteGlobalCss("{style_id}");')
+        self.__call("deleteGlobalCss", style_id)
 
 class Application:
     """
@@ -93,9 +491,91 @@ class Application:
     """
     __app_api:ApplicationAPI = None
     body:Body = Body()
+    # time.perf_counter() of startup steps(init_started, init_finished, window_loaded, main_layout_mounted, first_layout)
+    startup_timings:Dict[str, float] = {}
+    # flag to read layout of main layout after mount and close window(used by `hufpy startup`)
+    measure_startup:bool = False
+    # default of inline_shell of init(used by `hufpy startup --inline-shell`)
+    inline_shell:bool = False
+
+    @staticmethod
+    def batch(per_frame:bool = False) -> Iterator[ApplicationAPI]:
+        """
+        queue widget operations and send them to webview at once
+
+        Parameters
+        ----------
+        per_frame: bool, default False
+            flag to flush queued operations while batch is opened, when operation is queued after frame_interval
+            from last flush(no timer, call ApplicationAPI.flush() to send last operations of burst before end of batch)
+
+        Return
+        ------
+        transaction: ContextManager[ApplicationAPI]
+            use with "with" statement
+        """
+        return _shared.application_api.transaction(per_frame)
 
     @staticmethod
-    def init(title:str = "hufpy", icon:str = None, width:int = 800, height:int = 600, x:int = None, y:int = None) -> webview.Window:
+    def deferred_mount() -> Iterator[ApplicationAPI]:
+        """
+        build widgets created in context locally and mount them to webview at once
+
+        Return
+        ------
+        deferred mount: ContextManager[ApplicationAPI]
+            use with "with" statement
+        """
+        return _shared.application_api.deferred_mount()
+
+    @staticmethod
+    def enable_stats(enabled:bool = True):
+        """
+        enable(or disable) recording of bridge calls, can be called before init
+
+        Parameters
+        ----------
+        enabled: bool, default True
+            flag to record call counts, wall time, payload sizes and call sites of bridge calls
+        """
+        ApplicationAPI.collect_stats = enabled
+
+    @staticmethod
+    def stats(reset:bool = False) -> Dict[str, Any]:
+        """
+        recorded stats of bridge calls(see Application.enable_stats)
+
+        Parameters
+        ----------
+        reset: bool, default False
+            flag to clear recorded stats after read
+
+        Return
+        ------
+        stats: Dict[str, Any]
+            { "round_trips", "messages", "payload_bytes", "seconds", "methods", "sites", "widgets", "handlers" }
+        """
+        bridge_stats = _shared.application_api.bridge_stats
+        stats = bridge_stats.to_dict()
+        if reset:
+            bridge_stats.reset()
+
+        return stats
+
+    @staticmethod
+    def write_trace(path:str):
+        """
+        write recorded bridge calls and event handlers as chrome trace format(open in chrome://tracing or perfetto)
+
+        Parameters
+        ----------
+        path: str, required
+            path of json file
+        """
+        _shared.application_api.bridge_stats.write_trace(path)
+
+    @staticmethod
+    def init(title:str = "hufpy", icon:str = None, width:int = 800, height:int = 600, x:int = None, y:int = None, fire_and_forget:bool = False, inline_shell:bool = None) -> webview.Window:
         """
         Initialize and create default webview window
 
@@ -118,21 +598,34 @@ class Application:
         y: int, default None
             vertical location(y) of main window
             if None, center
+        fire_and_forget: bool, default False
+            flag to send widget writes(setters) without waiting webview
+            writes are queued in order and sent from background thread,
+            reads wait until queued writes are sent
+        inline_shell: bool, default None
+            flag to load single html with styles and hufpy.js inlined(built once and cached in memory)
+            instead of index.html and its files, HufPy is constructed without waiting pywebviewready
+            if None, Application.inline_shell
 
         Return
         ------
         window: webview.Window
             main window generated
         """
+        Application.startup_timings["init_started"] = time.perf_counter()
         webview.initialize("cef" if sys.platform == "win32" else "cocoa" if sys.platform == "darwin" else "qt")
         # Application.body.api = app_api = ApplicationAPI()
         _shared.application_body = Body()
         _shared.application_api = _shared.application_body.api = app_api = ApplicationAPI()
+        app_api.fire_and_forget = fire_and_forget
         # setattr(Application, "__app_api", app_api)
+        inline_shell = Application.inline_shell if inline_shell is None else inline_shell
 
         def on_window_loaded():
-            with open(os.path.join(__path__[0], "assets", "styles", f"{sys.platform}.css"), "r", encoding = "utf-8") as cr:
-                win.load_css(cr.read())
+            Application.startup_timings["window_loaded"] = time.perf_counter()
+            if not inline_shell:
+                with open(os.path.join(__path__[0], "assets", "styles", f"{sys.platform}.css"), "r", encoding = "utf-8") as cr:
+                    win.load_css(cr.read())
 
             gui_win = win.gui.BrowserView.instances[win.uid]
 
@@ -154,17 +647,42 @@ class Application:
                 gui_win.setWindowIcon(QIcon(icon if icon else os.path.join(__path__[0], "assets", "icons", "icon.png")))
 
         win = webview.create_window(
-            url = os.path.join(__path__[0], "assets", "index.html"),
+            url = None if inline_shell else os.path.join(__path__[0], "assets", "index.html"),
+            html = build_shell() if inline_shell else None,
             js_api = app_api,
             title = title,
             width = width, height = height,
             x = x, y = y
         )
         app_api.app_window = win
+        app_api.transport = WebviewTransport(win)
         win.events.loaded += on_window_loaded
+        Application.startup_timings["init_finished"] = time.perf_counter()
 
         return win
 
+    @staticmethod
+    def init_headless(fire_and_forget:bool = False) -> HeadlessTransport:
+        """
+        Initialize application without webview, widgets are built on in-memory DOM(for tests and benchmarks)
+
+        Parameters
+        ----------
+        fire_and_forget: bool, default False
+            flag to send widget writes(setters) without waiting transport
+
+        Return
+        ------
+        transport: HeadlessTransport
+            transport connected to application api, has DOM model and traffic counters
+        """
+        _shared.application_body = Body()
+        _shared.application_api = _shared.application_body.api = app_api = ApplicationAPI()
+        app_api.fire_and_forget = fire_and_forget
+        app_api.transport = HeadlessTransport()
+
+        return app_api.transport
+
     @staticmethod
     def run(main_layout_class:Type[Layout], debug:bool = False):
         """
@@ -180,6 +698,14 @@ class Application:
         def on_start():
             # main_layout_class.api = getattr(Application, "__app_api")
             # main_layout_class.api = Application.body.api
-            main_layout_class()
+            with _shared.application_api.transaction(), _shared.application_api.deferred_mount():
+                main_layout = main_layout_class()
+            Application.startup_timings["main_layout_mounted"] = time.perf_counter()
+
+            if Application.measure_startup:
+                # reading size forces layout of mounted tree
+                _shared.application_api.get_widget_attribute(main_layout.id, "clientWidth")
+                Application.startup_timings["first_layout"] = time.perf_counter()
+                _shared.application_api.app_window.destroy()
 
         webview.start(on_start, debug = debug)
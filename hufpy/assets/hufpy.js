@@ -5,37 +5,113 @@ class HufPy {
         this.$widgets = {
             "hufpy-app-container": document.querySelector("hufpy-app-container")
         };
+
+        // fixed table of operations python can request
+        this.$handlers = {
+            addGlobalCss: this.addGlobalCss,
+            deleteGlobalCss: this.deleteGlobalCss,
+            createWidget: this.createWidget,
+            removeWidget: this.removeWidget,
+            getWidgetAttribute: this.getWidgetAttribute,
+            setWidgetAttribute: this.setWidgetAttribute,
+            updateWidgetStyle: this.updateWidgetStyle,
+            removeWidgetAttribute: this.removeWidgetAttribute,
+            widgetAttributeExists: this.widgetAttributeExists,
+            addWidgetClass: this.addWidgetClass,
+            removeWidgetClass: this.removeWidgetClass,
+            setModalBackgroundVisible: this.setModalBackgroundVisible,
+            attachWidget: this.$attachWidget,
+            detachWidget: this.$detatchWidget,
+            setWidgetVisible: this.setWidgetVisible,
+            bindWidgetEvent: this.bindWidgetEvent,
+            mountTree: this.mountTree,
+            setTableColumns: this.setTableColumns,
+            setTableRows: this.setTableRows,
+            setTableData: this.setTableData,
+            getTableCells: this.getTableCells,
+            patchTableData: this.patchTableData,
+            appendTableRows: this.appendTableRows,
+            registerTemplate: this.registerTemplate,
+            stampTemplate: this.stampTemplate
+        };
+        this.$mounting = null;
+        this.$templates = {};
+        // style elements of addGlobalCss by id
+        this.$styles = {};
+        // root listeners by event name, bindings are routed from $events
+        this.$listeners = {};
+        // events to python queued until next animation frame, { calls, done }
+        this.$eventBatch = null;
+        this.$eventSequence = 0;
+    }
+
+    dispatch(payload) {
+        // payload: json string of [ [ handlerName, args ], ... ], result of last message is returned
+        // messages are independent, failed message does not stop next messages(errors are reported after all)
+        var value = null;
+        var errors = [];
+        try {
+            var messages = JSON.parse(payload);
+        }
+        catch (e) {
+            return { state: "fail", message: e.toString() };
+        }
+
+        for (var [handlerName, args] of messages) {
+            value = this.$applyMessage(handlerName, args, errors);
+        }
+
+        if (errors.length > 0) {
+            return { state: "fail", message: errors.join("\n") };
+        }
+
+        return { state: "success", value: value == undefined ? null : value };
+    }
+
+    $applyMessage(handlerName, args, errors) {
+        var handler = this.$handlers[handlerName];
+        if (handler == undefined) {
+            errors.push(`unknown handler: ${handlerName}`);
+            return null;
+        }
+
+        try {
+            var value = handler.apply(this, args);
+        }
+        catch (e) {
+            errors.push(`${handlerName}: ${e.toString()}`);
+            return null;
+        }
+
+        if (value != undefined && value.state == "fail") {
+            errors.push(value.message);
+            return null;
+        }
+
+        return value;
     }
 
     addGlobalCss(styleId, styleContent) {
         this.deleteGlobalCss(styleId);
 
-        document.head.insertAdjacentHTML("beforeend", `
-<style id="${styleId}">
-${styleContent}
-</style>
-`);
+        var style = document.createElement("style");
+        style.id = styleId;
+        style.textContent = styleContent;
+        document.head.appendChild(style);
+        this.$styles[styleId] = style;
     }
 
     deleteGlobalCss(styleId) {
-        var may_style = document.querySelector(`style#${styleId}`);
-        if (may_style != null) {
+        var may_style = this.$styles[styleId];
+        if (may_style != undefined) {
             may_style.remove();
+            delete this.$styles[styleId];
         }
     }
 
     createWidget(tagName, widgetClass, widgetType, widgetId, attributes, parentId = "hufpy-app-container", autoAttach = false) {
         // var parent = document.querySelector(`#${parentId}`);
-        var parent = null;
-        if (parentId.toLowerCase() == "body") {
-            parent = document.body;
-        }
-        else if (parentId == "hufpy-app-container") {
-            parent = document.querySelector("#hufpy-app-container");
-        }
-        else {
-            parent = this.$widgets[parentId];
-        }
+        var parent = this.$getParent(parentId);
 
         if (parent == undefined || parent == null) {
             return { state: "fail", message: "unknown parent!" };
@@ -61,14 +137,174 @@ ${styleContent}
         // parent.appendChild(element);
         this.$widgets[widgetId] = element;
         if ([ "body", "hufpy-app-container" ].includes(parentId) || autoAttach) {
-            parent.appendChild(element);
+            this.$getMountTarget(widgetId, parentId, parent).appendChild(element);
+        }
+
+        return { state: "success" };
+    }
+
+    $getParent(parentId) {
+        if (parentId.toLowerCase() == "body") {
+            return document.body;
+        }
+        else if (parentId == "hufpy-app-container") {
+            return document.querySelector("#hufpy-app-container");
+        }
+        else {
+            return this.$widgets[parentId];
+        }
+    }
+
+    $getMountTarget(widgetId, parentId, parent) {
+        // while mounting tree, roots of tree go to fragment of their parent instead of document
+        if (this.$mounting == null || !this.$mounting.widgetIds.has(widgetId) || this.$mounting.widgetIds.has(parentId)) {
+            return parent;
+        }
+
+        if (this.$mounting.fragments[parentId] == undefined) {
+            this.$mounting.fragments[parentId] = document.createDocumentFragment();
+        }
+        return this.$mounting.fragments[parentId];
+    }
+
+    mountTree(widgetSpecs, messages) {
+        // widgetSpecs: arguments of createWidget, messages: [ handlerName, args ] called after creation
+        // failed widget or message does not drop rest of tree, errors are reported after mount
+        this.$mounting = { widgetIds: new Set(widgetSpecs.map((spec) => spec[3])), fragments: {} };
+        var errors = [];
+        try {
+            for (var spec of widgetSpecs) {
+                this.$applyMessage("createWidget", spec, errors);
+            }
+
+            for (var [handlerName, args] of messages) {
+                this.$applyMessage(handlerName, args, errors);
+            }
+
+            // single insertion per parent
+            for (var parentId in this.$mounting.fragments) {
+                this.$getParent(parentId).appendChild(this.$mounting.fragments[parentId]);
+            }
+        }
+        finally {
+            this.$mounting = null;
+        }
+
+        if (errors.length > 0) {
+            return { state: "fail", message: errors.join("\n") };
+        }
+
+        return { state: "success" };
+    }
+
+    registerTemplate(templateId, widgetSpecs, messages) {
+        // ids of widgets are placeholders($0$, $1$, ...), parent is $parent$
+        // template is built once, event bindings and global styles are replayed per stamp
+        var container = document.createElement("div");
+        var replay = [];
+        this.$widgets["$parent$"] = container;
+        try {
+            for (var spec of widgetSpecs) {
+                var res = this.createWidget(...spec);
+                if (res.state == "fail") {
+                    return res;
+                }
+            }
+
+            for (var [handlerName, args] of messages) {
+                if ([ "bindWidgetEvent", "addGlobalCss", "deleteGlobalCss" ].includes(handlerName)) {
+                    replay.push([ handlerName, args ]);
+                    continue;
+                }
+
+                var res = this.$handlers[handlerName].apply(this, args);
+                if (res != undefined && res.state == "fail") {
+                    return res;
+                }
+            }
+
+            // detached widgets(hidden children) are cloned separately
+            var loose = widgetSpecs.map((spec) => this.$widgets[spec[3]]).filter((element) => element.parentNode == null);
+            this.$templates[templateId] = { roots: [ container, ...loose ], replay: JSON.stringify(replay) };
+        }
+        finally {
+            for (var spec of widgetSpecs) {
+                delete this.$widgets[spec[3]];
+            }
+            delete this.$widgets["$parent$"];
+        }
+
+        return { state: "success" };
+    }
+
+    stampTemplate(templateId, widgetIds, parentId) {
+        var template = this.$templates[templateId];
+        if (template == undefined) {
+            return { state: "fail", message: `unknown template: ${templateId}` };
+        }
+
+        var parent = this.$getParent(parentId);
+        for (var rootIdx = 0; rootIdx < template.roots.length; rootIdx++) {
+            var original = template.roots[rootIdx];
+            var clone = original.cloneNode(true);
+
+            // cloneNode keeps structure and attributes, properties and ids are restored by parallel walk
+            var originals = [ original, ...original.querySelectorAll("*") ];
+            var clones = [ clone, ...clone.querySelectorAll("*") ];
+            for (var idx = 0; idx < originals.length; idx++) {
+                var element = clones[idx];
+                for (var attribute of element.attributes) {
+                    // references to other widgets(for, ...) are whole values, text can contain "$"
+                    var reference = attribute.name == "id" ? null : /^\$(\d+)\$$/.exec(attribute.value);
+                    if (reference != null) {
+                        attribute.value = widgetIds[Number(reference[1])];
+                    }
+                }
+
+                var match = /^\$(\d+)\$$/.exec(originals[idx].id);
+                if (match == null) {
+                    continue;
+                }
+
+                element.id = widgetIds[Number(match[1])];
+                this.$widgets[element.id] = element;
+                if (originals[idx].$attributeTypes != undefined) {
+                    element.$attributeTypes = Object.assign({}, originals[idx].$attributeTypes);
+                }
+                if ([ "INPUT", "SELECT", "TEXTAREA" ].includes(element.tagName)) {
+                    element.value = originals[idx].value;
+                    element.checked = originals[idx].checked;
+                }
+            }
+
+            if (rootIdx == 0) {
+                parent.append(...clone.childNodes);
+            }
+        }
+
+        var replay = template.replay
+            .replace(/\$(\d+)\$/g, (_, idx) => widgetIds[Number(idx)])
+            .replace(/\$parent\$/g, parentId);
+        for (var [handlerName, args] of JSON.parse(replay)) {
+            this.$handlers[handlerName].apply(this, args);
         }
 
         return { state: "success" };
     }
 
-    removeWidget(widgetId) {
-        this.$widgets[widgetId].remove();
+    removeWidget(widgetId, descendantIds = []) {
+        // descendants are unregistered with widget, their elements are removed with element of widget
+        var element = this.$widgets[widgetId];
+        for (var id of [ widgetId, ...descendantIds ]) {
+            delete this.$widgets[id];
+            this.$clearBindings(id);
+            delete this.$events[id];
+            this.deleteGlobalCss(`style_${id}`);
+        }
+
+        if (element != undefined) {
+            element.remove();
+        }
     }
 
 
@@ -91,11 +327,17 @@ ${styleContent}
             return element.innerText;
         }
         else if (name == "value") {
+            if ([ "number", "range" ].includes(element.type)) {
+                return element.value == "" ? null : Number(element.value);
+            }
             return element.value;
         }
         else if (name == "checked") {
             return element.checked;
         }
+        else if ([ "scrollTop", "scrollLeft", "clientWidth", "clientHeight" ].includes(name)) {
+            return element[name];
+        }
         else if (name == "style") {
             var raw_style = element.getAttribute("style");
             var return_style = {};
@@ -137,7 +379,18 @@ ${styleContent}
             return return_style;
         }
         else {
-            return element.getAttribute(name);
+            var value = element.getAttribute(name);
+            var type = element.$attributeTypes == undefined ? undefined : element.$attributeTypes[name];
+            if (value == null || type == undefined) {
+                return value;
+            }
+            else if (type == "number") {
+                return Number(value);
+            }
+            else if (type == "boolean") {
+                return value == "true";
+            }
+            return value;
         }
     }
 
@@ -148,10 +401,12 @@ ${styleContent}
 
     $setWidgetAttribute(element, name, value) {
         if (name == "id") {
-            var globalStyle = document.querySelector(`#style_${element.id}`);
+            var oldId = element.id;
+            var globalStyle = this.$styles[`style_${oldId}`];
 
-            delete this.$widgets[element.id];
-            var exist_events = this.$events[element.id];
+            delete this.$widgets[oldId];
+            var exist_events = this.$events[oldId];
+            delete this.$events[oldId];
 
             element.id = value;
 
@@ -160,8 +415,12 @@ ${styleContent}
                 this.$events[value] = exist_events;
             }
 
-            if (globalStyle != null) {
-                globalStyle.id = `style_${value}`
+            // global style is moved to new id(registry, element and selectors), removeWidget and deleteGlobalCss find it by new id
+            if (globalStyle != undefined) {
+                delete this.$styles[`style_${oldId}`];
+                globalStyle.id = `style_${value}`;
+                globalStyle.textContent = globalStyle.textContent.replace(new RegExp(`#${oldId.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")}(?![\\w-])`, "g"), () => `#${value}`);
+                this.$styles[`style_${value}`] = globalStyle;
             }
         }
         else if (name == "text") {
@@ -227,10 +486,43 @@ ${styleContent}
             // }
         }
         else {
+            // keep type of value, attributes are stored as string in DOM
+            if (element.$attributeTypes == undefined) {
+                element.$attributeTypes = {};
+            }
+            element.$attributeTypes[name] = typeof value;
             element.setAttribute(name, value);
         }
     }
 
+    updateWidgetStyle(widgetId, properties, removeNames = []) {
+        var element = this.$widgets[widgetId];
+
+        for (var name of removeNames) {
+            this.$setStyleProperty(element, name, "");
+        }
+        for (var name in properties) {
+            this.$setStyleProperty(element, name, properties[name]);
+        }
+    }
+
+    $setStyleProperty(element, name, value) {
+        if ([ "border", "margin", "padding" ].includes(name)) {
+            // compound properties are sent as dict of sub properties(numbers are px)
+            var subNames = name == "border" ? [ "width", "style", "color", "radius" ] : [ "left", "right", "top", "bottom" ];
+            for (var subName of subNames) {
+                var subValue = value === "" || value[subName] == undefined ? "" : value[subName];
+                this.$setStyleProperty(element, `${name}-${subName}`, typeof subValue == "number" ? `${subValue}px` : subValue);
+            }
+        }
+        else if (value === "" || value == null) {
+            element.style.removeProperty(name);
+        }
+        else {
+            element.style.setProperty(name, value);
+        }
+    }
+
     removeWidgetAttribute(widgetId, attributeName) {
         // this.$removeWidgetAttribute(document.querySelector(`#${widgetId}`), attributeName);
         this.$removeWidgetAttribute(this.$widgets[widgetId], attributeName);
@@ -240,7 +532,7 @@ ${styleContent}
         element.removeAttribute(name);
     }
 
-    widgetAttributeExsits(widgetId, attributeName) {
+    widgetAttributeExists(widgetId, attributeName) {
         // return this.$widgetAttributeExists(document.querySelector(`#${widgetId}`), attributeName);
         return this.$widgetAttributeExists(this.$widgets[widgetId], attributeName);
     }
@@ -250,12 +542,177 @@ ${styleContent}
     }
 
 
+    addWidgetClass(widgetId, className) {
+        this.$widgets[widgetId].classList.add(className);
+    }
+
+    removeWidgetClass(widgetId, className) {
+        this.$widgets[widgetId].classList.remove(className);
+    }
+
+    setModalBackgroundVisible(containerId, visible) {
+        var container = containerId == "body" ? document.body : this.$widgets[containerId];
+        var background = container.querySelector(containerId == "body" ? ":scope > .hufpy-modal-background" : ".hufpy-modal-background");
+        if (background != null) {
+            background.setAttribute("data-visible", visible ? "true" : "false");
+        }
+    }
+
+
+    setTableColumns(widgetId, columns) {
+        // virtual table: <table> with header is managed in webview, rows are set by setTableRows
+        var element = this.$widgets[widgetId];
+        var table = element.querySelector(":scope > table");
+        if (table == null) {
+            table = document.createElement("table");
+            table.className = "hufpy-table";
+            table.appendChild(document.createElement("thead"));
+            table.appendChild(document.createElement("tbody"));
+            element.appendChild(table);
+        }
+
+        var headerRow = document.createElement("tr");
+        for (var column of columns) {
+            var th = document.createElement("th");
+            th.className = "hufpy-table-column";
+            th.textContent = column;
+            headerRow.appendChild(th);
+        }
+        table.tHead.replaceChildren(headerRow);
+        table.tBodies[0].replaceChildren();
+    }
+
+    setTableRows(widgetId, offset, totalHeight, rowHeight, rows) {
+        var table = this.$widgets[widgetId].querySelector(":scope > table");
+        var columnCount = table.tHead.rows.length > 0 ? table.tHead.rows[0].cells.length : 1;
+
+        var createSpacer = (height) => {
+            var tr = document.createElement("tr");
+            var td = document.createElement("td");
+            td.colSpan = columnCount;
+            td.style.cssText = `height: ${height}px; padding: 0px; border: 0px;`;
+            tr.appendChild(td);
+            return tr;
+        };
+
+        var fragment = document.createDocumentFragment();
+        fragment.appendChild(createSpacer(offset));
+        for (var row of rows) {
+            var tr = document.createElement("tr");
+            tr.className = "hufpy-table-row";
+            tr.style.height = `${rowHeight}px`;
+            for (var value of row) {
+                var td = document.createElement("td");
+                td.className = "hufpy-table-item";
+                td.textContent = value;
+                tr.appendChild(td);
+            }
+            fragment.appendChild(tr);
+        }
+        fragment.appendChild(createSpacer(Math.max(0, totalHeight - offset - rows.length * rowHeight)));
+
+        table.tBodies[0].replaceChildren(fragment);
+    }
+
+
+    setTableData(headerId, bodyId, columns, data) {
+        // data is columnar: data[columnIndex][rowIndex]
+        var headerRow = document.createElement("tr");
+        for (var column of columns) {
+            var th = document.createElement("th");
+            th.className = "hufpy-widget-no-flex hufpy-table-column";
+            th.textContent = column;
+            headerRow.appendChild(th);
+        }
+        this.$widgets[headerId].replaceChildren(headerRow);
+
+        var fragment = document.createDocumentFragment();
+        var rowCount = data.length > 0 ? data[0].length : 0;
+        for (var ridx = 0; ridx < rowCount; ridx++) {
+            var tr = document.createElement("tr");
+            tr.className = "hufpy-widget-no-flex hufpy-table-row";
+            for (var cidx = 0; cidx < data.length; cidx++) {
+                var td = document.createElement("td");
+                td.className = "hufpy-widget-no-flex hufpy-table-item";
+                td.textContent = data[cidx][ridx] == null ? "" : data[cidx][ridx];
+                tr.appendChild(td);
+            }
+            fragment.appendChild(tr);
+        }
+        this.$widgets[bodyId].replaceChildren(fragment);
+    }
+
+    patchTableData(bodyId, removed, inserted, changed) {
+        // removed: row positions(descending), inserted: [ position, values ](ascending), changed: [ row, column, value ]
+        var body = this.$widgets[bodyId];
+        for (var ridx of removed) {
+            body.rows[ridx].remove();
+        }
+
+        for (var [ridx, values] of inserted) {
+            body.insertBefore(this.$createTableRow(values), body.rows[ridx] == undefined ? null : body.rows[ridx]);
+        }
+
+        for (var [ridx, cidx, value] of changed) {
+            body.rows[ridx].cells[cidx].textContent = value == null ? "" : value;
+        }
+    }
+
+    appendTableRows(bodyId, rows, maxRows = null) {
+        var body = this.$widgets[bodyId];
+
+        var fragment = document.createDocumentFragment();
+        for (var values of rows) {
+            fragment.appendChild(this.$createTableRow(values));
+        }
+        body.appendChild(fragment);
+
+        // drop oldest rows over maxRows at once
+        var excess = maxRows == null ? 0 : body.rows.length - maxRows;
+        if (excess > 0) {
+            var range = document.createRange();
+            range.setStartBefore(body.rows[0]);
+            range.setEndAfter(body.rows[excess - 1]);
+            range.deleteContents();
+        }
+    }
+
+    $createTableRow(values) {
+        var tr = document.createElement("tr");
+        tr.className = "hufpy-widget-no-flex hufpy-table-row";
+        for (var value of values) {
+            var td = document.createElement("td");
+            td.className = "hufpy-widget-no-flex hufpy-table-item";
+            td.textContent = value == null ? "" : value;
+            tr.appendChild(td);
+        }
+
+        return tr;
+    }
+
+    getTableCells(bodyId) {
+        // text of cells as columnar arrays: cells[columnIndex][rowIndex]
+        var cells = [];
+        for (var row of this.$widgets[bodyId].rows) {
+            for (var cidx = 0; cidx < row.cells.length; cidx++) {
+                if (cells[cidx] == undefined) {
+                    cells[cidx] = [];
+                }
+                var input = row.cells[cidx].querySelector("input, select");
+                cells[cidx].push(input == null ? row.cells[cidx].textContent : input.value);
+            }
+        }
+
+        return cells;
+    }
+
+
     $detatchWidget(widgetId, parentId) {
         // var element = document.querySelector(`#${widgetId}`);
         var element = this.$widgets[widgetId];
         var parent = this.$widgets[parentId];
 
-        element.setAttribute("data-visible", "false");
+        this.$setWidgetAttribute(element, "data-visible", false);
         // document.querySelector(`#${parentId}`).removeChild(element);
 
         if (parent != undefined) {
@@ -264,6 +721,10 @@ ${styleContent}
             }
             catch {}
         }
+        if (element.parentNode instanceof DocumentFragment) {
+            // root of mounting tree
+            element.remove();
+        }
 
         // document.body.appendChild(element);
     }
@@ -271,8 +732,8 @@ ${styleContent}
     $attachWidget(widgetId, parentId, widgetIdx = null) {
         // var parent = document.querySelector(`#${parentId}`);
         // var element = document.querySelector(`#${widgetId}`);
-        var parent = this.$widgets[parentId];
         var element = this.$widgets[widgetId];
+        var parent = this.$getMountTarget(widgetId, parentId, this.$widgets[parentId]);
         // try {
         //     document.body.removeChild(element);
         // }
@@ -282,15 +743,12 @@ ${styleContent}
             parent.appendChild(element);
         }
         else {
-            try {
-                parent.insertBefore(parent.children[widgetIdx + 1], element);
-            }
-            catch {
-                parent.appendChild(element);
-            }
+            // inserted before child at widgetIdx(counted without element), appended if out of range
+            element.remove();
+            parent.insertBefore(element, parent.children[widgetIdx] || null);
         }
 
-        element.setAttribute("data-visible", "true");
+        this.$setWidgetAttribute(element, "data-visible", true);
     }
 
     setWidgetVisible(widgetId, parentId, visible, widgetIdx = null) {
@@ -303,41 +761,171 @@ ${styleContent}
     }
 
 
-    bindWidgetEvent(widgetId, eventName, bindName, callArgs = [], callWidgetId = null) {
-        if (this.$events[widgetId] != undefined && this.$events[widgetId][eventName] != undefined && this.$events[widgetId][eventName][bindName] != undefined) {
-            // document.querySelector(`#${widgetId}`).removeEventListener(eventName, this.$events[widgetId][eventName][bindName]);
-            this.$widgets[widgetId].removeEventListener(eventName, this.$events[widgetId][eventName][bindName]);
-        }
-
-        var self = this;
+    bindWidgetEvent(widgetId, eventName, bindName, callArgs = [], callWidgetId = null, options = {}) {
+        // binding is entry of registry, one listener per event name is added to document
         if (this.$events[widgetId] == undefined) {
             this.$events[widgetId] = {};
         }
         if (this.$events[widgetId][eventName] == undefined) {
             this.$events[widgetId][eventName] = {};
         }
-        this.$events[widgetId][eventName][bindName] = (ev) => {
-            var respArgs = [];
-            for (var callArg of callArgs) {
-                if (callArg == "self") {
-                    respArgs.push(`self.widgets["${widgetId}"]`);
+        if (this.$events[widgetId][eventName][bindName] != undefined) {
+            // delayed calls of previous binding are canceled
+            this.$clearBinding(this.$events[widgetId][eventName][bindName]);
+        }
+        // throttleMs, debounceMs, latestOnly of options limit calls to python, state of rate is kept in binding
+        this.$events[widgetId][eventName][bindName] = {
+            callArgs: callArgs, callWidgetId: callWidgetId,
+            throttleMs: options.throttleMs == undefined ? null : options.throttleMs,
+            debounceMs: options.debounceMs == undefined ? null : options.debounceMs,
+            latestOnly: options.latestOnly == true,
+            timer: null, calledAt: 0, pendingCall: null, running: false, latestCall: null
+        };
+
+        if (this.$listeners[eventName] == undefined) {
+            this.$listeners[eventName] = (ev) => this.$routeEvent(eventName, ev);
+            // capture phase also receives events which do not bubble(scroll, focus, ...)
+            document.addEventListener(eventName, this.$listeners[eventName], true);
+        }
+    }
+
+    $routeEvent(eventName, ev) {
+        // bindings of target and its ancestors(only target if event does not bubble), same order as bubbling
+        var element = ev.target instanceof Element ? ev.target : null;
+        while (element != null) {
+            var bindings = element.id == "" || this.$events[element.id] == undefined ? undefined : this.$events[element.id][eventName];
+            if (bindings != undefined && this.$widgets[element.id] == element) {
+                for (var bindName in bindings) {
+                    this.$callBinding(element.id, bindName, bindings[bindName], ev);
                 }
-                else if (callArg == "ev" || callArg == "event") {
-                    respArgs.push(ev);
+            }
+
+            element = ev.bubbles ? element.parentElement : null;
+        }
+    }
+
+    $callBinding(widgetId, bindName, binding, ev) {
+        var respArgs = [];
+        for (var callArg of binding.callArgs) {
+            if (callArg == "self") {
+                respArgs.push({ "$widget": widgetId });
+            }
+            else if (callArg == "ev" || callArg == "event") {
+                respArgs.push(ev);
+            }
+            else if (callArg == "rowIndex" || callArg == "cellIndex") {
+                // delegated table events: position of cell which event occurred in
+                var cell = ev.target.closest("td");
+                if (cell == null || !this.$widgets[widgetId].contains(cell)) {
+                    respArgs.push(null);
                 }
                 else {
-                    respArgs.push(self.$getWidgetAttribute(ev.target, callArg));
+                    respArgs.push(callArg == "rowIndex" ? cell.parentElement.sectionRowIndex : cell.cellIndex);
+                }
+            }
+            else {
+                respArgs.push(this.$getWidgetAttribute(ev.target, callArg));
+            }
+        }
+
+        // arguments are read when event occurs, target can be changed until delayed call
+        var call = [ binding.callWidgetId == null ? widgetId : binding.callWidgetId, bindName, respArgs, widgetId ];
+        if (binding.debounceMs != null) {
+            clearTimeout(binding.timer);
+            binding.timer = setTimeout(() => {
+                binding.timer = null;
+                this.$sendBinding(binding, call);
+            }, binding.debounceMs);
+        }
+        else if (binding.throttleMs != null) {
+            var wait = binding.calledAt + binding.throttleMs - Date.now();
+            if (wait <= 0 && binding.timer == null) {
+                binding.calledAt = Date.now();
+                this.$sendBinding(binding, call);
+            }
+            else {
+                // last event of interval is called at end of interval
+                binding.pendingCall = call;
+                if (binding.timer == null) {
+                    binding.timer = setTimeout(() => {
+                        var pendingCall = binding.pendingCall;
+                        binding.timer = null;
+                        binding.pendingCall = null;
+                        binding.calledAt = Date.now();
+                        this.$sendBinding(binding, pendingCall);
+                    }, Math.max(wait, 0));
                 }
             }
+        }
+        else {
+            this.$sendBinding(binding, call);
+        }
+    }
 
-            pywebview.api.call_python_widget_event(callWidgetId == null ? widgetId : callWidgetId, bindName, respArgs);
-        };
-        // document.querySelector(`#${widgetId}`).addEventListener(eventName, this.$events[widgetId][eventName][bindName]);
-        this.$widgets[widgetId].addEventListener(eventName, this.$events[widgetId][eventName][bindName]);
+    $sendBinding(binding, call) {
+        if (!binding.latestOnly) {
+            this.$queueEvent(call);
+            return;
+        }
+
+        // latest only: one call in python at once, events while running are replaced by newer one
+        if (binding.running) {
+            binding.latestCall = call;
+            return;
+        }
+
+        binding.running = true;
+        this.$queueEvent(call).finally(() => {
+            var latestCall = binding.latestCall;
+            binding.running = false;
+            binding.latestCall = null;
+            if (latestCall != null) {
+                this.$sendBinding(binding, latestCall);
+            }
+        });
+    }
+
+    $queueEvent(call) {
+        // events of one frame cross bridge as one array, python dispatches them in order
+        // pywebview calls python on new thread per call, sequence keeps order of batches
+        if (this.$eventBatch == null) {
+            var batch = { calls: [], sequence: ++this.$eventSequence, done: null };
+            batch.done = new Promise((resolve) => {
+                var flush = () => {
+                    this.$eventBatch = null;
+                    resolve(pywebview.api.call_python_widget_events(batch.calls, batch.sequence));
+                };
+                // animation frames are paused in hidden window
+                document.hidden ? setTimeout(flush, 0) : requestAnimationFrame(flush);
+            });
+            this.$eventBatch = batch;
+        }
+
+        this.$eventBatch.calls.push(call);
+        return this.$eventBatch.done;
+    }
+
+    $clearBindings(widgetId) {
+        // delayed calls of removed widget are canceled
+        for (var eventName in this.$events[widgetId] || {}) {
+            for (var bindName in this.$events[widgetId][eventName]) {
+                this.$clearBinding(this.$events[widgetId][eventName][bindName]);
+            }
+        }
+    }
+
+    $clearBinding(binding) {
+        clearTimeout(binding.timer);
+        binding.timer = null;
+        binding.pendingCall = null;
+        binding.latestCall = null;
     }
 };
 
 
 window.addEventListener("pywebviewready", () => {
-    window.hufpy = new HufPy();
+    // inline shell constructs HufPy while loading
+    if (window.hufpy == undefined) {
+        window.hufpy = new HufPy();
+    }
 });
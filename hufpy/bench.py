@@ -0,0 +1,553 @@
+# -*- coding: utf-8 -*-
+import os, sys, gc, json, time, platform, argparse, subprocess, tracemalloc
+from typing import Dict, List, Any, Callable
+import pandas as pd
+from . import __path__, __version__, _shared
+from .application import Application
+from .transport import HeadlessTransport
+from .widgets import Label, Image, Button, ToggleButton, Tab, TabItem, Table
+from .widgets.inputs import TextInput, NumberInput, CheckBox, ComboBox
+from .widgets.layouts import Frame, ColumnLayout, RowLayout, StackLayout
+from .markup import Template
+
+
+BASELINE_PATH = os.path.join(__path__[0], "assets", "benchmarks", "baseline.json")
+
+# regression thresholds(ratio over baseline), wall time is noisy but traffic is deterministic
+# wall time is compared only on request(check_time), relative to calibration of machine
+TIME_THRESHOLD = 0.5
+TRAFFIC_THRESHOLD = 0.05
+
+# modules which should not be loaded by `import hufpy`(imported on first use)
+LAZY_MODULES = ( "pandas", "numpy" )
+
+_benchmarks:Dict[str, Dict[str, Any]] = {}
+
+
+def benchmark(name:str, ops:int, large:bool = False, memory:bool = False) -> Callable:
+    """
+    register benchmark case
+    case is called with HeadlessTransport to prepare, and returns function to measure
+
+    Parameters
+    ----------
+    name: str, required
+        name of case
+    ops: int, required
+        number of operations in measured function
+    large: bool, default False
+        flag of large case(skipped unless requested)
+    memory: bool, default False
+        flag to record python memory kept by measured function(python_bytes, headless DOM is excluded)
+    """
+    def register(case:Callable[[HeadlessTransport], Callable[[], None]]) -> Callable:
+        _benchmarks[name] = { "case": case, "ops": ops, "large": large, "memory": memory }
+        return case
+
+    return register
+
+def run(names:List[str] = None, repeat:int = 3, large:bool = False) -> Dict[str, Any]:
+    """
+    run benchmark cases on headless transport
+
+    Parameters
+    ----------
+    names: List[str], default None
+        names(or prefixes of names) of cases to run
+        if None, all cases
+    repeat: int, default 3
+        number of repeats per case(best time is recorded)
+    large: bool, default False
+        flag to run large cases
+
+    Return
+    ------
+    results: Dict[str, Any]
+        { "environment": {..., "calibration_seconds"}, "benchmarks": { name: { "seconds", "ops", "ops_per_second", "round_trips", "messages", "payload_bytes"(, "python_bytes") } } }
+    """
+    calibration_seconds = calibrate(repeat)
+    results = {}
+    for name, info in _benchmarks.items():
+        if names is not None and not any([ name == prefix or name.startswith(prefix + ".") for prefix in names ]):
+            continue
+        if info["large"] and not large and names is None:
+            continue
+
+        best = None
+        for _ in range(repeat):
+            transport = Application.init_headless()
+            measure = info["case"](transport)
+            _shared.application_api.drain()
+
+            transport.reset_counters()
+            started_at = time.perf_counter()
+            measure()
+            _shared.application_api.drain()
+            seconds = time.perf_counter() - started_at
+
+            if best is None or seconds < best["seconds"]:
+                best = {
+                    "seconds": seconds,
+                    "ops": info["ops"],
+                    "ops_per_second": info["ops"] / seconds if seconds > 0 else None,
+                    "round_trips": transport.round_trips,
+                    "messages": transport.message_count,
+                    "payload_bytes": transport.payload_bytes
+                }
+
+        if info["memory"]:
+            best["python_bytes"] = _measure_memory(info["case"])
+        results[name] = best
+
+    return {
+        "environment": {
+            "hufpy": __version__,
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "machine": platform.machine(),
+            "calibration_seconds": calibration_seconds
+        },
+        "benchmarks": results
+    }
+
+def calibrate(repeat:int = 3) -> float:
+    """
+    measure fixed python workload(encoding and dict operations like bridge calls) as speed of machine
+    wall times of cases are compared relative to it
+
+    Parameters
+    ----------
+    repeat: int, default 3
+        number of repeats(best time is returned)
+    """
+    best = None
+    for _ in range(max(repeat, 3)):
+        started_at = time.perf_counter()
+        registry = {}
+        for idx in range(20000):
+            message = json.dumps([ "setWidgetAttribute", [ f"h{idx:07x}", "text", idx ] ], separators = ( ",", ":" ))
+            registry[idx] = json.loads(message)
+        seconds = time.perf_counter() - started_at
+        best = seconds if best is None else min(best, seconds)
+
+    return best
+
+def _relative_seconds(result:Dict[str, Any], results:Dict[str, Any]) -> float:
+    calibration_seconds = results["environment"].get("calibration_seconds")
+    return None if not calibration_seconds else result["seconds"] / calibration_seconds
+
+def load_results(path:str = BASELINE_PATH) -> Dict[str, Any]:
+    """
+    load results(or baseline) from json file
+
+    Parameters
+    ----------
+    path: str, default BASELINE_PATH
+        path of json file
+    """
+    with open(path, "r", encoding = "utf-8") as fr:
+        return json.load(fr)
+
+def save_results(results:Dict[str, Any], path:str = BASELINE_PATH):
+    """
+    save results(or baseline) to json file
+
+    Parameters
+    ----------
+    results: Dict[str, Any], required
+        results of run
+    path: str, default BASELINE_PATH
+        path of json file
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+    with open(path, "w", encoding = "utf-8") as fw:
+        json.dump(results, fw, indent = 4)
+
+def compare(results:Dict[str, Any], baseline:Dict[str, Any], time_threshold:float = TIME_THRESHOLD, traffic_threshold:float = TRAFFIC_THRESHOLD, check_time:bool = False) -> List[str]:
+    """
+    compare results with baseline
+
+    Parameters
+    ----------
+    results: Dict[str, Any], required
+        results of run
+    baseline: Dict[str, Any], required
+        stored results to compare
+    time_threshold: float, default TIME_THRESHOLD
+        allowed ratio of wall time over baseline
+    traffic_threshold: float, default TRAFFIC_THRESHOLD
+        allowed ratio of round trips, messages, payload bytes and python bytes over baseline
+    check_time: bool, default False
+        flag to compare wall time(relative to calibration of each run, skipped if baseline has no calibration)
+
+    Return
+    ------
+    regressions: List[str]
+        messages of regressions, empty if no regression
+    """
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+
+        relative, base_relative = _relative_seconds(result, results), _relative_seconds(base, baseline)
+        if check_time and relative is not None and base_relative is not None and relative > base_relative * (1 + time_threshold):
+            regressions.append(f"{name}: relative seconds {base_relative:.2f} -> {relative:.2f}")
+        for key in ( "round_trips", "messages", "payload_bytes", "python_bytes" ):
+            if key in result.keys() and key in base.keys() and result[key] > base[key] * (1 + traffic_threshold):
+                regressions.append(f"{name}: {key} {base[key]} -> {result[key]}")
+
+    return regressions
+
+def format_results(results:Dict[str, Any], baseline:Dict[str, Any] = None) -> str:
+    """
+    format results as text table
+
+    Parameters
+    ----------
+    results: Dict[str, Any], required
+        results of run
+    baseline: Dict[str, Any], default None
+        stored results to show ratio of wall time(relative to calibration of each run)
+    """
+    lines = [ f"{'benchmark':<32} {'seconds':>10} {'ops/s':>12} {'trips':>8} {'bytes':>12} {'memory':>10} {'ratio':>7}" ]
+    for name, result in results["benchmarks"].items():
+        base = None if baseline is None else baseline["benchmarks"].get(name)
+        relative = _relative_seconds(result, results)
+        base_relative = None if base is None else _relative_seconds(base, baseline)
+        ratio = "" if relative is None or not base_relative else f"{relative / base_relative:.2f}"
+        lines.append(f"{name:<32} {result['seconds']:>10.4f} {result['ops_per_second'] or 0:>12.1f} {result['round_trips']:>8} {result['payload_bytes']:>12} {result.get('python_bytes', ''):>10} {ratio:>7}")
+
+    return "\n".join(lines)
+
+def _measure_memory(case:Callable[[HeadlessTransport], Callable[[], None]]) -> int:
+    # bytes allocated by measured function and still alive(widgets are kept by their parents)
+    Application.init_headless()
+    measure = case(_shared.application_api.transport)
+    _shared.application_api.drain()
+
+    excludes = [ tracemalloc.Filter(False, os.path.join(__path__[0], "transport.py")), tracemalloc.Filter(False, json.decoder.__file__) ]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(excludes)
+        measure()
+        _shared.application_api.drain()
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(excludes)
+    finally:
+        tracemalloc.stop()
+
+    return sum([ stat.size_diff for stat in after.compare_to(before, "filename") ])
+
+def main(argv:List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog = "hufpy bench", description = "run hufpy benchmarks on headless transport")
+    parser.add_argument("names", nargs = "*", help = "names(or prefixes) of benchmarks")
+    parser.add_argument("--repeat", type = int, default = 3, help = "repeats per benchmark(best is recorded)")
+    parser.add_argument("--large", action = "store_true", help = "run large benchmarks(1M cells)")
+    parser.add_argument("--output", default = None, help = "path to write results json")
+    parser.add_argument("--baseline", default = BASELINE_PATH, help = "path of baseline json")
+    parser.add_argument("--update-baseline", action = "store_true", help = "write results to baseline")
+    parser.add_argument("--check-time", action = "store_true", help = "fail on wall time regressions too(relative to calibration)")
+    args = parser.parse_args(argv)
+
+    results = run(args.names or None, args.repeat, args.large)
+    baseline = load_results(args.baseline) if os.path.exists(args.baseline) else None
+    print(format_results(results, baseline))
+
+    if args.output:
+        save_results(results, args.output)
+    if args.update_baseline:
+        if baseline is not None:
+            # keep cases not run this time
+            baseline["benchmarks"].update(results["benchmarks"])
+            results = { "environment": results["environment"], "benchmarks": baseline["benchmarks"] }
+        save_results(results, args.baseline)
+        return 0
+
+    regressions = [] if baseline is None else compare(results, baseline, check_time = args.check_time)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if len(regressions) > 0 else 0
+
+
+# cases
+def _root() -> ColumnLayout:
+    return ColumnLayout(None)
+
+def _frame(rows:int, columns:int = 10) -> pd.DataFrame:
+    return pd.DataFrame({ f"column{cidx}": [ f"{cidx}-{ridx}" if cidx % 2 else ridx for ridx in range(rows) ] for cidx in range(columns) })
+
+def _register_create(widget_class:type, count:int = 200):
+    @benchmark(f"create.{widget_class.__name__}", count, memory = True)
+    def case(transport:HeadlessTransport) -> Callable[[], None]:
+        root = _root()
+
+        def measure():
+            for _ in range(count):
+                widget_class(root)
+
+        return measure
+
+for _widget_class in ( Label, Image, Button, ToggleButton, TextInput, NumberInput, CheckBox, ComboBox, Frame, ColumnLayout, RowLayout ):
+    _register_create(_widget_class)
+
+@benchmark("create.deferred_tree", 1000)
+def _create_deferred_tree(transport:HeadlessTransport) -> Callable[[], None]:
+    def measure():
+        with Application.batch(), Application.deferred_mount():
+            root = _root()
+            for ridx in range(100):
+                row = RowLayout(root)
+                for _ in range(9):
+                    Label(row)
+
+    return measure
+
+@benchmark("attribute.get", 10000)
+def _attribute_get(transport:HeadlessTransport) -> Callable[[], None]:
+    label = Label(_root())
+    label.text = "text"
+
+    def measure():
+        for _ in range(10000):
+            label.text
+
+    return measure
+
+@benchmark("attribute.set", 10000)
+def _attribute_set(transport:HeadlessTransport) -> Callable[[], None]:
+    label = Label(_root())
+
+    def measure():
+        for idx in range(10000):
+            label.text = str(idx)
+
+    return measure
+
+@benchmark("attribute.set_batch", 10000)
+def _attribute_set_batch(transport:HeadlessTransport) -> Callable[[], None]:
+    label = Label(_root())
+
+    def measure():
+        with Application.batch():
+            for idx in range(10000):
+                label.text = str(idx)
+
+    return measure
+
+@benchmark("attribute.style", 10000)
+def _attribute_style(transport:HeadlessTransport) -> Callable[[], None]:
+    label = Label(_root())
+
+    def measure():
+        for idx in range(10000):
+            label.update_style_property("width", f"{idx}px")
+
+    return measure
+
+def _register_table(cells:int, label:str, large:bool = False):
+    rows = cells // 10
+
+    @benchmark(f"table.from_pandas.{label}", cells, large)
+    def from_pandas(transport:HeadlessTransport) -> Callable[[], None]:
+        root, frame = _root(), _frame(rows)
+
+        def measure():
+            Table.from_pandas(root, frame)
+
+        return measure
+
+    @benchmark(f"table.to_pandas.{label}", cells, large)
+    def to_pandas(transport:HeadlessTransport) -> Callable[[], None]:
+        table = Table.from_pandas(_root(), _frame(rows))
+
+        def measure():
+            table.to_pandas()
+
+        return measure
+
+_register_table(1000, "1k")
+_register_table(100000, "100k")
+_register_table(1000000, "1m", True)
+
+@benchmark("switch.stack", 1000)
+def _switch_stack(transport:HeadlessTransport) -> Callable[[], None]:
+    stack = StackLayout(_root())
+    for _ in range(5):
+        stack.append_child(Frame(stack))
+
+    def measure():
+        for idx in range(1000):
+            stack.current_index = idx % 5
+
+    return measure
+
+@benchmark("switch.tab", 1000)
+def _switch_tab(transport:HeadlessTransport) -> Callable[[], None]:
+    tab = Tab(_root())
+    for idx in range(5):
+        TabItem(tab).title = f"tab{idx}"
+
+    def measure():
+        for idx in range(1000):
+            tab.current_index = idx % 5
+
+    return measure
+
+_DIALOG_MARKUP = """
+<ColumnLayout spacing="5">
+    <Label name="title" text="title"/>
+    <RowLayout>
+        <Label text="name"/>
+        <TextInput name="name_input"/>
+    </RowLayout>
+    <RowLayout>
+        <CheckBox name="agree" text="agree"/>
+        <Button name="ok" text="OK"/>
+        <Button name="cancel" text="Cancel"/>
+    </RowLayout>
+</ColumnLayout>
+"""
+
+@benchmark("markup.instantiate", 100)
+def _markup_instantiate(transport:HeadlessTransport) -> Callable[[], None]:
+    root, template = _root(), Template.from_string(_DIALOG_MARKUP)
+
+    def measure():
+        for _ in range(100):
+            template.instantiate(root)
+
+    return measure
+
+@benchmark("markup.imperative", 100)
+def _markup_imperative(transport:HeadlessTransport) -> Callable[[], None]:
+    # same widgets as markup.instantiate without template
+    root = _root()
+
+    def measure():
+        for _ in range(100):
+            dialog = ColumnLayout(root)
+            dialog.spacing = 5
+            root.append_child(dialog)
+            for texts in ( [ "title" ], [ "name", None ], [ "agree", "OK", "Cancel" ] ):
+                row = dialog if len(texts) == 1 else RowLayout(dialog)
+                if not row is dialog:
+                    dialog.append_child(row)
+                for idx, text in enumerate(texts):
+                    widget = TextInput(row) if text is None else CheckBox(row) if len(texts) == 3 and idx == 0 else Button(row) if len(texts) == 3 else Label(row)
+                    row.append_child(widget)
+                    if text is not None:
+                        widget.text = text
+
+    return measure
+
+def _register_lifecycle(cycles:int, label:str, large:bool = False):
+    @benchmark(f"lifecycle.create_delete.{label}", cycles, large, memory = not large)
+    def case(transport:HeadlessTransport) -> Callable[[], None]:
+        api, dom = _shared.application_api, transport.dom
+        root = _root()
+
+        def registry_sizes() -> Dict[str, int]:
+            gc.collect()
+            return { "widgets": len(api.widgets), "elements": len(dom.widgets), "events": len(dom.events), "styles": len(dom.head_styles), "children": len(root.children) }
+
+        def measure():
+            before = registry_sizes()
+            for _ in range(cycles):
+                layout = ColumnLayout(root)
+                layout.spacing = 5
+                button = Button(layout)
+                button.on_clicked = lambda: None
+                layout.delete()
+            api.drain()
+
+            after = registry_sizes()
+            if after != before:
+                raise RuntimeError(f"registries grow by create/delete cycles: {before} -> {after}")
+
+        return measure
+
+_register_lifecycle(10000, "10k")
+_register_lifecycle(1000000, "1m", True)
+
+@benchmark("import.hufpy", 5)
+def _import_hufpy(transport:HeadlessTransport) -> Callable[[], None]:
+    # fresh interpreter per import, loaded lazy modules fail the case
+    child = f"import sys, hufpy; sys.exit(','.join([ name for name in {LAZY_MODULES!r} if name in sys.modules ]) or None)"
+    paths = [ os.path.dirname(__path__[0]) ] + ( [ os.environ["PYTHONPATH"] ] if os.environ.get("PYTHONPATH") else [] )
+    env = dict(os.environ, PYTHONPATH = os.pathsep.join(paths))
+
+    def measure():
+        for _ in range(5):
+            process = subprocess.run([ sys.executable, "-c", child ], env = env, stderr = subprocess.PIPE, text = True)
+            if process.returncode != 0:
+                raise RuntimeError(f"import hufpy loaded lazy modules: {process.stderr.strip()}")
+
+    return measure
+
+@benchmark("event.dispatch", 2000)
+def _event_dispatch(transport:HeadlessTransport) -> Callable[[], None]:
+    button = Button(_root())
+    button.on_clicked = lambda: None
+
+    def measure():
+        for _ in range(2000):
+            transport.fire_event(button.id, "click")
+
+    return measure
+
+@benchmark("event.dispatch_batch", 2000)
+def _event_dispatch_batch(transport:HeadlessTransport) -> Callable[[], None]:
+    # events of one animation frame go to python in one bridge call(call_python_widget_events), dispatched in order
+    # latest only binding is called twice per frame(first event, then latest one on next frame)
+    layout = ColumnLayout(_root())
+    label = Label(layout)
+    layout.append_child(label)
+    counts = { "latest": 0 }
+    layout.on_clicked = lambda: setattr(label, "text", "clicked")
+    layout.on_latest = lambda: counts.__setitem__("latest", counts["latest"] + 1)
+    layout.bind_command("click", "on_clicked")
+    layout.bind_command("click", "on_latest", latest_only = True)
+
+    def measure():
+        counts["latest"] = 0
+        for _ in range(100):
+            with transport.frame():
+                for _ in range(20):
+                    transport.fire_event(label.id, "click")
+
+        if counts["latest"] != 200:
+            raise RuntimeError(f"latest only binding is called {counts['latest']} times in 100 frames")
+
+    return measure
+
+@benchmark("event.rate", 1000)
+def _event_rate(transport:HeadlessTransport) -> Callable[[], None]:
+    # input events 1ms apart on virtual clock, throttle(50ms) and debounce(100ms) should limit calls to python
+    layout = ColumnLayout(_root())
+    counts = { "plain": 0, "throttled": 0, "debounced": 0 }
+    for name in counts.keys():
+        setattr(layout, f"on_{name}", lambda name = name: counts.__setitem__(name, counts[name] + 1))
+    layout.bind_command("input", "on_plain")
+    layout.bind_command("input", "on_throttled", throttle_ms = 50)
+    layout.bind_command("input", "on_debounced", debounce_ms = 100)
+
+    def measure():
+        for name in counts.keys():
+            counts[name] = 0
+        for _ in range(1000):
+            transport.fire_event(layout.id, "input")
+            transport.advance_time(1)
+        transport.advance_time(1000)
+
+        if counts["plain"] != 1000 or counts["debounced"] != 1 or not 20 <= counts["throttled"] <= 22:
+            raise RuntimeError(f"rate options are not applied: {counts}")
+
+    return measure
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,155 @@
 # -*- coding: utf-8 -*-
+import sys, json, runpy, argparse, cProfile, pstats, subprocess
+from typing import Dict, List, Any
+
+
+def profile(script:str, script_args:List[str] = [], top:int = 15, trace_path:str = None, pstats_path:str = None):
+    """
+    run application with bridge stats and cProfile(main thread), then print report
+    event handlers run in threads of webview, their time is reported by bridge stats(slowest handlers)
+
+    Parameters
+    ----------
+    script: str, required
+        path of application script
+    script_args: List[str], default []
+        arguments of application script
+    top: int, default 15
+        number of rows per section
+    trace_path: str, default None
+        path to write chrome trace of bridge calls and handlers
+    pstats_path: str, default None
+        path to write cProfile stats
+    """
+    from .application import Application
+
+    Application.enable_stats()
+
+    # only one cProfile can be active at once since python 3.12(sys.monitoring), other threads are not profiled
+    main_profile = cProfile.Profile()
+
+    sys.argv = [ script ] + list(script_args)
+    main_profile.enable()
+    try:
+        runpy.run_path(script, run_name = "__main__")
+    finally:
+        main_profile.disable()
+
+    stats = Application.stats()
+    print(f"round trips: {stats['round_trips']}, messages: {stats['messages']}, payload: {stats['payload_bytes']} bytes, bridge time: {stats['seconds'] * 1000:.1f} ms")
+
+    __print_entries("slowest handlers", stats["handlers"], top)
+    __print_entries("busiest widgets", stats["widgets"], top)
+    __print_entries("bridge methods", stats["methods"], top)
+    __print_entries("call sites", stats["sites"], top)
+
+    print("\n== python functions(cumulative) ==")
+    profile_stats = pstats.Stats(main_profile, stream = sys.stdout)
+    profile_stats.sort_stats("cumulative").print_stats(top)
+
+    if trace_path:
+        Application.write_trace(trace_path)
+        print(f"trace written: {trace_path}")
+    if pstats_path:
+        profile_stats.dump_stats(pstats_path)
+        print(f"cProfile stats written: {pstats_path}")
+
+def startup(script:str, script_args:List[str] = [], repeat:int = 1, inline_shell:bool = False) -> List[Dict[str, float]]:
+    """
+    run application in new process until main layout is laid out, then report startup timings
+
+    Parameters
+    ----------
+    script: str, required
+        path of application script
+    script_args: List[str], default []
+        arguments of application script
+    repeat: int, default 1
+        number of runs
+    inline_shell: bool, default False
+        flag to load inlined single html shell(see Application.init)
+
+    Return
+    ------
+    timings: List[Dict[str, float]]
+        milliseconds of import, init, page_load, mount and first_layout per run
+    """
+    # import is measured in fresh interpreter
+    child = (
+        "import sys, time, json, runpy\n"
+        "started_at = time.perf_counter()\n"
+        "from hufpy import Application\n"
+        "imported_at = time.perf_counter()\n"
+        "Application.measure_startup = True\n"
+        f"Application.inline_shell = {bool(inline_shell)}\n"
+        "sys.argv = sys.argv[1:]\n"
+        "runpy.run_path(sys.argv[0], run_name = '__main__')\n"
+        "marks = dict(Application.startup_timings, started = started_at, imported = imported_at)\n"
+        "print('HUFPY_STARTUP ' + json.dumps(marks))\n"
+    )
+
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run([ sys.executable, "-c", child, script ] + list(script_args), stdout = subprocess.PIPE, text = True).stdout
+        lines = [ line for line in output.splitlines() if line.startswith("HUFPY_STARTUP ") ]
+        if len(lines) == 0:
+            raise RuntimeError("application exited before startup is finished(is Application.run called?)")
+
+        marks = json.loads(lines[-1][len("HUFPY_STARTUP "):])
+        step = lambda start, end: None if not start in marks.keys() or not end in marks.keys() else (marks[end] - marks[start]) * 1000
+        results.append({
+            "import": step("started", "imported"),
+            "init": step("init_started", "init_finished"),
+            "page_load": step("init_finished", "window_loaded"),
+            "mount": step("init_finished", "main_layout_mounted"),
+            "first_layout": step("main_layout_mounted", "first_layout"),
+            "total": step("started", "first_layout")
+        })
+
+    print(f"{'step':<14} " + " ".join([ f"{f'run {idx + 1}':>10}" for idx in range(len(results)) ]))
+    for name in results[0].keys():
+        print(f"{name:<14} " + " ".join([ f"{'-' if result[name] is None else f'{result[name]:.1f}ms':>10}" for result in results ]))
+
+    return results
+
+def main(argv:List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog = "hufpy", description = "hufpy command line tools")
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    profile_parser = commands.add_parser("profile", help = "run application with bridge stats and cProfile of main thread")
+    profile_parser.add_argument("--top", type = int, default = 15, help = "rows per section")
+    profile_parser.add_argument("--trace", default = None, help = "path to write chrome trace")
+    profile_parser.add_argument("--pstats", default = None, help = "path to write cProfile stats")
+    profile_parser.add_argument("script", help = "application script")
+    profile_parser.add_argument("args", nargs = argparse.REMAINDER, help = "arguments of application script")
+
+    commands.add_parser("bench", help = "run benchmarks on headless transport(see `hufpy bench -h`)", add_help = False)
+
+    startup_parser = commands.add_parser("startup", help = "report import, init, page load and first layout timings")
+    startup_parser.add_argument("--repeat", type = int, default = 1, help = "number of runs")
+    startup_parser.add_argument("--inline-shell", action = "store_true", help = "load inlined single html shell")
+    startup_parser.add_argument("script", help = "application script")
+    startup_parser.add_argument("args", nargs = argparse.REMAINDER, help = "arguments of application script")
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) > 0 and argv[0] == "bench":
+        # options of bench are parsed by hufpy.bench
+        from . import bench
+        return bench.main(argv[1:])
+
+    args = parser.parse_args(argv)
+    if args.command == "profile":
+        profile(args.script, args.args, args.top, args.trace, args.pstats)
+    elif args.command == "startup":
+        startup(args.script, args.args, args.repeat, args.inline_shell)
+
+    return 0
+
+def __print_entries(title:str, entries:Dict[str, Dict[str, Any]], top:int):
+    print(f"\n== {title} ==")
+    for name, entry in list(entries.items())[:top]:
+        print(f"{entry['count']:>8} calls {entry['bytes']:>10} bytes {entry['seconds'] * 1000:>10.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
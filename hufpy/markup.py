@@ -1 +1,368 @@
 # -*- coding: utf-8 -*-
+import os, re, sys, json, marshal, hashlib
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Any, Type, Tuple
+from . import __version__, _shared
+from .widgets._base import Widget, Layout
+from . import widgets as _widgets
+from .widgets import layouts as _layouts, inputs as _inputs
+
+
+widget_classes:Dict[str, Type[Widget]] = {}
+
+def register_widget(widget_class:Type[Widget], tag_name:str = None):
+    """
+    register widget class to use in markup
+
+    Parameters
+    ----------
+    widget_class: Type[Widget], required
+        class of widget
+    tag_name: str, default None
+        tag name of widget in markup
+        if None, name of class
+    """
+    widget_classes[tag_name if tag_name else widget_class.__name__] = widget_class
+
+for _module in ( _widgets, _layouts, _inputs ):
+    for _name, _value in vars(_module).items():
+        if isinstance(_value, type) and issubclass(_value, Widget) and not _name.startswith("_") and not _value in ( Widget, Layout ):
+            register_widget(_value)
+
+
+def compile_markup(source:str) -> Dict[str, Any]:
+    """
+    compile markup to tree of widget nodes
+
+    <ColumnLayout spacing="5">
+        <Label name="title" text="Hello" style="width: 100px"/>
+        <Button name="ok" text="OK" on_clicked="on_ok"/>
+    </ColumnLayout>
+
+    tag: name of widget class(see register_widget)
+    name: attribute name to bind widget
+    class: class list of widget
+    style: style properties of widget("name: value; ...")
+    on_*: event of widget, bound to method of owner
+    attribute with "-"(data-*, aria-*, ...): attribute of html element
+    others: property of widget("true"/"false" as bool, numbers as int/float)
+
+    Parameters
+    ----------
+    source: str, required
+        markup source(xml)
+
+    Return
+    ------
+    tree: Dict[str, Any]
+        { "tag", "name", "options", "properties", "style", "events", "children" } of root widget
+    """
+    return __compile_element(ET.fromstring(source))
+
+def __compile_element(element:ET.Element) -> Dict[str, Any]:
+    if not element.tag in widget_classes.keys():
+        raise ValueError(f"unknown widget in markup: {element.tag}")
+
+    node = { "tag": element.tag, "name": None, "options": {}, "properties": [], "style": {}, "events": [], "children": [] }
+    attributes = {}
+    for key, value in element.attrib.items():
+        if key == "id":
+            raise ValueError("id cannot be used in markup, template is stamped many times(use name)")
+        elif key == "name":
+            node["name"] = value
+        elif key == "class":
+            node["options"]["class_list"] = value.split()
+        elif key == "style":
+            for item in value.split(";"):
+                if ":" in item:
+                    style_name, style_value = item.split(":", 1)
+                    node["style"][style_name.strip()] = style_value.strip()
+        elif key.startswith("on_"):
+            node["events"].append([ key, value ])
+        elif "-" in key:
+            attributes[key] = __parse_value(value)
+        else:
+            node["properties"].append([ key, __parse_value(value) ])
+
+    if len(attributes) > 0:
+        node["options"]["attributes"] = attributes
+
+    for child in element:
+        node["children"].append(__compile_element(child))
+
+    return node
+
+def __parse_value(value:str) -> Any:
+    if value in ( "true", "false" ):
+        return value == "true"
+    elif re.fullmatch(r"-?\d+", value):
+        return int(value)
+    elif re.fullmatch(r"-?\d+\.\d*", value):
+        return float(value)
+    else:
+        return value
+
+
+def load_cached_tree(cache_path:str, source_hash:str) -> Dict[str, Any]:
+    """
+    load compiled tree from cache file
+
+    Parameters
+    ----------
+    cache_path: str, required
+        path of cache file
+    source_hash: str, required
+        hash of markup source
+
+    Return
+    ------
+    tree: Dict[str, Any]
+        compiled tree, None if cache is not exists or outdated
+    """
+    try:
+        with open(cache_path, "rb") as fr:
+            cached = marshal.loads(fr.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("hash") != source_hash or cached.get("version") != __version__:
+        return None
+
+    return cached["tree"]
+
+def save_cached_tree(cache_path:str, source_hash:str, tree:Dict[str, Any]):
+    """
+    save compiled tree to cache file(errors are ignored like __pycache__)
+
+    Parameters
+    ----------
+    cache_path: str, required
+        path of cache file
+    source_hash: str, required
+        hash of markup source
+    tree: Dict[str, Any], required
+        compiled tree
+    """
+    if sys.dont_write_bytecode:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok = True)
+        # write and rename, other process can read cache at same time
+        temp_path = f"{cache_path}.{os.getpid()}"
+        with open(temp_path, "wb") as fw:
+            fw.write(marshal.dumps({ "hash": source_hash, "version": __version__, "tree": tree }))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+def _cache_name(name:str) -> str:
+    return f"{name}.{sys.implementation.cache_tag}.hufpy-{__version__}.tpl"
+
+def _replace_id_tokens(text:str, lookup:Dict[str, str]) -> str:
+    # ids in encoded messages are json strings("id", "style_id") or selectors of global styles(#id)
+    # other occurrences(text, class names, longer ids) are kept
+    replaced:List[Tuple[int, int, str]] = []
+    for widget_id, token in lookup.items():
+        start = text.find(widget_id)
+        while start >= 0:
+            end = start + len(widget_id)
+            before, after = text[start - 1:start], text[end:end + 1]
+            if before == "#" and not (after.isalnum() or after in ( "-", "_" )):
+                replaced.append(( start, end, token ))
+            elif after == '"' and (( before == '"' and text[start - 2:start - 1] != "\\" ) or text[start - 7:start] == '"style_'):
+                replaced.append(( start, end, token ))
+            start = text.find(widget_id, end)
+
+    pieces, position = [], 0
+    for start, end, token in sorted(replaced):
+        pieces.append(text[position:start])
+        pieces.append(token)
+        position = end
+    pieces.append(text[position:])
+
+    return "".join(pieces)
+
+
+class Template:
+    """
+    Markup template class
+    compiled once, widgets are built in python and cloned in webview with single call
+    """
+    __templates:Dict[str, "Template"] = {}
+    # number of different contents registered per template(contents differ by parent or widget state),
+    # over this, widgets are mounted without template
+    max_variants:int = 8
+    # directory to cache compiled templates of from_string(None: not cached)
+    # templates of from_file are cached in __pycache__ next to markup file
+    cache_dir:str = None
+    # messages of handlers which take parent id as second argument
+    __parent_arg_prefixes = ( '["attachWidget",["', '["detachWidget",["', '["setWidgetVisible",["' )
+
+    def __init__(self, source:str, tree:Dict[str, Any] = None):
+        """
+        Parameters
+        ----------
+        source: str, required
+            markup source(see compile_markup)
+        tree: Dict[str, Any], default None
+            compiled tree of source
+            if None, compile source
+        """
+        self.source = source
+        self.id = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+        self.tree = tree if tree else compile_markup(source)
+        self.__variants = set()
+
+    @staticmethod
+    def from_string(source:str, cache_path:str = None) -> "Template":
+        """
+        get template of markup source, same source is compiled once
+        compiled tree is loaded from cache file if source is not changed
+
+        Parameters
+        ----------
+        source: str, required
+            markup source
+        cache_path: str, default None
+            path of cache file
+            if None, file in Template.cache_dir(if set)
+        """
+        template_id = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+        if template_id in Template.__templates.keys():
+            return Template.__templates[template_id]
+
+        if cache_path is None and Template.cache_dir:
+            cache_path = os.path.join(Template.cache_dir, _cache_name(template_id))
+
+        tree = None if cache_path is None else load_cached_tree(cache_path, template_id)
+        if tree is None:
+            tree = compile_markup(source)
+            if cache_path is not None:
+                save_cached_tree(cache_path, template_id, tree)
+
+        Template.__templates[template_id] = Template(source, tree)
+        return Template.__templates[template_id]
+
+    @staticmethod
+    def from_file(path:str) -> "Template":
+        """
+        get template of markup file, same source is compiled once
+        compiled tree is cached in __pycache__ next to markup file
+
+        Parameters
+        ----------
+        path: str, required
+            path of markup file
+        """
+        with open(path, "r", encoding = "utf-8") as fr:
+            source = fr.read()
+
+        directory, name = os.path.split(os.path.abspath(path))
+        return Template.from_string(source, os.path.join(directory, "__pycache__", _cache_name(name)))
+
+    def instantiate(self, parent:Layout = None, owner:Any = None) -> Widget:
+        """
+        build widgets of template and append root to parent
+
+        python widgets are built as usual, webview clones registered template instead of creating widgets one by one
+        (first instance registers template, next instances cost one call)
+
+        Parameters
+        ----------
+        parent: Layout, default None
+            parent of root widget
+            if None, root is main layout
+        owner: Any, default None
+            object to bind named widgets and to find event methods
+            if None, root widget
+
+        Return
+        ------
+        root: Widget
+            root widget of template
+        """
+        if parent is not None and not isinstance(parent, Layout):
+            raise ValueError("parent of template should be Layout")
+
+        api = parent.api if parent else _shared.application_api
+        parent_id = "hufpy-app-container" if parent is None else parent.id
+
+        with api.capture() as record:
+            names:Dict[str, Widget] = {}
+            root = self.__build(self.tree, parent, owner, names)
+            if isinstance(parent, Layout) and not root._get_cached_attribute("data-visible", False):
+                parent.append_child(root)
+
+        for name, widget in names.items():
+            setattr(root if owner is None else owner, name, widget)
+
+        widgets, calls = self.__to_template(record, parent_id, parent is None)
+        template_id = self.id + "_" + hashlib.sha1("\n".join(widgets + calls).encode("utf-8")).hexdigest()[:12]
+        if not template_id in self.__variants and len(self.__variants) >= self.max_variants:
+            api.mount_captured(record)
+            return root
+
+        self.__variants.add(template_id)
+        if not api.has_template(template_id):
+            api.register_template(template_id, widgets, calls)
+        api.stamp_template(template_id, record["widget_ids"], parent_id)
+
+        return root
+
+    def __build(self, node:Dict[str, Any], parent:Layout, owner:Any, names:Dict[str, Widget]) -> Widget:
+        widget:Widget = widget_classes[node["tag"]](parent, **node["options"])
+        if isinstance(parent, Layout) and widget.parent is parent and not widget._get_cached_attribute("data-visible", False):
+            parent.append_child(widget)
+
+        for name, value in node["properties"]:
+            setattr(widget, name, value)
+        if len(node["style"]) > 0:
+            widget.set_style_properties(node["style"])
+        for event_name, method_name in node["events"]:
+            if owner is None and not hasattr(widget, method_name):
+                raise ValueError(f"owner is required to bind {event_name}=\"{method_name}\"")
+            setattr(widget, event_name, getattr(widget if owner is None else owner, method_name))
+        if node["name"]:
+            names[node["name"]] = widget
+
+        # children of TabItem go to its content
+        container = widget.content if isinstance(widget, _widgets.TabItem) else widget
+        for child in node["children"]:
+            self.__build(child, container, owner, names)
+
+        return widget
+
+    def __to_template(self, record:Dict[str, List[str]], parent_id:str, is_main:bool) -> Tuple[List[str], List[str]]:
+        # ids of widgets to $0$, $1$, ... and parent to $parent$
+        # only whole tokens are replaced(text, class and custom ids can contain other ids):
+        # json strings of ids("id", "style_id"), selectors of global styles(#id) and parent arguments
+        lookup = { widget_id: f"${idx}$" for idx, widget_id in enumerate(record["widget_ids"]) }
+        # messages are joined by newline which cannot be in encoded json
+        text = _replace_id_tokens("\n".join(record["widgets"] + record["calls"]), lookup)
+        messages = text.split("\n") if len(text) > 0 else []
+
+        # spec: [ tag, classes, type, id, attributes, parent id, auto attach ], main layout is attached to app container when created
+        encoded_parent_id = json.dumps(parent_id)
+        spec_tails = {
+            f",{encoded_parent_id},false]": ',"$parent$",true]' if is_main else ',"$parent$",false]',
+            f",{encoded_parent_id},true]": ',"$parent$",true]'
+        }
+        widgets = []
+        for widget in messages[:len(record["widgets"])]:
+            for tail, value in spec_tails.items():
+                if widget.endswith(tail):
+                    widget = widget[:-len(tail)] + value
+                    break
+            widgets.append(widget)
+
+        # [ handler, [ widget id, parent id, ... ] ]
+        calls = []
+        for call in messages[len(record["widgets"]):]:
+            if call.startswith(self.__parent_arg_prefixes):
+                parent_at = call.index('",', call.index(',["') + 3) + 2
+                if call.startswith(encoded_parent_id, parent_at) and call[parent_at + len(encoded_parent_id)] in ",]":
+                    call = call[:parent_at] + '"$parent$"' + call[parent_at + len(encoded_parent_id):]
+            calls.append(call)
+
+        return widgets, calls
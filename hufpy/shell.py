@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import os, re, sys, base64, mimetypes, pathlib
+from typing import Dict
+from . import __path__
+
+
+ASSETS_PATH = os.path.join(__path__[0], "assets")
+
+_shells:Dict[str, str] = {}
+
+
+def build_shell(platform:str = sys.platform) -> str:
+    """
+    get single html document of hufpy ui shell, built once per platform and cached in memory
+    styles(common and platform) and hufpy.js are minified and inlined,
+    HufPy is constructed while document is parsed(without waiting pywebviewready)
+
+    Parameters
+    ----------
+    platform: str, default sys.platform
+        platform of styles(assets/styles/{platform}.css)
+
+    Return
+    ------
+    html: str
+        html document to load in window
+    """
+    if not platform in _shells.keys():
+        styles = [ _read_asset("styles", "common.css") ]
+        platform_path = os.path.join(ASSETS_PATH, "styles", f"{platform}.css")
+        if os.path.exists(platform_path):
+            styles.append(_read_asset("styles", f"{platform}.css"))
+
+        style = minify_css(_inline_urls("\n".join(styles), os.path.join(ASSETS_PATH, "styles")))
+        # "</" cannot be in inline script
+        script = minify_js(_read_asset("hufpy.js")).replace("</", "<\\/")
+
+        _shells[platform] = (
+            "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+            "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0, shrink-to-fit=no\">"
+            f"<title>hufpy index html</title><style>{style}</style></head>"
+            "<body><div id=\"hufpy-app-container\"></div><div class=\"hufpy-modal-background\" data-visible=\"false\"></div>"
+            f"<script>{script}\nwindow.hufpy = new HufPy();</script></body></html>"
+        )
+
+    return _shells[platform]
+
+def minify_css(source:str) -> str:
+    """
+    remove comments and whitespaces of css
+
+    Parameters
+    ----------
+    source: str, required
+        css source
+    """
+    source = re.sub(r"/\*.*?\*/", "", source, flags = re.S)
+    source = re.sub(r"\s+", " ", source)
+    # spaces in selectors(descendant, :pseudo) are kept, only around block and declaration separators
+    return re.sub(r"\s*([{};])\s*", r"\1", source).replace(";}", "}").strip()
+
+def minify_js(source:str) -> str:
+    """
+    remove indents, blank lines and comment lines of javascript
+    line breaks are kept(no automatic semicolon insertion issue)
+
+    Parameters
+    ----------
+    source: str, required
+        javascript source
+    """
+    lines = [ line.strip() for line in source.splitlines() ]
+    return "\n".join([ line for line in lines if len(line) > 0 and not line.startswith("//") ])
+
+def _read_asset(*names:str) -> str:
+    with open(os.path.join(ASSETS_PATH, *names), "r", encoding = "utf-8") as fr:
+        return fr.read()
+
+def _inline_urls(style:str, directory:str) -> str:
+    # relative urls(fonts, images) are resolved from stylesheet, document has no base url
+    def inline(match:re.Match) -> str:
+        url = match.group(2)
+        if re.match(r"^[a-z]+:", url):
+            return match.group(0)
+
+        path = os.path.normpath(os.path.join(directory, url))
+        if not os.path.exists(path):
+            return f"url(\"{pathlib.Path(path).as_uri()}\")"
+
+        with open(path, "rb") as fr:
+            data = base64.b64encode(fr.read()).decode("ascii")
+        return f"url(\"data:{mimetypes.guess_type(path)[0] or 'application/octet-stream'};base64,{data}\")"
+
+    return re.sub(r"url\(\s*([\"']?)(.+?)\1\s*\)", inline, style)
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+import os, sys, json, time, threading
+from typing import Dict, List, Any
+from . import __path__
+
+
+class BridgeStats:
+    """
+    Recorder of bridge traffic between ApplicationAPI and webview
+    counts calls, wall time and payload sizes per method, call site and widget
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__started_at = time.perf_counter()
+        self.reset()
+
+    def reset(self):
+        """
+        clear recorded stats and trace events
+        """
+        with self.__lock:
+            self.__round_trips = 0
+            self.__messages = 0
+            self.__payload_bytes = 0
+            self.__seconds = 0.0
+            self.__methods:Dict[str, Dict[str, Any]] = {}
+            self.__sites:Dict[str, Dict[str, Any]] = {}
+            self.__widgets:Dict[str, Dict[str, Any]] = {}
+            self.__handlers:Dict[str, Dict[str, Any]] = {}
+            self.__trace_events:List[Dict[str, Any]] = []
+
+    def record_message(self, method:str, args:List[Any], size:int):
+        """
+        record message encoded to send
+
+        Parameters
+        ----------
+        method: str, required
+            handler name of hufpy.js
+        args: List[Any], required
+            arguments of message(widget id is first argument, or fourth of createWidget)
+        size: int, required
+            size of encoded message
+        """
+        site = self.__find_call_site()
+        widget_idx = 3 if method == "createWidget" else 0
+        widget_id = args[widget_idx] if len(args) > widget_idx and isinstance(args[widget_idx], str) else None
+
+        with self.__lock:
+            self.__add(self.__methods, method, size)
+            self.__add(self.__sites, site, size)
+            if widget_id is not None:
+                self.__add(self.__widgets, widget_id, size)
+
+    def record_dispatch(self, methods:List[str], payload_bytes:int, started_at:float, seconds:float):
+        """
+        record round trip to webview
+
+        Parameters
+        ----------
+        methods: List[str], required
+            handler names of messages in payload
+        payload_bytes: int, required
+            size of payload
+        started_at: float, required
+            time.perf_counter() when dispatch started
+        seconds: float, required
+            wall time of dispatch
+        """
+        with self.__lock:
+            self.__round_trips += 1
+            self.__messages += len(methods)
+            self.__payload_bytes += payload_bytes
+            self.__seconds += seconds
+
+            # wall time of batch is shared by its messages
+            for method in methods:
+                self.__methods.setdefault(method, self.__new_entry())["seconds"] += seconds / len(methods)
+
+            self.__trace_events.append({
+                "name": methods[0] if len(methods) == 1 else f"batch[{len(methods)}]",
+                "cat": "bridge",
+                "ph": "X",
+                "ts": (started_at - self.__started_at) * 1e6,
+                "dur": seconds * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": { "messages": len(methods), "bytes": payload_bytes, "methods": methods[:20] }
+            })
+
+    def record_handler(self, name:str, widget_id:str, started_at:float, seconds:float):
+        """
+        record python event handler called from webview
+
+        Parameters
+        ----------
+        name: str, required
+            name of handler(widget class and event name)
+        widget_id: str, required
+            id of widget handled event
+        started_at: float, required
+            time.perf_counter() when handler started
+        seconds: float, required
+            wall time of handler
+        """
+        with self.__lock:
+            self.__add(self.__handlers, name, 0)["seconds"] += seconds
+            self.__widgets.setdefault(widget_id, self.__new_entry())["seconds"] += seconds
+
+            self.__trace_events.append({
+                "name": name,
+                "cat": "handler",
+                "ph": "X",
+                "ts": (started_at - self.__started_at) * 1e6,
+                "dur": seconds * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": { "widget": widget_id }
+            })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        recorded stats as dict
+
+        Return
+        ------
+        stats: Dict[str, Any]
+            { "round_trips", "messages", "payload_bytes", "seconds", "methods", "sites", "widgets", "handlers" }
+            entries of methods, sites, widgets and handlers are { "count", "bytes", "seconds" }, sorted by seconds or count
+            count and bytes of widget are messages sent to widget, seconds of widget is time of its event handlers
+        """
+        with self.__lock:
+            return {
+                "round_trips": self.__round_trips,
+                "messages": self.__messages,
+                "payload_bytes": self.__payload_bytes,
+                "seconds": self.__seconds,
+                "methods": self.__sorted(self.__methods, "seconds"),
+                "sites": self.__sorted(self.__sites, "count"),
+                "widgets": self.__sorted(self.__widgets, "count"),
+                "handlers": self.__sorted(self.__handlers, "seconds")
+            }
+
+    def write_trace(self, path:str):
+        """
+        write recorded round trips and handlers as chrome trace format(chrome://tracing, perfetto)
+
+        Parameters
+        ----------
+        path: str, required
+            path of json file
+        """
+        with self.__lock:
+            events = list(self.__trace_events)
+
+        with open(path, "w", encoding = "utf-8") as fw:
+            json.dump({ "traceEvents": events, "displayTimeUnit": "ms" }, fw)
+
+    def __new_entry(self) -> Dict[str, Any]:
+        return { "count": 0, "bytes": 0, "seconds": 0.0 }
+
+    def __add(self, entries:Dict[str, Dict[str, Any]], key:str, size:int) -> Dict[str, Any]:
+        entry = entries.setdefault(key, self.__new_entry())
+        entry["count"] += 1
+        entry["bytes"] += size
+
+        return entry
+
+    def __sorted(self, entries:Dict[str, Dict[str, Any]], key:str) -> Dict[str, Dict[str, Any]]:
+        return { name: dict(entry) for name, entry in sorted(entries.items(), key = lambda item: item[1][key], reverse = True) }
+
+    def __find_call_site(self) -> str:
+        # first frame outside of hufpy package
+        frame = sys._getframe(2)
+        while frame is not None and frame.f_code.co_filename.startswith(__path__[0]):
+            frame = frame.f_back
+
+        if frame is None:
+            return "<hufpy>"
+
+        return f"{frame.f_code.co_filename}:{frame.f_lineno}"
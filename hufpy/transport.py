@@ -0,0 +1,873 @@
+# -*- coding: utf-8 -*-
+import re, json
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Iterator
+import hufpy
+from . import _shared
+
+
+class Transport(ABC):
+    """
+    Base transport class of hufpy system
+    sends messages of ApplicationAPI to webview(or other backend) and counts traffic
+    """
+    def __init__(self):
+        self.round_trips = 0
+        self.message_count = 0
+        self.payload_bytes = 0
+
+    def dispatch(self, messages:List[str]) -> Dict[str, Any]:
+        """
+        send encoded messages at once
+
+        Parameters
+        ----------
+        messages: List[str], required
+            json encoded messages([ handler name, arguments ])
+
+        Return
+        ------
+        result: Dict[str, Any]
+            { "state": "success", "value": result of last message } or { "state": "fail", "message": reason }
+        """
+        payload = "[" + ",".join(messages) + "]"
+
+        self.round_trips += 1
+        self.message_count += len(messages)
+        self.payload_bytes += len(payload.encode("utf-8"))
+
+        return self._send(payload)
+
+    def reset_counters(self):
+        """
+        reset round trip, message and payload counters
+        """
+        self.round_trips = 0
+        self.message_count = 0
+        self.payload_bytes = 0
+
+    @abstractmethod
+    def _send(self, payload:str) -> Dict[str, Any]:
+        """
+        send payload(json array of messages) to backend
+
+        Parameters
+        ----------
+        payload: str, required
+            json encoded array of messages
+
+        Return
+        ------
+        result: Dict[str, Any]
+            { "state": "success", "value": result of last message } or { "state": "fail", "message": reason }
+        """
+
+class WebviewTransport(Transport):
+    """
+    Transport to hufpy.js in pywebview window
+    """
+    def __init__(self, window:"webview.Window"):
+        """
+        Parameters
+        ----------
+        window: webview.Window, required
+            window which hufpy.js is loaded
+        """
+        super().__init__()
+        self.window = window
+
+    def _send(self, payload:str) -> Dict[str, Any]:
+        return self.window.evaluate_js(f"window.hufpy.dispatch({json.dumps(payload)});")
+
+
+class HeadlessElement:
+    """
+    element of HeadlessDOM
+    """
+    __slots__ = ( "tag_name", "id", "text", "value", "checked", "children", "parent", "__class_list", "__attributes", "__attribute_types", "__style", "__properties" )
+
+    def __init__(self, tag_name:str, id:str = ""):
+        self.tag_name = tag_name.lower()
+        self.id = id
+        self.text = ""
+        self.value = ""
+        self.checked = False
+        self.children:List["HeadlessElement"] = []
+        self.parent:"HeadlessElement" = None
+
+        # containers are created at first access(most of elements are cells of table)
+        self.__class_list:List[str] = None
+        self.__attributes:Dict[str, str] = None
+        self.__attribute_types:Dict[str, str] = None
+        self.__style:Dict[str, str] = None
+        self.__properties:Dict[str, Any] = None
+
+    @property
+    def class_list(self) -> List[str]:
+        if self.__class_list is None:
+            self.__class_list = []
+        return self.__class_list
+
+    @class_list.setter
+    def class_list(self, new_class_list:List[str]):
+        self.__class_list = new_class_list
+
+    @property
+    def attributes(self) -> Dict[str, str]:
+        if self.__attributes is None:
+            self.__attributes = {}
+        return self.__attributes
+
+    @property
+    def attribute_types(self) -> Dict[str, str]:
+        if self.__attribute_types is None:
+            self.__attribute_types = {}
+        return self.__attribute_types
+
+    @property
+    def style(self) -> Dict[str, str]:
+        if self.__style is None:
+            self.__style = {}
+        return self.__style
+
+    @style.setter
+    def style(self, new_style:Dict[str, str]):
+        self.__style = new_style
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        if self.__properties is None:
+            self.__properties = { "scrollTop": 0, "scrollLeft": 0, "clientWidth": 0, "clientHeight": 0 }
+        return self.__properties
+
+    def __repr__(self) -> str:
+        return f'<{self.tag_name} id="{self.id}">'
+
+    def append_child(self, child:"HeadlessElement", index:int = None):
+        child.remove()
+        if index is None or index >= len(self.children):
+            self.children.append(child)
+        else:
+            self.children.insert(index, child)
+        child.parent = self
+
+    def remove(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    def clone(self) -> "HeadlessElement":
+        # deep copy without parent(same as cloneNode(true), properties are kept)
+        element = HeadlessElement(self.tag_name, self.id)
+        element.text, element.value, element.checked = self.text, self.value, self.checked
+        element.__class_list = None if self.__class_list is None else list(self.__class_list)
+        element.__attributes = None if self.__attributes is None else dict(self.__attributes)
+        element.__attribute_types = None if self.__attribute_types is None else dict(self.__attribute_types)
+        element.__style = None if self.__style is None else dict(self.__style)
+        for child in self.children:
+            child_clone = child.clone()
+            child_clone.parent = element
+            element.children.append(child_clone)
+
+        return element
+
+    def walk(self) -> List["HeadlessElement"]:
+        # self and descendants in document order
+        elements = [ self ]
+        for child in self.children:
+            elements.extend(child.walk())
+
+        return elements
+
+    def closest(self, tag_name:str) -> "HeadlessElement":
+        element = self
+        while element is not None and element.tag_name != tag_name:
+            element = element.parent
+
+        return element
+
+    def contains(self, other:"HeadlessElement") -> bool:
+        while other is not None:
+            if other is self:
+                return True
+            other = other.parent
+
+        return False
+
+    def query(self, predicate:Callable[["HeadlessElement"], bool]) -> "HeadlessElement":
+        for child in self.children:
+            if predicate(child):
+                return child
+
+            found = child.query(predicate)
+            if found is not None:
+                return found
+
+        return None
+
+    @property
+    def text_content(self) -> str:
+        return self.text + "".join([ child.text_content for child in self.children ])
+
+    @property
+    def rows(self) -> List["HeadlessElement"]:
+        return [ child for child in self.children if child.tag_name == "tr" ]
+
+    @property
+    def cells(self) -> List["HeadlessElement"]:
+        return [ child for child in self.children if child.tag_name in ( "td", "th" ) ]
+
+class HeadlessDOM:
+    """
+    pure python model of document, implements operations of hufpy.js
+    """
+    __compound_sub_names = set(
+        [ f"border-{sub_name}" for sub_name in ( "width", "style", "color", "radius" ) ] +
+        [ f"{name}-{sub_name}" for name in ( "margin", "padding" ) for sub_name in ( "left", "right", "top", "bottom" ) ]
+    )
+    # events routed to target only(ev.bubbles is false)
+    __non_bubbling_events = set([ "focus", "blur", "scroll", "mouseenter", "mouseleave", "load", "error", "resize" ])
+
+    def __init__(self):
+        self.body = HeadlessElement("body", "body")
+        self.app_container = HeadlessElement("div", "hufpy-app-container")
+        self.body.append_child(self.app_container)
+        self.head_styles:Dict[str, str] = {}
+
+        self.widgets:Dict[str, HeadlessElement] = { "hufpy-app-container": self.app_container }
+        self.events:Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        # virtual clock(ms) and timers of rate limited bindings([ due, sequence, callback ]), see advance_time
+        self.clock = 0.0
+        self.timers:List[list] = []
+        # calls of current frame([ call, binding ]), sent to python as one call by flush_events(same as $queueEvent)
+        self.event_batch:List[list] = []
+        self.__event_sequence = 0
+        self.__timer_sequence = 0
+        self.mounting:Dict[str, Any] = None
+        self.templates:Dict[str, Dict[str, Any]] = {}
+
+        self.handlers:Dict[str, Callable] = {
+            "addGlobalCss": self.add_global_css,
+            "deleteGlobalCss": self.delete_global_css,
+            "createWidget": self.create_widget,
+            "removeWidget": self.remove_widget,
+            "getWidgetAttribute": self.get_widget_attribute,
+            "setWidgetAttribute": self.set_widget_attribute,
+            "updateWidgetStyle": self.update_widget_style,
+            "removeWidgetAttribute": self.remove_widget_attribute,
+            "widgetAttributeExists": self.widget_attribute_exists,
+            "addWidgetClass": self.add_widget_class,
+            "removeWidgetClass": self.remove_widget_class,
+            "setModalBackgroundVisible": self.set_modal_background_visible,
+            "attachWidget": self.attach_widget,
+            "detachWidget": self.detach_widget,
+            "setWidgetVisible": self.set_widget_visible,
+            "bindWidgetEvent": self.bind_widget_event,
+            "mountTree": self.mount_tree,
+            "setTableColumns": self.set_table_columns,
+            "setTableRows": self.set_table_rows,
+            "setTableData": self.set_table_data,
+            "getTableCells": self.get_table_cells,
+            "patchTableData": self.patch_table_data,
+            "appendTableRows": self.append_table_rows,
+            "registerTemplate": self.register_template,
+            "stampTemplate": self.stamp_template
+        }
+
+    def dispatch(self, messages:List[list]) -> Dict[str, Any]:
+        # same as hufpy.js, failed message does not stop next messages
+        value = None
+        errors = []
+        for handler_name, args in messages:
+            value = self.__apply_message(handler_name, args, errors)
+
+        if len(errors) > 0:
+            return { "state": "fail", "message": "\n".join(errors) }
+
+        return { "state": "success", "value": value }
+
+    def __apply_message(self, handler_name:str, args:list, errors:List[str]) -> Any:
+        if not handler_name in self.handlers.keys():
+            errors.append(f"unknown handler: {handler_name}")
+            return None
+
+        try:
+            value = self.handlers[handler_name](*args)
+        except ( KeyError, IndexError, AttributeError, TypeError, ValueError ) as e:
+            errors.append(f"{handler_name}: {e.__class__.__name__}: {e}")
+            return None
+
+        if isinstance(value, dict) and value.get("state") == "fail":
+            errors.append(value["message"])
+            return None
+
+        return value
+
+
+    def add_global_css(self, style_id:str, style_content:str):
+        self.head_styles[style_id] = style_content
+
+    def delete_global_css(self, style_id:str):
+        self.head_styles.pop(style_id, None)
+
+    def create_widget(self, tag_name:str, widget_class:str, widget_type:str, widget_id:str, attributes:dict, parent_id:str = "hufpy-app-container", auto_attach:bool = False) -> Dict[str, Any]:
+        parent = self.__get_parent(parent_id)
+        if parent is None:
+            return { "state": "fail", "message": "unknown parent!" }
+
+        if widget_type == "widget" and parent_id == "hufpy-app-container":
+            return { "state": "fail", "message": "`Widget` cannot be deployed without `Layout`!" }
+
+        element = HeadlessElement(tag_name, widget_id)
+        element.class_list = widget_class.split()
+        for key, value in attributes.items():
+            self.__set_attribute(element, key, value)
+
+        if widget_type == "layout" and parent_id == "hufpy-app-container":
+            element.style.update({ "width": "100%", "height": "100%" })
+
+        self.widgets[widget_id] = element
+        if parent_id in ( "body", "hufpy-app-container" ) or auto_attach:
+            self.__get_mount_target(widget_id, parent_id, parent).append_child(element)
+
+        return { "state": "success" }
+
+    def remove_widget(self, widget_id:str, descendant_ids:List[str] = []):
+        element = self.widgets.get(widget_id)
+        for removed_id in [ widget_id ] + descendant_ids:
+            self.widgets.pop(removed_id, None)
+            for bindings in self.events.pop(removed_id, {}).values():
+                for binding in bindings.values():
+                    self.__clear_binding(binding)
+            self.head_styles.pop(f"style_{removed_id}", None)
+
+        if element is not None:
+            element.remove()
+
+    def get_widget_attribute(self, widget_id:str, attribute_name:str) -> Any:
+        return self.__get_attribute(self.widgets[widget_id], attribute_name)
+
+    def set_widget_attribute(self, widget_id:str, attribute_name:str, attribute_value:Any):
+        self.__set_attribute(self.widgets[widget_id], attribute_name, attribute_value)
+
+    def update_widget_style(self, widget_id:str, properties:Dict[str, Any], remove_names:List[str] = []):
+        element = self.widgets[widget_id]
+        for name in remove_names:
+            self.__set_style_property(element, name, "")
+        for name, value in properties.items():
+            self.__set_style_property(element, name, value)
+
+    def remove_widget_attribute(self, widget_id:str, attribute_name:str):
+        self.widgets[widget_id].attributes.pop(attribute_name, None)
+
+    def widget_attribute_exists(self, widget_id:str, attribute_name:str) -> bool:
+        return attribute_name in self.widgets[widget_id].attributes.keys()
+
+    def add_widget_class(self, widget_id:str, class_name:str):
+        if not class_name in self.widgets[widget_id].class_list:
+            self.widgets[widget_id].class_list.append(class_name)
+
+    def remove_widget_class(self, widget_id:str, class_name:str):
+        if class_name in self.widgets[widget_id].class_list:
+            self.widgets[widget_id].class_list.remove(class_name)
+
+    def set_modal_background_visible(self, container_id:str, visible:bool):
+        container = self.body if container_id == "body" else self.widgets[container_id]
+        background = container.query(lambda element: "hufpy-modal-background" in element.class_list)
+        if background is not None:
+            background.attributes["data-visible"] = "true" if visible else "false"
+
+    def attach_widget(self, widget_id:str, parent_id:str, widget_idx:int = None):
+        # same as $attachWidget of hufpy.js: inserted before child at widget_idx, appended if out of range
+        element = self.widgets[widget_id]
+        parent = self.__get_mount_target(widget_id, parent_id, self.widgets[parent_id])
+        parent.append_child(element, widget_idx)
+        self.__set_attribute(element, "data-visible", True)
+
+    def detach_widget(self, widget_id:str, parent_id:str):
+        element = self.widgets[widget_id]
+        self.__set_attribute(element, "data-visible", False)
+        element.remove()
+
+    def set_widget_visible(self, widget_id:str, parent_id:str, visible:bool, widget_idx:int = None):
+        if visible:
+            self.attach_widget(widget_id, parent_id, widget_idx)
+        else:
+            self.detach_widget(widget_id, parent_id)
+
+    def bind_widget_event(self, widget_id:str, event_name:str, bind_name:str, call_args:List[str] = [], call_widget_id:str = None, options:Dict[str, Any] = None):
+        # same entry as hufpy.js, rate of calls is limited on virtual clock
+        bindings = self.events.setdefault(widget_id, {}).setdefault(event_name, {})
+        if bind_name in bindings.keys():
+            self.__clear_binding(bindings[bind_name])
+
+        options = options or {}
+        bindings[bind_name] = {
+            "call_args": call_args, "call_widget_id": call_widget_id,
+            "throttle_ms": options.get("throttleMs"), "debounce_ms": options.get("debounceMs"), "latest_only": options.get("latestOnly", False),
+            "timer": None, "called_at": None, "pending_call": None, "running": False, "latest_call": None
+        }
+
+    def mount_tree(self, widget_specs:List[list], messages:List[list]) -> Dict[str, Any]:
+        self.mounting = { "widget_ids": set([ spec[3] for spec in widget_specs ]), "fragments": {} }
+        errors = []
+        try:
+            for spec in widget_specs:
+                self.__apply_message("createWidget", spec, errors)
+
+            for handler_name, args in messages:
+                self.__apply_message(handler_name, args, errors)
+
+            for parent_id, fragment in self.mounting["fragments"].items():
+                parent = self.__get_parent(parent_id)
+                for child in list(fragment.children):
+                    parent.append_child(child)
+        finally:
+            self.mounting = None
+
+        if len(errors) > 0:
+            return { "state": "fail", "message": "\n".join(errors) }
+
+        return { "state": "success" }
+
+    def register_template(self, template_id:str, widget_specs:List[list], messages:List[list]) -> Dict[str, Any]:
+        container = HeadlessElement("div")
+        replay = []
+        self.widgets["$parent$"] = container
+        try:
+            for spec in widget_specs:
+                res = self.create_widget(*spec)
+                if res["state"] == "fail":
+                    return res
+
+            for handler_name, args in messages:
+                if handler_name in ( "bindWidgetEvent", "addGlobalCss", "deleteGlobalCss" ):
+                    replay.append([ handler_name, args ])
+                    continue
+
+                res = self.handlers[handler_name](*args)
+                if isinstance(res, dict) and res.get("state") == "fail":
+                    return res
+
+            loose = [ self.widgets[spec[3]] for spec in widget_specs if self.widgets[spec[3]].parent is None ]
+            self.templates[template_id] = { "roots": [ container ] + loose, "replay": json.dumps(replay) }
+        finally:
+            for spec in widget_specs:
+                self.widgets.pop(spec[3], None)
+            self.widgets.pop("$parent$", None)
+
+        return { "state": "success" }
+
+    def stamp_template(self, template_id:str, widget_ids:List[str], parent_id:str) -> Dict[str, Any]:
+        if not template_id in self.templates.keys():
+            return { "state": "fail", "message": f"unknown template: {template_id}" }
+
+        template = self.templates[template_id]
+        parent = self.__get_parent(parent_id)
+        for root_idx, original in enumerate(template["roots"]):
+            clone = original.clone()
+            for element in clone.walk():
+                for name, value in element.attributes.items():
+                    # references to other widgets are whole values, text can contain "$"
+                    reference = re.fullmatch(r"\$(\d+)\$", value)
+                    if reference is not None:
+                        element.attributes[name] = widget_ids[int(reference.group(1))]
+
+                match = re.fullmatch(r"\$(\d+)\$", element.id)
+                if match is not None:
+                    element.id = widget_ids[int(match.group(1))]
+                    self.widgets[element.id] = element
+
+            if root_idx == 0:
+                for child in list(clone.children):
+                    parent.append_child(child)
+
+        replay = re.sub(r"\$(\d+)\$", lambda match: widget_ids[int(match.group(1))], template["replay"]).replace("$parent$", parent_id)
+        for handler_name, args in json.loads(replay):
+            self.handlers[handler_name](*args)
+
+        return { "state": "success" }
+
+    def set_table_columns(self, widget_id:str, columns:List[str]):
+        element = self.widgets[widget_id]
+        table = element.query(lambda child: child.tag_name == "table")
+        if table is None:
+            table = HeadlessElement("table")
+            table.append_child(HeadlessElement("thead"))
+            table.append_child(HeadlessElement("tbody"))
+            element.append_child(table)
+
+        thead, tbody = table.children[0], table.children[1]
+        thead.children, tbody.children = [], []
+        thead.append_child(self.__create_row(columns, "th"))
+
+    def set_table_rows(self, widget_id:str, offset:int, total_height:int, row_height:int, rows:List[List[Any]]):
+        tbody = self.widgets[widget_id].query(lambda child: child.tag_name == "tbody")
+        tbody.children = []
+        tbody.append_child(self.__create_row([ "" ]))
+        for values in rows:
+            tbody.append_child(self.__create_row(values))
+        tbody.append_child(self.__create_row([ "" ]))
+
+    def set_table_data(self, header_id:str, body_id:str, columns:List[str], data:List[List[Any]]):
+        header, body = self.widgets[header_id], self.widgets[body_id]
+        header.children = []
+        header.append_child(self.__create_row(columns, "th"))
+
+        body.children = []
+        for ridx in range(len(data[0]) if len(data) > 0 else 0):
+            body.append_child(self.__create_row([ column[ridx] for column in data ]))
+
+    def get_table_cells(self, body_id:str) -> List[List[Any]]:
+        cells:List[List[Any]] = []
+        for row in self.widgets[body_id].rows:
+            for cidx, cell in enumerate(row.cells):
+                if len(cells) <= cidx:
+                    cells.append([])
+
+                input = cell.query(lambda child: child.tag_name in ( "input", "select" ))
+                cells[cidx].append(cell.text_content if input is None else input.value)
+
+        return cells
+
+    def patch_table_data(self, body_id:str, removed:List[int], inserted:List[list], changed:List[list]):
+        body = self.widgets[body_id]
+        for ridx in removed:
+            body.rows[ridx].remove()
+
+        for ridx, values in inserted:
+            body.append_child(self.__create_row(values), ridx)
+
+        for ridx, cidx, value in changed:
+            body.rows[ridx].cells[cidx].text = "" if value is None else self.__to_js_string(value)
+
+    def append_table_rows(self, body_id:str, rows:List[List[Any]], max_rows:int = None):
+        body = self.widgets[body_id]
+        for values in rows:
+            body.append_child(self.__create_row(values))
+
+        if max_rows is not None and len(body.children) > max_rows:
+            for row in body.children[:len(body.children) - max_rows]:
+                row.parent = None
+            body.children = body.children[len(body.children) - max_rows:]
+
+
+    def fire_event(self, api:"hufpy.application.ApplicationAPI", target_id:str, event_name:str, **properties:Any):
+        """
+        fire event on widget, event bubbles up to ancestors like DOM(except focus, blur, scroll, ...)
+
+        calls of bindings are queued to current frame, python is called by flush_events
+
+        Parameters
+        ----------
+        api: ApplicationAPI, required
+            application api to call python widget event
+        target_id: str, required
+            id of target widget
+        event_name: str, required
+            name of event(click, change, ...)
+        properties: Any
+            values to set to target before event(value, checked, scrollTop, ...)
+        """
+        target = self.widgets[target_id]
+        for name, value in properties.items():
+            if name in target.properties.keys():
+                target.properties[name] = value
+            else:
+                setattr(target, name, value)
+
+        element = target
+        while element is not None:
+            for bind_name, binding in list(self.events.get(element.id, {}).get(event_name, {}).items()):
+                args = [ self.__get_event_arg(element, target, event_name, call_arg) for call_arg in binding["call_args"] ]
+                call = [ element.id if binding["call_widget_id"] is None else binding["call_widget_id"], bind_name, args, element.id ]
+                self.__call_binding(binding, call)
+
+            element = None if event_name in self.__non_bubbling_events else element.parent
+
+    def advance_time(self, api:"hufpy.application.ApplicationAPI", milliseconds:float):
+        """
+        advance virtual clock, delayed calls of throttled and debounced bindings are called when due(one frame per timer)
+
+        Parameters
+        ----------
+        api: ApplicationAPI, required
+            application api to call python widget event
+        milliseconds: float, required
+            time to advance
+        """
+        until = self.clock + milliseconds
+        while True:
+            due = [ timer for timer in self.timers if timer[0] <= until ]
+            if len(due) == 0:
+                break
+
+            timer = min(due)
+            self.timers.remove(timer)
+            self.clock = timer[0]
+            timer[2]()
+            self.flush_events(api)
+
+        self.clock = until
+
+    def flush_events(self, api:"hufpy.application.ApplicationAPI"):
+        """
+        send calls queued during frame to python as one call(call_python_widget_events), until no call is queued
+
+        Parameters
+        ----------
+        api: ApplicationAPI, required
+            application api to call python widget events
+        """
+        while len(self.event_batch) > 0:
+            batch, self.event_batch = self.event_batch, []
+            try:
+                self.__event_sequence += 1
+                api.call_python_widget_events([ call for call, _ in batch ], self.__event_sequence)
+            finally:
+                # latest call of latest only binding goes to next frame
+                for _, binding in batch:
+                    if binding["latest_only"] and binding["running"]:
+                        latest_call = binding["latest_call"]
+                        binding["running"], binding["latest_call"] = False, None
+                        if latest_call is not None:
+                            self.__send_binding(binding, latest_call)
+
+    def __call_binding(self, binding:Dict[str, Any], call:list):
+        # same as $callBinding of hufpy.js
+        if binding["debounce_ms"] is not None:
+            self.__clear_timer(binding)
+
+            def call_debounced():
+                binding["timer"] = None
+                self.__send_binding(binding, call)
+
+            binding["timer"] = self.__set_timeout(call_debounced, binding["debounce_ms"])
+        elif binding["throttle_ms"] is not None:
+            wait = 0 if binding["called_at"] is None else binding["called_at"] + binding["throttle_ms"] - self.clock
+            if wait <= 0 and binding["timer"] is None:
+                binding["called_at"] = self.clock
+                self.__send_binding(binding, call)
+            else:
+                # last event of interval is called at end of interval
+                binding["pending_call"] = call
+                if binding["timer"] is None:
+                    def call_pending():
+                        pending_call = binding["pending_call"]
+                        binding["timer"], binding["pending_call"], binding["called_at"] = None, None, self.clock
+                        self.__send_binding(binding, pending_call)
+
+                    binding["timer"] = self.__set_timeout(call_pending, max(wait, 0))
+        else:
+            self.__send_binding(binding, call)
+
+    def __send_binding(self, binding:Dict[str, Any], call:list):
+        # same as $sendBinding of hufpy.js
+        if binding["latest_only"]:
+            # latest only: one call in python at once, events while running are replaced by newer one
+            if binding["running"]:
+                binding["latest_call"] = call
+                return
+
+            binding["running"] = True
+
+        self.event_batch.append([ call, binding ])
+
+    def __set_timeout(self, callback:Callable, milliseconds:float) -> list:
+        self.__timer_sequence += 1
+        timer = [ self.clock + milliseconds, self.__timer_sequence, callback ]
+        self.timers.append(timer)
+        return timer
+
+    def __clear_timer(self, binding:Dict[str, Any]):
+        if binding["timer"] is not None and binding["timer"] in self.timers:
+            self.timers.remove(binding["timer"])
+        binding["timer"] = None
+
+    def __clear_binding(self, binding:Dict[str, Any]):
+        # delayed calls of removed or rebound binding are canceled
+        self.__clear_timer(binding)
+        binding["pending_call"], binding["latest_call"] = None, None
+
+
+    def __get_parent(self, parent_id:str) -> HeadlessElement:
+        if parent_id.lower() == "body":
+            return self.body
+        else:
+            return self.widgets.get(parent_id)
+
+    def __get_mount_target(self, widget_id:str, parent_id:str, parent:HeadlessElement) -> HeadlessElement:
+        if self.mounting is None or not widget_id in self.mounting["widget_ids"] or parent_id in self.mounting["widget_ids"]:
+            return parent
+
+        return self.mounting["fragments"].setdefault(parent_id, HeadlessElement("#fragment"))
+
+    def __get_event_arg(self, element:HeadlessElement, target:HeadlessElement, event_name:str, call_arg:str) -> Any:
+        if call_arg == "self":
+            return { "$widget": element.id }
+        elif call_arg in ( "ev", "event" ):
+            return { "type": event_name }
+        elif call_arg in ( "rowIndex", "cellIndex" ):
+            cell = target.closest("td")
+            if cell is None or not element.contains(cell):
+                return None
+            elif call_arg == "rowIndex":
+                return cell.parent.parent.rows.index(cell.parent)
+            else:
+                return cell.parent.cells.index(cell)
+        else:
+            return self.__get_attribute(target, call_arg)
+
+    def __create_row(self, values:List[Any], cell_tag_name:str = "td") -> HeadlessElement:
+        row = HeadlessElement("tr")
+        for value in values:
+            cell = HeadlessElement(cell_tag_name)
+            cell.text = "" if value is None else value if value.__class__ is str else self.__to_js_string(value)
+            cell.parent = row
+            row.children.append(cell)
+
+        return row
+
+    def __to_js_string(self, value:Any) -> str:
+        # same as String(value) in javascript
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif value is None:
+            return "null"
+        elif isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        else:
+            return str(value)
+
+    def __get_attribute(self, element:HeadlessElement, name:str) -> Any:
+        if name == "text":
+            return element.text_content
+        elif name == "value":
+            if element.attributes.get("type") in ( "number", "range" ):
+                return None if element.value == "" else float(element.value) if "." in str(element.value) else int(element.value)
+            return element.value
+        elif name == "checked":
+            return element.checked
+        elif name in element.properties.keys():
+            return element.properties[name]
+        elif name == "style":
+            style = {
+                key: value for key, value in element.style.items()
+                if not key in self.__compound_sub_names
+            }
+            style["border"] = { sub_name: self.__parse_px(element.style.get(f"border-{sub_name}", "")) if sub_name in ( "width", "radius" ) else element.style.get(f"border-{sub_name}", "") for sub_name in ( "width", "style", "color", "radius" ) }
+            style["margin"] = { sub_name: self.__parse_px(element.style.get(f"margin-{sub_name}", "")) for sub_name in ( "left", "right", "top", "bottom" ) }
+            style["padding"] = { sub_name: self.__parse_px(element.style.get(f"padding-{sub_name}", "")) for sub_name in ( "left", "right", "top", "bottom" ) }
+            return style
+        else:
+            value = element.attributes.get(name)
+            value_type = element.attribute_types.get(name)
+            if value is None or value_type is None:
+                return value
+            elif value_type == "number":
+                return float(value) if "." in value else int(value)
+            elif value_type == "boolean":
+                return value == "true"
+            return value
+
+    def __parse_px(self, value:str) -> Any:
+        return "" if value == "" else int(float(value[:-2]))
+
+    def __set_attribute(self, element:HeadlessElement, name:str, value:Any):
+        if name == "id":
+            self.widgets.pop(element.id, None)
+            if element.id in self.events.keys():
+                self.events[value] = self.events.pop(element.id)
+            if f"style_{element.id}" in self.head_styles.keys():
+                # selectors of global style follow new id, same as hufpy.js
+                style_content = self.head_styles.pop(f"style_{element.id}")
+                self.head_styles[f"style_{value}"] = re.sub("#" + re.escape(element.id) + r"(?![\w-])", lambda _: f"#{value}", style_content)
+
+            element.id = value
+            self.widgets[value] = element
+        elif name == "text":
+            element.text = self.__to_js_string(value)
+            element.children = []
+        elif name == "value":
+            element.value = self.__to_js_string(value)
+        elif name == "checked":
+            element.checked = bool(value)
+        elif name == "style":
+            element.style = {
+                key: self.__to_js_string(style_value) for key, style_value in value.items()
+                if not key in ( "border", "margin", "padding" )
+            }
+            for compound_name in ( "border", "margin", "padding" ):
+                self.__set_style_property(element, compound_name, value.get(compound_name, ""))
+        else:
+            element.attribute_types[name] = "boolean" if isinstance(value, bool) else "number" if isinstance(value, ( int, float )) else "string"
+            element.attributes[name] = self.__to_js_string(value)
+
+    def __set_style_property(self, element:HeadlessElement, name:str, value:Any):
+        if name in ( "border", "margin", "padding" ):
+            sub_names = ( "width", "style", "color", "radius" ) if name == "border" else ( "left", "right", "top", "bottom" )
+            for sub_name in sub_names:
+                sub_value = "" if value == "" or value is None or value.get(sub_name) is None else value[sub_name]
+                self.__set_style_property(element, f"{name}-{sub_name}", f"{sub_value}px" if isinstance(sub_value, ( int, float )) and not isinstance(sub_value, bool) else sub_value)
+        elif value == "" or value is None:
+            element.style.pop(name, None)
+        else:
+            element.style[name] = self.__to_js_string(value)
+
+class HeadlessTransport(Transport):
+    """
+    Transport to HeadlessDOM, for tests and benchmarks without GUI
+    """
+    def __init__(self):
+        super().__init__()
+        self.dom = HeadlessDOM()
+        self.__frame_depth = 0
+
+    def _send(self, payload:str) -> Dict[str, Any]:
+        return self.dom.dispatch(json.loads(payload))
+
+    def fire_event(self, target_id:str, event_name:str, **properties:Any):
+        """
+        fire event on widget of HeadlessDOM
+
+        Parameters
+        ----------
+        target_id: str, required
+            id of target widget
+        event_name: str, required
+            name of event(click, change, ...)
+        properties: Any
+            values to set to target before event(value, checked, scrollTop, ...)
+        """
+        # queued writes should be applied before event, same as order of webview
+        _shared.application_api.drain()
+        self.dom.fire_event(_shared.application_api, target_id, event_name, **properties)
+        if self.__frame_depth == 0:
+            self.dom.flush_events(_shared.application_api)
+
+    @contextmanager
+    def frame(self) -> Iterator["HeadlessTransport"]:
+        """
+        events fired in frame are sent to python as one call when outermost frame is closed,
+        same as events of one animation frame in webview
+        """
+        self.__frame_depth += 1
+        try:
+            yield self
+        finally:
+            self.__frame_depth -= 1
+            if self.__frame_depth == 0:
+                self.dom.flush_events(_shared.application_api)
+
+    def advance_time(self, milliseconds:float):
+        """
+        advance virtual clock of HeadlessDOM, delayed calls of throttled and debounced bindings are called when due
+
+        Parameters
+        ----------
+        milliseconds: float, required
+            time to advance
+        """
+        _shared.application_api.drain()
+        self.dom.advance_time(_shared.application_api, milliseconds)
@@ -4,12 +4,12 @@ from ._windows import Window, Dialog
 from ._displays import Label, Image
 from ._buttons import Button, ToggleButton
 from ._tab import Tab, TabItem
-from ._table import Table, TableColumn, TableRow, TableItem
+from ._table import Table, TableColumn, TableRow, TableItem, VirtualTable
 
 __all__ = [
     "Window", "Dialog",
     "Label", "Image",
     "Button", "ToggleButton",
     "Tab", "TabItem",
-    "Table", "TableColumn", "TableRow", "TableItem"
+    "Table", "TableColumn", "TableRow", "TableItem", "VirtualTable"
 ]
@@ -1,18 +1,69 @@
 # -*- coding: utf-8 -*-
-import uuid, hufpy, webview
+import copy, itertools, hufpy, webview
 from typing import List, Dict, Any, Literal, Union
 from .. import _shared
 
 
-def create_widget_id(widget_py_class_name:str) -> str:
+# process wide counter of widget ids
+_widget_numbers = itertools.count()
+
+def create_widget_id(widget_py_class_name:str = None) -> str:
     """
     function to generate widget id
+    ids are "h" and at least 7 hex digits of monotonic number(unique in process)
+    after 16^7 ids they get longer and an id can be prefix of other id, ids in messages are replaced as whole tokens(markup)
+
+    Parameters
+    ----------
+    widget_py_class_name: str, default None
+        not used, kept for compatibility
 
     Return
     ------
     id of widget: str
     """
-    return f"{widget_py_class_name.capitalize()}_{uuid.uuid4().hex[:10]}"
+    return f"h{next(_widget_numbers):07x}"
+
+def create_default_style() -> Dict[str, Any]:
+    """
+    function to generate style of widget without inline style
+
+    Return
+    ------
+    style: Dict[str, Any]
+        same form of style returned from webview
+    """
+    return {
+        "border": { "width": "", "style": "", "color": "", "radius": "" },
+        "margin": { "left": "", "right": "", "top": "", "bottom": "" },
+        "padding": { "left": "", "right": "", "top": "", "bottom": "" }
+    }
+
+# style of widgets without style set from python(shared, widgets keep only changed properties)
+_default_style = create_default_style()
+
+def convert_to_dom_value(name:str, value:Any) -> Any:
+    """
+    function to convert python value to value which webview returns for attribute
+
+    Parameters
+    ----------
+    name: str, required
+        attribute name
+    value: Any, required
+        attribute value set from python
+
+    Return
+    ------
+    value: Any
+        value same as webview returns
+    """
+    if name == "text":
+        return str(value)
+    elif name == "checked":
+        return bool(value)
+    else:
+        return value
 
 
 class WidgetClassManager:
@@ -48,8 +99,7 @@ class WidgetClassManager:
         """
         if not class_name in self.__class_list:
             self.__class_list.append(class_name)
-            # self.__api.app_window.evaluate_js(f'document.querySelector("#{self.__widget_id}").classList.add("{self.__class_list}");')
-            self.__api.app_window.evaluate_js(f'window.hufpy.$widgets["{self.__widget_id}"].classList.add("{self.__class_list}");')
+            self.__api.add_widget_class(self.__widget_id, class_name)
 
     def remove(self, class_name:str):
         """
@@ -62,8 +112,7 @@ class WidgetClassManager:
         """
         if class_name in self.__class_list:
             self.__class_list.remove(class_name)
-            # self.__api.app_window.evaluate_js(f'document.querySelector("#{self.__widget_id}").classList.remove("{self.__class_list}");')
-            self.__api.app_window.evaluate_js(f'window.hufpy.$widgets["{self.__widget_id}"].classList.remove("{self.__class_list}");')
+            self.__api.remove_widget_class(self.__widget_id, class_name)
 
 class Body:
     id = "body"
@@ -71,17 +120,18 @@ class Body:
     children:List["Widget"] = []
 
     def show_modal_background(self):
-        self.api.app_window.evaluate_js(f'document.querySelector("body > .hufpy-modal-background").setAttribute("data-visible", "true");')
+        self.api.set_modal_background_visible(self.id, True)
 
     def close_modal_background(self):
-        self.api.app_window.evaluate_js(f'document.querySelector("body > .hufpy-modal-background").setAttribute("data-visible", "false");')
+        self.api.set_modal_background_visible(self.id, False)
 
 class Widget:
     """
     Base Widget class of hufpy system
     """
-    api:"hufpy.application.ApplicationAPI" = None
+    __slots__ = ( "api", "__parent", "__id", "__class_list", "__additional_styles", "__attributes", "__style", "__tracks_user_change", "__user_version", "__weakref__" )
     widget_type:str = "widget"
+    user_attributes:List[str] = [ "value", "checked", "files" ]
 
     def __init__(self, parent:Union["Layout", "hufpy.widgets.Window"], tag_name:str, widget_class_list:List[str] = [], additional_class_list:List[str] = [], widget_id:str = None, widget_attributes:dict = {}, auto_attach:bool = False):
         """
@@ -107,10 +157,20 @@ class Widget:
         """
         self.__parent = parent
         # self.api = parent.api if parent else self.__class__.api if self.__class__.api else None
-        self.api = parent.api if parent else _shared.application_api
-        self.__id = widget_id if widget_id else create_widget_id(self.__class__.__name__)
+        self.api:"hufpy.application.ApplicationAPI" = parent.api if parent else _shared.application_api
+        self.__id = widget_id if widget_id else create_widget_id()
         self.__class_list = list(set(widget_class_list + additional_class_list))
-        self.__additional_styles:Dict[str, Dict[str, str]] = {}
+        self.__additional_styles:Dict[str, Dict[str, str]] = None
+
+        # shadow of attributes set from python(None: removed)
+        self.__attributes:Dict[str, Any] = {}
+        # style properties set from python over _default_style(None: not set)
+        self.__style:Dict[str, Any] = None
+        self.__tracks_user_change = False
+        # event batch(user_change_version of api) in which user_attributes were cached
+        self.__user_version = None
+        for name, value in widget_attributes.items():
+            self._cache_attribute(name, value)
 
         if parent:
             parent.children.append(self)
@@ -132,8 +192,11 @@ class Widget:
     
     @id.setter
     def id(self, new_id:str):
-        self.__id = new_id
+        # webview finds element by old id, then registries(events, global style) follow new id
+        old_id = self.__id
         self.set_attribute("id", new_id)
+        self.__id = new_id
+        self.api.rename_widget(self, old_id)
 
     @property
     def _global_style_id(self) -> str:
@@ -167,14 +230,18 @@ class Widget:
         """
         style of widget
         """
-        return self.get_attribute("style")
+        style = create_default_style()
+        if self.__style is not None:
+            style.update(copy.deepcopy(self.__style))
+
+        return style
     
     @style.setter
     def style(self, new_style:dict):
         self.set_attribute("style", new_style)
 
     def get_additional_style(self, style_type:str, name:str = None) -> Union[Dict[str, str], str]:
-        if style_type in self.__additional_styles.keys():
+        if self.__additional_styles is not None and style_type in self.__additional_styles.keys():
             if name:
                 if name in self.__additional_styles[style_type].keys():
                     return self.__additional_styles[style_type][name]
@@ -186,6 +253,9 @@ class Widget:
             return {}
 
     def set_additional_style(self, style_type:str, style:dict, update_to_html:bool = True):
+        if self.__additional_styles is None:
+            self.__additional_styles = {}
+
         if style_type in self.__additional_styles.keys():
             self.__additional_styles[style_type].update(style)
         else:
@@ -204,7 +274,7 @@ class Widget:
         """
         width of widget
         """
-        return int(self.style.pop("width")[:-2])
+        return int(self.get_style_property("width")[:-2])
 
     @width.setter
     def width(self, new_width:int):
@@ -215,7 +285,7 @@ class Widget:
         """
         height of widget
         """
-        return int(self.style.pop("height")[:-2])
+        return int(self.get_style_property("height")[:-2])
     
     @height.setter
     def height(self, new_height:int):
@@ -226,7 +296,7 @@ class Widget:
         """
         foreground(font color) of widget
         """
-        return self.style.pop("color", "black")
+        return self.get_style_property("color", "black")
     
     @foreground.setter
     def foreground(self, new_foreground:str):
@@ -237,7 +307,7 @@ class Widget:
         """
         background color of widget
         """
-        return self.style.pop("background-color", "white")
+        return self.get_style_property("background-color", "white")
     
     @background.setter
     def background(self, new_background:str):
@@ -245,7 +315,7 @@ class Widget:
 
     @property
     def border(self) -> Dict[str, Any]:
-        return self.style["border"]
+        return self.get_style_property("border")
     
     @border.setter
     def border(self, new_border:Dict[str, Any]):
@@ -257,7 +327,7 @@ class Widget:
 
     @property
     def margin(self) -> Dict[str, int]:
-        return self.style["margin"]
+        return self.get_style_property("margin")
     
     @margin.setter
     def margin(self, new_margin:Dict[str, int]):
@@ -269,7 +339,7 @@ class Widget:
 
     @property
     def padding(self) -> Dict[str, int]:
-        return self.style["padding"]
+        return self.get_style_property("padding")
     
     @padding.setter
     def padding(self, new_padding:Dict[str, int]):
@@ -312,7 +382,7 @@ class Widget:
             set content align to right
         """
         if self.has_style_property("justify-content"):
-            raw_align = self.style["justify-content"]
+            raw_align = self.get_style_property("justify-content")
             if raw_align == "start":
                 return "left"
             elif raw_align == "end":
@@ -352,7 +422,7 @@ class Widget:
             set content align to bottom
         """
         if self.has_style_property("align-items"):
-            raw_align = self.style["align-items"]
+            raw_align = self.get_style_property("align-items")
             if raw_align == "start":
                 return "top"
             elif raw_align == "end":
@@ -399,7 +469,7 @@ class Widget:
     
     @visible.setter
     def visible(self, state:bool):
-        self.set_attribute("data-visible", "true" if state else "false")
+        self.set_attribute("data-visible", state)
         try:
             widget_idx = self.parent.children.index(self)
         except ValueError:
@@ -419,9 +489,7 @@ class Widget:
         value: str, required
             value to update
         """
-        new_style = self.style
-        new_style.update({ name: value })
-        self.style = new_style
+        self.set_style_properties({ name: value })
 
     def remove_style_property(self, name:str):
         """
@@ -432,9 +500,73 @@ class Widget:
         name: str, required
             name of property to remove
         """
-        new_style = self.style
-        new_style.pop(name, None)
-        self.style = new_style
+        self.remove_style_properties([ name ])
+
+    def set_style_properties(self, properties:Dict[str, Any]):
+        """
+        update multiple style properties of widget at once
+        only changed properties are sent to webview
+
+        Parameters
+        ----------
+        properties: Dict[str, Any], required
+            names and values of properties to update
+            border, margin and padding take dict of sub properties
+        """
+        changed = {}
+        for name, value in properties.items():
+            if self.__get_style_value(name) != value:
+                changed[name] = copy.deepcopy(value)
+
+        if len(changed) > 0:
+            if self.__style is None:
+                self.__style = {}
+            self.__style.update(changed)
+            self.api.update_widget_style(self.id, changed)
+
+    def remove_style_properties(self, names:List[str]):
+        """
+        remove multiple style properties of widget at once
+
+        Parameters
+        ----------
+        names: List[str], required
+            names of properties to remove
+            border, margin and padding are reset to default
+        """
+        removed = []
+        for name in names:
+            if self.__style is not None and name in self.__style.keys():
+                # border, margin and padding same as default are not sent
+                if self.__style.pop(name) != _default_style.get(name):
+                    removed.append(name)
+
+        if len(removed) > 0:
+            self.api.update_widget_style(self.id, {}, removed)
+
+    def get_style_property(self, name:str, default:Any = None) -> Any:
+        """
+        get style property of widget
+
+        Parameters
+        ----------
+        name: str, required
+            name of property to get
+        default: Any, default None
+            value to return if property not exists
+
+        Return
+        ------
+        value: Any
+            value of property
+            if width or height is not set from python, get rendered size from webview
+        """
+        if self.has_style_property(name):
+            return copy.deepcopy(self.__get_style_value(name))
+        elif name in ( "width", "height" ):
+            return self.api.get_widget_attribute(self.id, "style").get(name, default)
+        else:
+            return default
 
     def has_style_property(self, name:str) -> bool:
         """
@@ -450,7 +582,7 @@ class Widget:
         state: bool
             state of property exists
         """
-        return name in self.style.keys()
+        return ( self.__style is not None and name in self.__style.keys() ) or name in _default_style.keys()
     
     def get_attribute(self, name:str) -> Any:
         """
@@ -466,7 +598,13 @@ class Widget:
         value: Any
             value of given attribute name
         """
-        return self.api.get_widget_attribute(self.id, name)
+        if name == "style":
+            return self.style
+        elif self.__is_cached(name):
+            return self.__attributes[name]
+
+        else:
+            return self.api.get_widget_attribute(self.id, name)
 
     def set_attribute(self, name:str, value:Any):
         """
@@ -479,6 +617,7 @@ class Widget:
         value: Any, required
             attribute value to set
         """
+        self._cache_attribute(name, value)
         self.api.set_widget_attribute(self.id, name, value)
 
     def remove_attribute(self, name:str):
@@ -490,6 +629,7 @@ class Widget:
         name: str, required
             attribute name to remove
         """
+        self.__attributes[name] = None
         self.api.remove_widget_attribute(self.id, name)
 
     def has_attribute(self, name:str):
@@ -501,18 +641,76 @@ class Widget:
         name: str, required
             attribute name to exists
         """
-        return self.api.widget_attribute_exists(self.id, name)
+        if not name in self.user_attributes and name in self.__attributes.keys():
+            return self.__attributes[name] is not None
+        else:
+            return self.api.widget_attribute_exists(self.id, name)
+
+    def _cache_attribute(self, name:str, value:Any):
+        """
+        store attribute value to shadow of widget without sending to webview
+        """
+        if name == "style":
+            self.__style = copy.deepcopy(value)
+        else:
+            self.__attributes[name] = convert_to_dom_value(name, value)
+            if name in self.user_attributes:
+                self.__user_version = self.__user_change_version
+
+    def __get_style_value(self, name:str) -> Any:
+        if self.__style is not None and name in self.__style.keys():
+            return self.__style[name]
+        else:
+            return _default_style.get(name)
+
+    def _get_cached_attribute(self, name:str, default:Any = None) -> Any:
+        """
+        get attribute value from shadow of widget without reading webview
+        """
+        value = self.__attributes.get(name)
+        return default if value is None else value
+
+    def _invalidate_user_attributes(self):
+        """
+        drop shadow of attributes which user can change(user_attributes)
+        """
+        for name in self.user_attributes:
+            self.__attributes.pop(name, None)
+
+    def _is_user_change_event(self, event_name:str) -> bool:
+        """
+        check event is fired on every change of user_attributes by user
+        change of text and range is fired when committed(blur, release), not while typing or dragging
+        """
+        return event_name == "input" or (event_name == "change" and self.__attributes.get("type") in ( "checkbox", "radio", "file" ))
+
+    @property
+    def __user_change_version(self) -> int:
+        return 0 if self.api is None else self.api.user_change_version
+
+    def __is_cached(self, name:str) -> bool:
+        if not name in self.__attributes.keys():
+            return False
+        elif name in self.user_attributes:
+            # user changes are only noticed through bound events, shadow is valid until next event batch
+            # checked state of radio changes by other radios in group
+            return self.__tracks_user_change and self.__user_version == self.__user_change_version and not (name == "checked" and self.__attributes.get("type") == "radio")
+        else:
+            return True
     
     def delete(self):
         """
-        delete widget from hufpy system
+        delete widget and its children from hufpy system
+        elements, event bindings and global styles are removed in webview
         """
         self.api.remove_widget(self)
-        self.parent.children.remove(self)
+        if self.parent is not None and self in self.parent.children:
+            self.parent.children.remove(self)
 
-    def bind_command(self, event_name:str, bind_name:str, call_args:List[str] = [], call_widget_id:str = None):
+    def bind_command(self, event_name:str, bind_name:str, call_args:List[str] = [], call_widget_id:str = None, throttle_ms:int = None, debounce_ms:int = None, latest_only:bool = False):
         """
         bind command(event) to widget
+        rate of high frequency events(input, scroll, mousemove, ...) can be limited in webview before calling python
 
         Parameters
         ----------
@@ -525,13 +723,35 @@ class Widget:
         call_widget_id: str, default None
             widget id for call function if need
             if caller and reciever widgets are different, need to set
-        """
-        self.api.bind_widget_event(self.id, event_name, bind_name, call_args, call_widget_id)
+        throttle_ms: int, default None
+            call at most once per throttle_ms, last event of interval is called at end of interval
+        debounce_ms: int, default None
+            call once after events stopped for debounce_ms, with last event
+        latest_only: bool, default False
+            while previous call is running in python, keep only latest event and call it after previous call
+        """
+        if throttle_ms is not None and debounce_ms is not None:
+            raise ValueError("throttle_ms and debounce_ms cannot be used together")
+
+        options = {}
+        if throttle_ms is not None:
+            options["throttleMs"] = throttle_ms
+        if debounce_ms is not None:
+            options["debounceMs"] = debounce_ms
+        if latest_only:
+            options["latestOnly"] = True
+
+        # immediate binding of event fired on every user change keeps shadow of user_attributes valid
+        if len(options) == 0 and self._is_user_change_event(event_name):
+            self.__tracks_user_change = True
+        self.api.bind_widget_event(self.id, event_name, bind_name, call_args, call_widget_id, options if len(options) > 0 else None)
 
 class Layout(Widget):
     """
     Layout Widget class
     """
+    # layouts of layouts.py and user views do not define __slots__, named children are bound to them
+    __slots__ = ( "__children", )
     widget_type:str = "layout"
 
     def __init__(self, parent:Union["Layout", "hufpy.widgets.Window", "hufpy.widgets.Dialog"], tag_name:str, widget_class_list:List[str] = [], additional_class_list:List[str] = [], widget_id:str = None, widget_attributes:dict = {}, auto_attach:bool = False):
@@ -584,7 +804,8 @@ class Layout(Widget):
         self.children.append(widget)
 
         if apply_html:
-            self.api.app_window.evaluate_js(f'window.hufpy.$attachWidget("{widget.id}", "{self.id}", "{self.widget_type}");')
+            widget._cache_attribute("data-visible", True)
+            self.api.attach_widget(widget.id, self.id)
 
     def insert_child(self, widget:Union[Widget, "Layout"], index:int):
         """
@@ -598,7 +819,8 @@ class Layout(Widget):
             specific index to insert
         """
         widget.parent.remove_child(widget)
-        self.api.app_window.evaluate_js(f'window.hufpy.$attachWidget("{widget.id}", "{self.id}", "{self.widget_type}" {index});')
+        widget._cache_attribute("data-visible", True)
+        self.api.attach_widget(widget.id, self.id, index)
         self.children.insert(index, widget)
 
     def remove_child(self, child:Union[Widget, "Layout"]):
@@ -610,7 +832,8 @@ class Layout(Widget):
         child: Widget or Layout
             child to remove
         """
-        self.api.app_window.evaluate_js(f'window.hufpy.$detatchWidget("{child.id}", "{self.id}");')
+        child._cache_attribute("data-visible", False)
+        self.api.detach_widget(child.id, self.id)
         if child in self.children:
             self.children.remove(child)
     
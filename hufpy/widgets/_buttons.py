@@ -8,6 +8,8 @@ class Button(Widget):
     """
     Button Widget class
     """
+    __slots__ = ( "__on_click", "__on_doubleclick" )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         Button Widget
@@ -87,6 +89,8 @@ class ToggleButton(Button):
     """
     ToggleButton Widget class
     """
+    __slots__ = ( "__on_toggle", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         ToggleButton Widget
@@ -104,7 +108,7 @@ class ToggleButton(Button):
         """
         super().__init__(parent, id, class_list, attributes)
 
-        self.set_attribute("data-toggled", "false")
+        self.set_attribute("data-toggled", False)
         self.bind_command("click", "on_toggled", [ "data-toggled" ])
         self.__on_toggle = None
 
@@ -8,6 +8,8 @@ class Label(Widget):
     """
     Label Widget class
     """
+    __slots__ = ()
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         Label Widget (uneditable text)
@@ -41,6 +43,8 @@ class Image(Widget):
     """
     Image Widget class
     """
+    __slots__ = ()
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         Widget to show Image
@@ -66,6 +66,8 @@ class TabItem(Layout):
     """
     TabItem Widget class
     """
+    __slots__ = ( "__tab_root", )
+
     def __init__(self, parent:Tab):
         super().__init__(parent.header, "label", [ "hufpy-widget", "hufpy-tab-header" ], auto_attach = True)
 
@@ -103,13 +105,12 @@ class TabItem(Layout):
             except IndexError:
                 pass
 
-            new_content.parent.remove_child(new_content)
-            self.__tab_root.content.insert_child(new_content, self.parent.children.index(self))
+            # parent setter appends content to stack, then it is moved to index of item(appended once)
             new_content.parent = self.__tab_root.content
+            self.__tab_root.content.insert_child(new_content, self.parent.children.index(self))
             new_content.class_list.append("hufpy-tab-content")
 
-        new_content.update_style_property("width", "100%")
-        new_content.update_style_property("height", "100%")
+        new_content.set_style_properties({ "width": "100%", "height": "100%" })
 
         self.__tab_root.current_index = 0
 
@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
-import pandas as pd
-from ast import literal_eval
-from typing import List, Dict, Any, Literal
+import math, queue, threading, time
+from typing import List, Dict, Any, Literal, Iterable, Callable, Union, TYPE_CHECKING
 from types import MethodType
 from ._base import Widget, Layout
 
+# pandas(and numpy) is imported on first use, importing hufpy does not load it
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class TableHeader(Layout):
     """
     Table Header Layout class
     """
+    __slots__ = ()
+
     def __init__(self, parent:"Table", id:str = None, attributes:dict = {}):
         """
         TableHeader (same as thead)
@@ -42,6 +47,8 @@ class TableBody(Layout):
     """
     Table Body Layout class
     """
+    __slots__ = ()
+
     def __init__(self, parent:"Table", id:str = None, attributes:dict = {}):
         """
         TableBody (same as tbody)
@@ -72,32 +79,41 @@ class Table(Layout):
     """
     Table Layout class
     """
-    def __parse_value(self, source:str) -> Any:
-        try:
-            value = float(source)
-            if value == int(value):
-                return int(value)
+    __slots__ = ( "__header", "__body", "__columns", "__dtypes", "__row_count", "__frame", "__on_click", "__on_change" )
+
+    def __parse_column(self, values:List[str], dtype:Any = None) -> "pd.Series":
+        import pandas as pd
+
+        texts = pd.Series(values, dtype = object)
+        if dtype is None or str(dtype) == "object":
+            # infer type of column: numbers, booleans or texts
+            numbers = pd.to_numeric(texts, errors = "coerce")
+            if numbers.notna().all() and len(numbers) > 0:
+                return numbers.astype("int64") if ( numbers == numbers.round() ).all() else numbers
+            elif texts.isin([ "True", "False", "true", "false" ]).all() and len(texts) > 0:
+                return texts.isin([ "True", "true" ])
             else:
-                return value
-        except:
-            pass
-
-        try:
-            return int(source)
-        except:
-            pass
+                return texts
 
         try:
-            return literal_eval(source)
-        except:
-            pass
-
-        try:
-            return eval(source)
-        except:
-            pass
-
-        return source
+            dtype = pd.api.types.pandas_dtype(dtype)
+            # nullable dtypes(Int64, boolean, ...) hold missing values as pd.NA
+            nullable = pd.api.types.is_extension_array_dtype(dtype)
+            if pd.api.types.is_bool_dtype(dtype):
+                if nullable:
+                    return texts.map({ "True": True, "true": True, "False": False, "false": False }).astype(dtype)
+                return texts.isin([ "True", "true" ])
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                return pd.to_datetime(texts.replace("", None)).astype(dtype)
+            elif pd.api.types.is_numeric_dtype(dtype):
+                numbers = pd.to_numeric(texts.replace("", None), errors = "coerce")
+                # numpy integer column can not hold missing values
+                return numbers if numbers.isna().any() and not nullable else numbers.astype(dtype)
+            else:
+                # categories of CategoricalDtype are kept
+                return texts.replace("", None).astype(dtype) if isinstance(dtype, pd.CategoricalDtype) else texts.astype(dtype)
+        except ( TypeError, ValueError ):
+            return texts
 
     def __init__(self, parent:Layout = None, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
@@ -119,6 +135,14 @@ class Table(Layout):
         self.__header = TableHeader(self, self.id + "_header")
         self.__body = TableBody(self, self.id + "_body")
 
+        # index of bulk loaded data(cells are not Widget)
+        self.__columns:List[str] = None
+        # dtypes of source(str or pandas dtype), categories of categorical columns are kept
+        self.__dtypes:List[Any] = None
+        self.__row_count = 0
+        # last DataFrame rendered, for update_from_pandas
+        self.__frame:"pd.DataFrame" = None
+
         self.__on_click, self.__on_change = None, None
 
     @property
@@ -155,15 +179,11 @@ class Table(Layout):
     @on_clicked.setter
     def on_clicked(self, new_callback:MethodType):
         self.__on_click = new_callback
+        # one listener on body for all cells
+        self.body.bind_command("click", "on_clicked", [ "rowIndex", "cellIndex" ], self.id)
 
-    def __on_clicked(self, target_item:Widget):
-        if self.__on_click:
-            ridx, cidx = 0, 0
-            for row_idx, row in enumerate(self.body.children):
-                for child_idx, child in enumerate(row.children):
-                    if child == target_item:
-                        ridx, cidx = row_idx, child_idx
-
+    def __on_clicked(self, ridx:int, cidx:int):
+        if self.__on_click and ridx is not None:
             self.__on_click(ridx, cidx)
 
     @property
@@ -178,19 +198,61 @@ class Table(Layout):
     @on_changed.setter
     def on_changed(self, new_callback:MethodType):
         self.__on_change = new_callback
+        self.body.bind_command("change", "on_changed", [ "rowIndex", "cellIndex", "value" ], self.id)
 
-    def __on_changed(self, target_item:Widget, value:Any):
-        if self.__on_change:
-            ridx, cidx = 0, 0
-            for row_idx, row in enumerate(self.body.children):
-                for child_idx, child in enumerate(row.children):
-                    if child == target_item:
-                        ridx, cidx = row_idx, child_idx
-
+    def __on_changed(self, ridx:int, cidx:int, value:Any):
+        if self.__on_change and ridx is not None:
             self.__on_change(ridx, cidx, value)
     
+    @property
+    def columns(self) -> List[str]:
+        """
+        titles of columns
+        """
+        if self.__columns is None:
+            return [ column.title for column in self.header.children ]
+        else:
+            return list(self.__columns)
+
+    @property
+    def dtypes(self) -> List[str]:
+        """
+        dtypes of columns kept from bulk load
+        None if Table is not bulk loaded
+        """
+        return None if self.__dtypes is None else [ str(dtype) for dtype in self.__dtypes ]
+
+    @property
+    def row_count(self) -> int:
+        """
+        count of rows
+        """
+        return len(self.body.children) if self.__columns is None else self.__row_count
+
+    def load_data(self, columns:List[str], data:List[List[Any]], dtypes:List[Any] = None):
+        """
+        load columnar data to Table at once
+        cells are built in webview without creating Widget per cell
+
+        Parameters
+        ----------
+        columns: List[str], required
+            titles of columns
+        data: List[List[Any]], required
+            values of each column(data[column index][row index])
+        dtypes: List[str | pandas dtype], default None
+            dtype of each column, used to restore values in to_pandas/to_datas
+            if None, "object" for all columns
+        """
+        self.__columns = [ str(column) for column in columns ]
+        self.__dtypes = [ "object" ] * len(self.__columns) if dtypes is None else list(dtypes)
+        self.__row_count = len(data[0]) if len(data) > 0 else 0
+        self.__frame = None
+
+        self.api.set_table_data(self.header.id, self.body.id, self.__columns, data)
+
     @staticmethod
-    def from_pandas(parent:Layout, source:pd.DataFrame) -> "Table":
+    def from_pandas(parent:Layout, source:"pd.DataFrame") -> "Table":
         """
         create Table from pandas.DataFrame
 
@@ -208,23 +270,132 @@ class Table(Layout):
         """
         table = Table(parent)
         if not source.empty:
-            for column in source.columns:
-                tcol = TableColumn(table)
-                tcol.title = column
-                # table.header.append_child(tcol)
+            table.update_from_pandas(source)
 
-            for row in source.values:
-                trow = TableRow(table)
-                for value in row:
-                    titem = TableItem(trow)
-                    titem.text = str(value)
-                    trow.append_child(titem)
+        return table
 
-                # table.body.append_child(trow)
+    @staticmethod
+    def __encode_column(values:"pd.Series") -> List[Any]:
+        import pandas as pd
 
-        return table
+        if pd.api.types.is_bool_dtype(values.dtype) or pd.api.types.is_numeric_dtype(values.dtype):
+            # numbers are sent as json numbers, missing values as null
+            return values.astype(object).where(values.notna(), None).tolist()
+        else:
+            # missing values(None, NaN, NaT) are shown as empty cells
+            return values.astype(str).where(values.notna(), "").tolist()
+
+    def update_from_pandas(self, source:"pd.DataFrame"):
+        """
+        update Table to given pandas.DataFrame
+        compared with last DataFrame rendered(index as key),
+        only deleted rows, inserted rows and changed cells are sent as one patch
+
+        if columns, dtypes(categories) or order of remaining rows are changed, Table is fully reloaded
+
+        Parameters
+        ----------
+        source: pandas.DataFrame, required
+            new source for Table
+        """
+        import numpy as np
+
+        old = self.__frame
+        # columns are taken by position, names can be duplicated
+        # categories are part of dtype(CategoricalDtype), values of different categories are not comparable
+        if old is None or not old.columns.equals(source.columns) or list(old.dtypes) != list(source.dtypes) or not source.index.is_unique or not old.index.is_unique:
+            self.load_data(source.columns.tolist(), [ self.__encode_column(source.iloc[:, cidx]) for cidx in range(len(source.columns)) ], list(source.dtypes))
+            self.__frame = source.copy()
+            return
+
+        kept_old = old.index[old.index.isin(source.index)]
+        kept_new = source.index[source.index.isin(old.index)]
+        if not kept_old.equals(kept_new):
+            # remaining rows are reordered
+            self.__frame = None
+            self.update_from_pandas(source)
+            return
+
+        # positions are applied in order: removes(on old rows), inserts(on final rows), changes(on final rows)
+        removed = np.flatnonzero(~old.index.isin(source.index))[::-1].tolist()
+        inserted_positions = np.flatnonzero(~source.index.isin(old.index))
+        inserted_rows = source.iloc[inserted_positions]
+        inserted_data = [ self.__encode_column(inserted_rows.iloc[:, cidx]) for cidx in range(len(source.columns)) ]
+        inserted = [
+            [ int(position), [ column_data[idx] for column_data in inserted_data ] ]
+            for idx, position in enumerate(inserted_positions)
+        ]
+
+        changed = []
+        if len(kept_new) > 0:
+            old_values, new_values = old.loc[kept_new], source.loc[kept_new]
+            final_positions = source.index.get_indexer(kept_new)
+            for cidx in range(len(source.columns)):
+                old_column, new_column = old_values.iloc[:, cidx], new_values.iloc[:, cidx]
+                # comparison with missing value of nullable dtype(Int64, boolean, ...) is NA, not bool
+                different = old_column.ne(new_column).fillna(True) & ~( old_column.isna() & new_column.isna() )
+                for ridx in np.flatnonzero(different.to_numpy(dtype = bool)):
+                    value = self.__encode_column(new_column.iloc[[ ridx ]])[0]
+                    changed.append([ int(final_positions[ridx]), cidx, value ])
+
+        if len(removed) > 0 or len(inserted) > 0 or len(changed) > 0:
+            self.api.patch_table_data(self.body.id, removed, inserted, changed)
+
+        self.__dtypes = list(source.dtypes)
+        self.__row_count = len(source.index)
+        self.__frame = source.copy()
     
-    def to_pandas(self) -> pd.DataFrame:
+    def stream(self, source:Iterable[Union[List[Any], Dict[str, Any]]], batch_rows:int = 1000, max_rows:int = None) -> "TableStream":
+        """
+        append rows from iterable(generator) to Table in background
+
+        rows are consumed in background thread and appended in batches,
+        at most once per frame(frame_interval of application api)
+        if rows come faster than they are appended, consuming source waits(backpressure)
+
+        Parameters
+        ----------
+        source: Iterable[List[Any] | Dict[str, Any]], required
+            rows to append, list of values or dictionary of column and value
+            if Table has no columns, columns are taken from first row
+        batch_rows: int, default 1000
+            maximum count of rows appended at once
+        max_rows: int, default None
+            maximum count of rows in Table, oldest rows are dropped over it
+            if None, no limit
+
+        Return
+        ------
+        stream: TableStream
+            handle of running stream
+        """
+        if self.__columns is None:
+            # widget rows are kept, following rows are not Widget
+            self.__row_count = len(self.body.children)
+            self.__columns = self.columns
+        self.__frame = None
+
+        def encode_row(row:Union[List[Any], Dict[str, Any]]) -> List[Any]:
+            if len(self.__columns) == 0:
+                self.load_data(list(row.keys()) if isinstance(row, dict) else [ str(idx) for idx in range(len(row)) ], [])
+
+            values = [ row.get(column) for column in self.__columns ] if isinstance(row, dict) else row
+            return [
+                None if value is None or ( isinstance(value, float) and math.isnan(value) ) else
+                value if isinstance(value, ( int, float )) and not isinstance(value, bool) else
+                str(value)
+                for value in values
+            ]
+
+        def append_rows(rows:List[List[Any]]):
+            self.api.append_table_rows(self.body.id, rows, max_rows)
+            self.__row_count += len(rows)
+            if max_rows is not None:
+                self.__row_count = min(self.__row_count, max_rows)
+
+        return TableStream(source, encode_row, append_rows, batch_rows, self.api.frame_interval)
+
+    def to_pandas(self) -> "pd.DataFrame":
         """
         convert pandas.DataFrame from Table
 
@@ -233,21 +404,21 @@ class Table(Layout):
         dataframe: pandas.DataFrame
             converted DataFrame from Table
         """
-        datas = []
-        for row in self.body.children:
-            data_row = []
-            for child in row.children:
-                if isinstance(child, TableItem):
-                    data_row.append(self.__parse_value(child.text))
-                else:
-                    try:
-                        data_row.append(self.__parse_value(child.text))
-                    except:
-                        data_row.append(self.__parse_value(child.value))
+        import pandas as pd
+
+        # all cells are fetched in one call as columns
+        cells = self.api.get_table_cells(self.body.id)
+        columns = self.columns
+        dtypes = self.__dtypes if self.__dtypes is not None else [ None ] * len(columns)
 
-            datas.append(data_row)
+        # columns are built by position, names can be duplicated
+        frame = pd.DataFrame({
+            cidx: self.__parse_column(column_cells, dtype)
+            for cidx, ( column_cells, dtype ) in enumerate(zip(cells, dtypes))
+        }, columns = range(len(columns)))
+        frame.columns = columns
 
-        return pd.DataFrame(datas, columns = [ column.title for column in self.header.children ])
+        return frame
 
     @staticmethod
     def from_datas(parent:Layout, source:List[Dict[str, Any]]):
@@ -268,19 +439,14 @@ class Table(Layout):
         """
         table = Table(parent)
         if len(source) > 0:
-            for column in source[0].keys():
-                tcol = TableColumn(table)
-                tcol.title = column
-                # table.header.append_child(tcol)
-
-            for row in source:
-                trow = TableRow(table)
-                for value in row.values():
-                    titem = TableItem(trow)
-                    titem.text = str(value)
-                    trow.append_child(titem)
+            columns = list(source[0].keys())
+            # missing keys and None are shown as empty cells
+            data = [
+                [ "" if row.get(column) is None else str(row.get(column)) for row in source ]
+                for column in columns
+            ]
 
-                # table.body.append_child(trow)
+            table.load_data(columns, data)
 
         return table
     
@@ -293,26 +459,151 @@ class Table(Layout):
         datas: List[Dict[str, Any]]
             converted data from Table
         """
-        datas = []
-        for row in self.body.children:
-            data_row = {}
-            for column, child in zip(self.header.children, row.children):
-                if isinstance(child, TableItem):
-                    data_row[column.title] = self.__parse_value(child.text)
-                else:
-                    try:
-                        data_row[column.title] = self.__parse_value(child.text)
-                    except:
-                        data_row[column.title] = self.__parse_value(child.value)
+        return self.to_pandas().to_dict("records")
 
-            datas.append(data_row)
+class TableStream:
+    """
+    handle of rows streaming to Table(created from Table.stream)
+    """
+    __end = object()
 
-        return datas
+    def __init__(self, source:Iterable[Any], encode_row:Callable[[Any], List[Any]], append_rows:Callable[[List[List[Any]]], None], batch_rows:int, frame_interval:float):
+        """
+        Parameters
+        ----------
+        source: Iterable[Any], required
+            rows to append
+        encode_row: Callable[[Any], List[Any]], required
+            function to convert row to values sent to webview
+        append_rows: Callable[[List[List[Any]]], None], required
+            function to append batch of rows to Table
+        batch_rows: int, required
+            maximum count of rows appended at once
+        frame_interval: float, required
+            minimum interval between appends(seconds)
+        """
+        self.__source = source
+        self.__encode_row = encode_row
+        self.__append_rows = append_rows
+        self.__batch_rows = max(1, batch_rows)
+        self.__frame_interval = frame_interval
+
+        self.__queue = queue.Queue(maxsize = self.__batch_rows * 2)
+        self.__stop_event = threading.Event()
+        self.__error:Exception = None
+        self.__row_count = 0
+
+        self.__producer = threading.Thread(target = self.__produce, daemon = True)
+        self.__flusher = threading.Thread(target = self.__flush, daemon = True)
+        self.__producer.start()
+        self.__flusher.start()
+
+    @property
+    def running(self) -> bool:
+        """
+        flag of stream is running or not
+        """
+        return self.__flusher.is_alive()
+
+    @property
+    def row_count(self) -> int:
+        """
+        count of rows appended to Table
+        """
+        return self.__row_count
+
+    @property
+    def error(self) -> Exception:
+        """
+        exception raised while consuming source or appending rows
+        """
+        return self.__error
+
+    def stop(self):
+        """
+        stop consuming source, rows not appended yet are dropped
+        """
+        self.__stop_event.set()
+
+    def join(self, timeout:float = None) -> bool:
+        """
+        wait until all rows are appended
+
+        Parameters
+        ----------
+        timeout: float, default None
+            maximum time to wait(seconds)
+
+        Return
+        ------
+        finished: bool
+            False if stream is still running
+        """
+        self.__flusher.join(timeout)
+        return not self.running
+
+    def __put(self, item:Any) -> bool:
+        while not self.__stop_event.is_set():
+            try:
+                self.__queue.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def __produce(self):
+        try:
+            for row in self.__source:
+                if not self.__put(self.__encode_row(row)):
+                    return
+        except Exception as e:
+            self.__error = e
+        finally:
+            self.__put(self.__end)
+
+    def __flush(self):
+        finished = False
+        while not finished and not self.__stop_event.is_set():
+            try:
+                item = self.__queue.get(timeout = 0.1)
+            except queue.Empty:
+                continue
+
+            # coalesce rows which are already queued
+            rows = []
+            while True:
+                if item is self.__end:
+                    finished = True
+                    break
+
+                rows.append(item)
+                if len(rows) >= self.__batch_rows:
+                    break
+
+                try:
+                    item = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if len(rows) > 0:
+                appended_at = time.perf_counter()
+                try:
+                    self.__append_rows(rows)
+                except Exception as e:
+                    self.__error = e
+                    self.__stop_event.set()
+                    return
+
+                self.__row_count += len(rows)
+                self.__stop_event.wait(max(0, appended_at + self.__frame_interval - time.perf_counter()))
 
 class TableColumn(Widget):
     """
     Table Column Widget class
     """
+    __slots__ = ()
+
     def __init__(self, parent:Table, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         TableColumn (same as th)
@@ -375,6 +666,8 @@ class TableRow(Layout):
     """
     Table Row Layout class
     """
+    __slots__ = ( "__table", )
+
     def __init__(self, parent:Table, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         TableRow (same as tr)
@@ -404,27 +697,13 @@ class TableRow(Layout):
         children: List[TableItem]
         """
         return super().children
-    
-    def append_child(self, widget:Widget, apply_html:bool = True):
-        """
-        append widget to layout
-
-        Parameters
-        ----------
-        widget: Widget or Layout, required
-            widget to append
-        apply_html: bool, default True
-            flag to attach element to Layout
-        """
-        widget.bind_command("click", "on_clicked", [ "self" ], self.__table.id)
-        widget.bind_command("change", "on_changed", [ "self", "value" ], self.__table.id)
-
-        super().append_child(widget, apply_html)
 
 class TableItem(Widget):
     """
     Table Item Widget class
     """
+    __slots__ = ()
+
     def __init__(self, parent:TableRow):
         """
         TableItem (same as td)
@@ -475,3 +754,164 @@ class TableItem(Widget):
     @property
     def vertical_align(self):
         raise DeprecationWarning("")
+
+class VirtualTable(Widget):
+    """
+    Virtual scrolling Table Widget class
+    """
+    __slots__ = ( "__row_height", "__overscan", "__source", "__visible_rows", "__rendered_range", "__on_click" )
+    max_scroll_height:int = 10000000
+
+    def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}, row_height:int = 24, overscan:int = 20):
+        """
+        VirtualTable (only visible rows are rendered)
+        source is kept in python, rows around visible area are sent when scrolled
+
+        Parameters
+        ----------
+        parent: Layout, required
+            parent of VirtualTable
+        id: str, default None
+            id of VirtualTable
+        class_list: List[str], default []
+            class list of VirtualTable
+        attributes: dict, default {}
+            attributes of VirtualTable
+        row_height: int, default 24
+            height of each row(px)
+        overscan: int, default 20
+            count of rows rendered above and below visible area
+        """
+        super().__init__(parent, "div", [ "hufpy-widget-no-flex", "hufpy-virtual-table" ], class_list, id, attributes)
+
+        self.__row_height = row_height
+        self.__overscan = overscan
+        self.__source:"pd.DataFrame" = None
+        self.__visible_rows = 50
+        self.__rendered_range = ( 0, 0 )
+
+        # rows are rendered in python, scroll positions passed while rendering are skipped
+        self.bind_command("scroll", "on_scrolled", [ "scrollTop", "clientHeight" ], latest_only = True)
+        self.__on_click = None
+
+    @staticmethod
+    def from_pandas(parent:Layout, source:"pd.DataFrame", row_height:int = 24, overscan:int = 20) -> "VirtualTable":
+        """
+        create VirtualTable from pandas.DataFrame
+
+        Parameters
+        ----------
+        parent: Layout, required
+            parent of generated VirtualTable
+        source: pandas.DataFrame, required
+            source for VirtualTable
+        row_height: int, default 24
+            height of each row(px)
+        overscan: int, default 20
+            count of rows rendered above and below visible area
+
+        Return
+        ------
+        table: VirtualTable
+            generated VirtualTable from source
+        """
+        table = VirtualTable(parent, row_height = row_height, overscan = overscan)
+        table.source = source
+
+        return table
+
+    @property
+    def source(self) -> "pd.DataFrame":
+        """
+        source DataFrame of VirtualTable
+        """
+        return self.__source
+    
+    @source.setter
+    def source(self, new_source:"pd.DataFrame"):
+        self.__source = new_source
+        self.__rendered_range = ( 0, 0 )
+
+        self.api.set_table_columns(self.id, [ str(column) for column in new_source.columns ])
+        self.__render(0, 0)
+
+    @property
+    def row_count(self) -> int:
+        """
+        count of rows in source
+        """
+        return 0 if self.__source is None else len(self.__source.index)
+
+    @property
+    def rendered_range(self) -> tuple:
+        """
+        range of rows rendered in webview(start, end)
+        """
+        return self.__rendered_range
+
+    @property
+    def on_clicked(self) -> MethodType:
+        """
+        clicked event of VirtualTable
+
+        event: MethodType[ridx:int, cidx:int]
+            ridx is index of row in source
+        """
+        return self.__on_clicked
+    
+    @on_clicked.setter
+    def on_clicked(self, new_callback:MethodType):
+        self.__on_click = new_callback
+        self.bind_command("click", "on_clicked", [ "rowIndex", "cellIndex" ])
+
+    def __on_clicked(self, ridx:int, cidx:int):
+        # first row of body is spacer
+        start, end = self.__rendered_range
+        if self.__on_click and ridx is not None and 0 < ridx <= end - start:
+            self.__on_click(start + ridx - 1, cidx)
+
+    @property
+    def on_scrolled(self) -> MethodType:
+        """
+        scrolled event of VirtualTable(cannot set)
+        """
+        return self.__on_scrolled
+
+    def __on_scrolled(self, scroll_top:float, client_height:float):
+        self.__visible_rows = int(client_height // self.__row_height) + 1
+
+        total_height = self.__total_height
+        if total_height < self.row_count * self.__row_height:
+            # compressed positions: scroll range(total - viewport) is mapped to rows above last viewport
+            scroll_range = total_height - client_height
+            rows_range = self.row_count - client_height / self.__row_height
+            position = 0 if scroll_range <= 0 else scroll_top / scroll_range * rows_range
+        else:
+            position = scroll_top / self.__row_height
+
+        self.__render(max(0, min(position, self.row_count - client_height / self.__row_height)), scroll_top)
+
+    @property
+    def __total_height(self) -> int:
+        return min(self.row_count * self.__row_height, self.max_scroll_height)
+
+    def __render(self, position:float, scroll_top:float):
+        # position: index of row at top of viewport, fraction is part of row scrolled out
+        first_row = int(position)
+        start = max(0, first_row - self.__overscan)
+        end = min(self.row_count, first_row + self.__visible_rows + self.__overscan)
+
+        total_height = self.__total_height
+        scaled = total_height < self.row_count * self.__row_height
+        if not scaled and ( start, end ) == self.__rendered_range:
+            return
+
+        if scaled:
+            # rows are placed at scroll position, since row positions are compressed
+            offset = max(0, int(scroll_top - ( position - start ) * self.__row_height))
+        else:
+            offset = start * self.__row_height
+
+        rows = self.__source.iloc[start:end].astype(str).values.tolist()
+        self.api.set_table_rows(self.id, offset, total_height, self.__row_height, rows)
+        self.__rendered_range = ( start, end )
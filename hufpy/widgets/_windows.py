@@ -49,10 +49,9 @@ class Window(ColumnLayout):
         self.__content = Frame(self, f"{self.id}_content", [ "hufpy-window-content" ])
         self.append_child(self.__content)
 
-        modal_background = Widget(self.__content, "div", [ "hufpy-modal-background" ], auto_attach = True)
-        modal_background.set_attribute("data-visible", "false")
-        modal_background.update_style_property("height", "calc(100% - 19px)")
-        modal_background.update_style_property("top", "19px")
+        self.__modal_background = Widget(self.__content, "div", [ "hufpy-modal-background" ], auto_attach = True)
+        self.__modal_background.set_attribute("data-visible", False)
+        self.__modal_background.set_style_properties({ "height": "calc(100% - 19px)", "top": "19px" })
 
         self.width = 600
         self.height = 400
@@ -79,8 +78,7 @@ class Window(ColumnLayout):
             self.__content.remove_child(self.content)
 
         new_content.class_list.append(".hufpy-window-content")
-        new_content.update_style_property("width", "100%")
-        new_content.update_style_property("height", "100%")
+        new_content.set_style_properties({ "width": "100%", "height": "100%" })
 
         new_content.parent.remove_child(new_content)
         self.__content.append_child(new_content)
@@ -91,28 +89,26 @@ class Window(ColumnLayout):
         """
         width of widget
         """
-        return int(self.style.pop("width")[:-2])
+        return int(self.get_style_property("width")[:-2])
     
     @width.setter
     def width(self, new_width:int):
-        self.update_style_property("left", f"calc(50% - {new_width / 2}px)")
-        self.update_style_property("width", f"{new_width}px")
+        self.set_style_properties({ "left": f"calc(50% - {new_width / 2}px)", "width": f"{new_width}px" })
 
     @property
     def height(self) -> int:
         """
         height of widget
         """
-        return int(self.style.pop("height")[:-2])
+        return int(self.get_style_property("height")[:-2])
     
     @height.setter
     def height(self, new_height:int):
-        self.update_style_property("top", f"calc(50% - {new_height / 2}px)")
-        self.update_style_property("height", f"{new_height}px")
+        self.set_style_properties({ "top": f"calc(50% - {new_height / 2}px)", "height": f"{new_height}px" })
 
     @property
     def x(self) -> int:
-        return int(self.style.pop("left", "0px")[:-2])
+        return int(self.get_style_property("left", "0px")[:-2])
     
     @x.setter
     def x(self, new_x:int):
@@ -120,7 +116,7 @@ class Window(ColumnLayout):
 
     @property
     def y(self) -> int:
-        return int(self.style.pop("top", "0px")[:-2])
+        return int(self.get_style_property("top", "0px")[:-2])
     
     @y.setter
     def y(self, new_y:int):
@@ -128,10 +124,13 @@ class Window(ColumnLayout):
 
 
     def show_modal_background(self):
-        self.api.app_window.evaluate_js(f'document.querySelector("#{self.id} .hufpy-modal-background").setAttribute("data-visible", "true");')
+        # data-visible is changed in webview, shadow of background follows it
+        self.api.set_modal_background_visible(self.id, True)
+        self.__modal_background._cache_attribute("data-visible", True)
 
     def close_modal_background(self):
-        self.api.app_window.evaluate_js(f'document.querySelector("#{self.id} .hufpy-modal-background").setAttribute("data-visible", "false");')
+        self.api.set_modal_background_visible(self.id, False)
+        self.__modal_background._cache_attribute("data-visible", False)
 
 
     def show(self):
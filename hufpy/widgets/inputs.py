@@ -12,6 +12,8 @@ class _Input(Widget):
     """
     Base Input Widget class
     """
+    __slots__ = ( "__on_change", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}, auto_attach:bool = False):
         """
         Base Input class
@@ -50,6 +52,8 @@ class TextInput(_Input):
     """
     TextInput Widget class
     """
+    __slots__ = ( "__on_change", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         TextInput Widget (same as <input type="text">)
@@ -151,6 +155,8 @@ class NumberInput(_Input):
     """
     NumberInput Widget class
     """
+    __slots__ = ( "__on_change", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         NumberInput Widget
@@ -241,6 +247,8 @@ class FileInput(_Input):
     """
     FileInput Widget class
     """
+    __slots__ = ( "__on_select", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         FileInput Widget
@@ -497,6 +505,8 @@ class DatePicker(_Input):
     """
     DatePicker Widget class
     """
+    __slots__ = ( "__on_change", )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         DatePicker Widget
@@ -514,7 +524,9 @@ class DatePicker(_Input):
         """
         super().__init__(parent, id, [ "hufpy-date-picker" ] + class_list, attributes)
 
-        self.type = "date"
+        # value of new input is empty, set without reading it back
+        self.set_attribute("type", "date")
+        self.value = datetime.now()
         self.bind_command("change", "on_changed", [ "value" ])
         self.__on_change = None
 
@@ -791,6 +803,8 @@ class ComboBox(Layout):
     """
     ComboBox Widget class
     """
+    __slots__ = ( "__children", "__on_index_change", "__on_text_change" )
+
     def __init__(self, parent:Layout, id:str = None, class_list:List[str] = [], attributes:dict = {}):
         """
         CheckBox Widget
@@ -813,6 +827,10 @@ class ComboBox(Layout):
         self.bind_command("change", "on_text_changed")
         self.__on_index_change, self.__on_text_change = None, None
 
+    def _is_user_change_event(self, event_name:str) -> bool:
+        # change of select is fired on every selection
+        return event_name in ( "input", "change" )
+
     @staticmethod
     def from_list(parent:Layout, items:List[str]) -> "ComboBox":
         """
@@ -914,6 +932,8 @@ class ComboBoxItem(Widget):
     """
     ComboBox Item Widget class
     """
+    __slots__ = ()
+
     def __init__(self, parent:ComboBox):
         """
         ComboBoxItem Widget
@@ -2,6 +2,8 @@
 from typing import List
 from ._base import Widget, Layout
 
+# layouts have no __slots__(views and templates bind named children to them),
+# widgets built on them(CheckBox, Radio, ColorPicker, Range, Tab, Window, Dialog) keep __dict__ too
 
 
 class Frame(Layout):
@@ -78,7 +80,7 @@ class ColumnLayout(Layout):
         attributes: dict, default {}
             attributes of ColumnLayout
         """
-        attributes["data-spacing"] = "0"
+        attributes["data-spacing"] = 0
         super().__init__(parent, "div", [ "hufpy-widget", "huf-column-layout" ], class_list, id, attributes)
 
     @property
@@ -116,7 +118,7 @@ class RowLayout(Layout):
         attributes: dict, default {}
             attributes of RowLayout
         """
-        attributes["data-spacing"] = "0"
+        attributes["data-spacing"] = 0
         super().__init__(parent, "div", [ "hufpy-widget", "huf-row-layout" ], class_list, id, attributes)
 
     @property
@@ -177,8 +179,7 @@ class StackLayout(Layout):
         self.children[new_index].visible = True
 
     def append_child(self, widget:Layout, apply_html:bool = True):
-        widget.update_style_property("width", "100%")
-        widget.update_style_property("height", "100%")
+        widget.set_style_properties({ "width": "100%", "height": "100%" })
 
         super().append_child(widget, apply_html)
 
@@ -186,6 +187,8 @@ class Spacer(Widget):
     """
     Spacer (Expander)
     """
+    __slots__ = ()
+
     def __init__(self, parent:Layout):
         """
         Spacer Widget (same as Expander)
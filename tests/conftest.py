@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import pytest
+from hufpy.application import Application
+from hufpy.transport import HeadlessTransport
+
+
+@pytest.fixture
+def transport() -> HeadlessTransport:
+    # widgets are built on HeadlessDOM, no webview is needed
+    return Application.init_headless()
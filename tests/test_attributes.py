@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from hufpy import _shared
+from hufpy.widgets import Window
+from hufpy.widgets.inputs import TextInput
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def test_user_attributes_are_cached_until_next_event_batch(transport):
+    root = ColumnLayout(None)
+    text_input = TextInput(root)
+    root.append_child(text_input)
+    root.on_typed = lambda: None
+    text_input.bind_command("input", "on_typed")
+    text_input.value = "python"
+
+    transport.reset_counters()
+    assert text_input.value == "python"
+    assert transport.round_trips == 0
+
+    # user typed, but input event is still in later frame
+    transport.dom.widgets[text_input.id].value = "typed"
+    _shared.application_api.call_python_widget_events([ [ root.id, "on_typed", [], root.id ] ], 1)
+
+    assert text_input.value == "typed"
+
+def test_modal_background_follows_webview(transport):
+    window = Window()
+    background = transport.dom.widgets[window.id].query(lambda element: "hufpy-modal-background" in element.class_list)
+    background_widget = _shared.application_api.widgets[background.id]
+
+    window.show_modal_background()
+    assert background.attributes["data-visible"] == "true"
+    assert background_widget.get_attribute("data-visible") is True
+
+    window.close_modal_background()
+    assert background_widget.get_attribute("data-visible") is False
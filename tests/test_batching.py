@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import time
+from hufpy import _shared
+from hufpy.widgets import Label
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def test_per_frame_transaction_flushes_lazily(transport):
+    root = ColumnLayout(None)
+    label = Label(root)
+    root.append_child(label)
+    api = _shared.application_api
+    api.frame_interval = 0.05
+
+    transport.reset_counters()
+    with api.transaction(per_frame = True):
+        label.text = "first"
+        time.sleep(api.frame_interval)
+        # frame passed, queued calls are sent when next call is queued
+        label.text = "second"
+        assert transport.round_trips == 1
+        assert transport.dom.widgets[label.id].text == "second"
+
+        # no timer: last calls of burst are kept until flush
+        label.text = "third"
+        time.sleep(api.frame_interval)
+        assert transport.dom.widgets[label.id].text == "second"
+
+        api.flush()
+        assert transport.dom.widgets[label.id].text == "third"
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import threading, time
+from hufpy import _shared
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def test_batches_are_applied_in_sequence(transport):
+    # pywebview calls api on new thread per call, batch of later frame can arrive first
+    layout = ColumnLayout(ColumnLayout(None))
+    handled = []
+    layout.on_handled = lambda name: handled.append(name)
+    api = _shared.application_api
+
+    second = threading.Thread(target = api.call_python_widget_events, args = ([ [ layout.id, "on_handled", [ "second" ], layout.id ] ], 2))
+    second.start()
+    time.sleep(0.05)
+    api.call_python_widget_events([ [ layout.id, "on_handled", [ "first" ], layout.id ] ], 1)
+    second.join(timeout = 5)
+
+    assert handled == [ "first", "second" ]
+
+def test_missing_batch_is_skipped_after_timeout(transport):
+    layout = ColumnLayout(ColumnLayout(None))
+    handled = []
+    layout.on_handled = lambda name: handled.append(name)
+    api = _shared.application_api
+    api.event_order_timeout = 0.05
+
+    api.call_python_widget_events([ [ layout.id, "on_handled", [ "first" ], layout.id ] ], 1)
+    api.call_python_widget_events([ [ layout.id, "on_handled", [ "third" ], layout.id ] ], 3)
+
+    assert handled == [ "first", "third" ]
+
+def test_frame_is_sent_as_one_batch(transport):
+    layout = ColumnLayout(ColumnLayout(None))
+    handled = []
+    layout.on_handled = lambda: handled.append(len(handled))
+    layout.bind_command("click", "on_handled")
+    layout.bind_command("input", "on_handled")
+
+    with transport.frame():
+        transport.fire_event(layout.id, "click")
+        transport.fire_event(layout.id, "input")
+        assert handled == []
+
+    assert handled == [ 0, 1 ]
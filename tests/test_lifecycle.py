@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import gc, weakref
+from hufpy import _shared
+from hufpy.widgets import Button, Label
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def _tree(root:ColumnLayout = None):
+    root = ColumnLayout(None) if root is None else root
+    column = ColumnLayout(root)
+    root.append_child(column)
+    column.spacing = 4
+    button = Button(column)
+    column.append_child(button)
+    button.on_clicked = lambda: None
+    return root, column, button
+
+def test_delete_removes_descendants(transport):
+    root, column, button = _tree()
+    column_id, button_id = column.id, button.id
+
+    column.delete()
+
+    assert column not in root.children
+    assert column_id not in transport.dom.widgets and button_id not in transport.dom.widgets
+    assert column_id not in [ child.id for child in transport.dom.widgets[root.id].children ]
+    assert button_id not in transport.dom.events
+    assert f"style_{column_id}" not in transport.dom.head_styles
+    assert _shared.application_api.widgets.get(column_id) is None
+    assert _shared.application_api.widgets.get(button_id) is None
+
+def test_deleted_widget_is_collected(transport):
+    root = ColumnLayout(None)
+    label = Label(root)
+    root.append_child(label)
+    label_id, label_ref = label.id, weakref.ref(label)
+
+    label.delete()
+    del label
+    gc.collect()
+
+    assert label_ref() is None
+    assert label_id not in _shared.application_api.widgets.keys()
+
+def test_create_delete_cycles_do_not_grow_registries(transport):
+    root = ColumnLayout(None)
+    sizes = None
+    for cycle in range(3):
+        for _ in range(50):
+            _, column, _ = _tree(root)
+            column.delete()
+        gc.collect()
+
+        current = ( len(_shared.application_api.widgets), len(transport.dom.widgets), len(transport.dom.events), len(transport.dom.head_styles) )
+        if cycle > 0:
+            assert current == sizes
+        sizes = current
+
+def test_rename_moves_element_bindings_and_styles(transport):
+    root, column, button = _tree()
+    clicks = []
+    button.on_clicked = lambda: clicks.append(True)
+    old_id = column.id
+
+    column.id = "renamed"
+    button.id = "button"
+
+    assert "renamed" in transport.dom.widgets and old_id not in transport.dom.widgets
+    assert "#renamed" in transport.dom.head_styles["style_renamed"]
+    assert f"style_{old_id}" not in transport.dom.head_styles
+    assert _shared.application_api.widgets.get("renamed") is column
+    assert _shared.application_api.widgets.get(old_id) is None
+
+    transport.fire_event("button", "click")
+    assert clicks == [ True ]
+
+    column.delete()
+    assert "style_renamed" not in transport.dom.head_styles
+    assert "button" not in transport.dom.widgets and "button" not in transport.dom.events
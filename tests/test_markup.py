@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from hufpy.widgets.layouts import ColumnLayout
+from hufpy.markup import Template, _replace_id_tokens
+
+
+SOURCE = """
+<ColumnLayout spacing="5">
+    <Label name="title" text="layout $1$ h0000001"/>
+    <RowLayout spacing="3">
+        <Button name="ok" text="OK" on_clicked="on_ok"/>
+    </RowLayout>
+</ColumnLayout>
+"""
+
+class Owner:
+    def __init__(self):
+        self.clicks = 0
+
+    def on_ok(self):
+        self.clicks += 1
+
+
+def test_instances_have_own_ids_and_styles(transport):
+    # parent with custom id, which is also part of class names(huf-column-layout)
+    root = ColumnLayout(None, id = "layout")
+    template = Template.from_string(SOURCE)
+    owners = [ Owner() for _ in range(3) ]
+    views = [ template.instantiate(root, owner) for owner in owners ]
+
+    assert len({ view.id for view in views }) == 3
+    for view, owner in zip(views, owners):
+        element = transport.dom.widgets[view.id]
+        assert "huf-column-layout" in element.class_list
+        assert element.parent is transport.dom.widgets["layout"]
+        assert f"style_{view.id}" in transport.dom.head_styles
+
+        # texts equal to ids or placeholders are not replaced
+        assert transport.dom.widgets[owner.title.id].text == "layout $1$ h0000001"
+
+        row = view.children[1]
+        assert f"#{row.id} >" in transport.dom.head_styles[f"style_{row.id}"]
+
+def test_instance_events_call_own_owner(transport):
+    root = ColumnLayout(None)
+    template = Template.from_string(SOURCE)
+    owners = [ Owner() for _ in range(3) ]
+    for owner in owners:
+        template.instantiate(root, owner)
+
+    transport.fire_event(owners[1].ok.id, "click")
+
+    assert [ owner.clicks for owner in owners ] == [ 0, 1, 0 ]
+
+def test_ids_are_replaced_as_whole_tokens():
+    # ids get longer after 16^7 widgets, shorter id is prefix of longer one
+    text = '["h1000000",["h10000000"],"#h1000000 > *, #h10000000","style_h1000000","style_h10000000"]'
+
+    replaced = _replace_id_tokens(text, { "h1000000": "$0$" })
+
+    assert replaced == '["$0$",["h10000000"],"#$0$ > *, #h10000000","style_$0$","style_h10000000"]'
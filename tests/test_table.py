@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+from hufpy.widgets import Table, VirtualTable
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def _table(source:pd.DataFrame) -> Table:
+    root = ColumnLayout(None)
+    table = Table.from_pandas(root, source)
+    root.append_child(table)
+    return table
+
+def test_update_from_pandas_sends_one_patch(transport):
+    table = _table(pd.DataFrame({ "name": [ "a", "b", "c" ], "value": [ 1, 2, 3 ] }, index = [ 10, 20, 30 ]))
+    source = pd.DataFrame({ "name": [ "a", "d", "c" ], "value": [ 1, 4, 5 ] }, index = [ 10, 40, 30 ])
+
+    transport.reset_counters()
+    table.update_from_pandas(source)
+
+    assert transport.round_trips == 1
+    assert table.row_count == 3
+    pd.testing.assert_frame_equal(table.to_pandas(), source.reset_index(drop = True))
+
+def test_update_from_pandas_reloads_reordered_rows(transport):
+    table = _table(pd.DataFrame({ "value": [ 1, 2, 3 ] }, index = [ 10, 20, 30 ]))
+    source = pd.DataFrame({ "value": [ 3, 1, 2 ] }, index = [ 30, 10, 20 ])
+
+    table.update_from_pandas(source)
+
+    pd.testing.assert_frame_equal(table.to_pandas(), source.reset_index(drop = True))
+
+def test_update_from_pandas_patches_nullable_values(transport):
+    table = _table(pd.DataFrame({ "value": pd.array([ 1, None, 3 ], dtype = "Int64") }))
+
+    transport.reset_counters()
+    table.update_from_pandas(pd.DataFrame({ "value": pd.array([ 1, 2, None ], dtype = "Int64") }))
+
+    assert transport.round_trips == 1
+    assert transport.dom.get_table_cells(table.body.id) == [ [ "1", "2", "" ] ]
+
+def test_update_from_pandas_reloads_changed_categories(transport):
+    table = _table(pd.DataFrame({ "kind": pd.Categorical([ "x", "y" ]) }))
+
+    table.update_from_pandas(pd.DataFrame({ "kind": pd.Categorical([ "x", "z" ]) }))
+
+    assert transport.dom.get_table_cells(table.body.id) == [ [ "x", "z" ] ]
+
+def test_duplicated_column_names(transport):
+    table = _table(pd.DataFrame([ [ 1, 2 ], [ 3, 4 ] ], columns = [ "a", "a" ]))
+
+    table.update_from_pandas(pd.DataFrame([ [ 1, 5 ], [ 3, 4 ] ], columns = [ "a", "a" ]))
+
+    assert table.columns == [ "a", "a" ]
+    assert transport.dom.get_table_cells(table.body.id) == [ [ "1", "3" ], [ "5", "4" ] ]
+
+def test_to_pandas_keeps_source_dtypes(transport):
+    source = pd.DataFrame({
+        "count": pd.array([ 1, None, 3 ], dtype = "Int64"),
+        "flag": pd.array([ True, None, False ], dtype = "boolean"),
+        "kind": pd.Categorical([ "x", "y", "x" ], categories = [ "x", "y", "z" ]),
+        "value": [ 1.5, None, 2.0 ]
+    })
+    table = _table(source)
+
+    pd.testing.assert_frame_equal(table.to_pandas(), source)
+
+def test_missing_values_are_empty_cells(transport):
+    table = _table(pd.DataFrame({ "name": [ "a", None, float("nan") ], "value": [ 1.0, None, 3.0 ] }))
+    assert transport.dom.get_table_cells(table.body.id) == [ [ "a", "", "" ], [ "1", "", "3" ] ]
+
+    table = Table.from_datas(ColumnLayout(None), [ { "name": "a", "value": 1 }, { "name": None }, { "value": 3 } ])
+    assert transport.dom.get_table_cells(table.body.id) == [ [ "a", "", "" ], [ "1", "", "3" ] ]
+
+def test_stream_appends_rows_and_drops_oldest(transport):
+    table = _table(pd.DataFrame({ "name": pd.Series([], dtype = object), "value": pd.Series([], dtype = "int64") }))
+
+    stream = table.stream(( { "name": f"row{idx}", "value": idx } for idx in range(50) ), batch_rows = 7, max_rows = 20)
+
+    assert stream.join(timeout = 10)
+    assert stream.error is None
+    assert stream.row_count == 50
+    assert table.row_count == 20
+
+    name_cells, value_cells = transport.dom.get_table_cells(table.body.id)
+    assert name_cells == [ f"row{idx}" for idx in range(30, 50) ]
+    assert [ int(value) for value in value_cells ] == list(range(30, 50))
+
+def test_virtual_table_scrolls_to_last_row(transport):
+    # 1M rows of 24px exceed max_scroll_height, row positions are compressed
+    root = ColumnLayout(None)
+    source = pd.DataFrame({ "value": range(1000000) })
+    table = VirtualTable.from_pandas(root, source)
+    root.append_child(table)
+    client_height = 480
+
+    transport.fire_event(table.id, "scroll", scrollTop = VirtualTable.max_scroll_height - client_height, clientHeight = client_height)
+
+    start, end = table.rendered_range
+    assert end == len(source.index)
+    rows = transport.dom.widgets[table.id].query(lambda child: child.tag_name == "tbody").children
+    assert rows[-2].children[0].text_content == str(len(source.index) - 1)
+
+    transport.fire_event(table.id, "scroll", scrollTop = 0, clientHeight = client_height)
+
+    assert table.rendered_range[0] == 0
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+import pytest
+from hufpy.transport import Transport
+from hufpy.widgets import Label
+from hufpy.widgets.layouts import ColumnLayout
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+def test_insert_child_places_element_at_index(transport):
+    root = ColumnLayout(None)
+    labels = [ Label(root) for _ in range(3) ]
+    for label in labels[:2]:
+        root.append_child(label)
+
+    root.insert_child(labels[2], 1)
+
+    assert [ child.id for child in transport.dom.widgets[root.id].children ] == [ child.id for child in root.children ]
+    assert root.children == [ labels[0], labels[2], labels[1] ]